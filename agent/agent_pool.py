@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger("talisma_processor")
+
+# Attributes a ResponseGeneratorAgent fills while handling one email
+PER_EMAIL_STATE = ("apis_called", "responses")
+
+# Objects inside a ResponseGeneratorAgent that hold that state; the agent
+# delegates to its ResponseGenerator, which records the API calls
+STATE_HOLDERS = ("response_generator",)
+
+
+def reset_agent(agent):
+    """Clear what the previous email left on a reused agent.
+
+    For the agent and each of its STATE_HOLDERS, calls reset() when there
+    is one; otherwise empties the PER_EMAIL_STATE containers found there
+    and points any tools back at that object's own record_api_call, so API
+    calls made for this email are recorded where they are reported from.
+    Returns False when no per-email state was found, i.e. the agent could
+    not be reset and should not be reused.
+    """
+    holders = [agent]
+    holders.extend(getattr(agent, name) for name in STATE_HOLDERS if getattr(agent, name, None) is not None)
+    found = False
+    for holder in holders:
+        reset = getattr(holder, "reset", None)
+        if callable(reset):
+            reset()
+            found = True
+            continue
+        for name in PER_EMAIL_STATE:
+            state = getattr(holder, name, None)
+            if isinstance(state, (list, dict, set)):
+                state.clear()
+                found = True
+
+        record_api_call = getattr(holder, "record_api_call", None)
+        if callable(record_api_call):
+            for tool in getattr(holder, "tools", None) or ():
+                tool.metadata = {**(tool.metadata or {}), "record_api_call": record_api_call}
+    return found
+
+
+class AgentPool:
+    """Fixed-size pool of pre-built agents, each used by one email at a time.
+
+    Building a ResponseGeneratorAgent creates its LLM client, prompt and
+    the API caller tools; the pool does that once per slot (up front with
+    fill(), or on first use) instead of once per email. borrow() hands out
+    an idle agent reset for the next email and waits when all are in use.
+    An agent whose use raised is dropped and rebuilt on a later borrow,
+    since it may hold state from the failed email, and so is an agent
+    reset_agent() cannot reset. Construction runs in the executor so it
+    does not block the event loop.
+    """
+    def __init__(self, factory, size, executor=None):
+        if size < 1:
+            raise ValueError("Agent pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self.executor = executor
+        self.idle = deque()
+        self.created = 0
+        self.waiters = deque()
+        self.warned_unresettable = False
+        self.stats = {
+            "borrowed": 0,
+            "waits": 0,
+            "built": 0,
+            "discarded": 0
+        }
+
+    async def _build(self, count):
+        agents = await asyncio.get_running_loop().run_in_executor(
+            self.executor, lambda: [self.factory() for _ in range(count)]
+        )
+        self.stats["built"] += count
+        return agents
+
+    async def fill(self):
+        """Build agents for all empty slots."""
+        missing = self.size - self.created
+        if missing <= 0:
+            return
+        self.created += missing
+        try:
+            agents = await self._build(missing)
+        except Exception:
+            self.created -= missing
+            raise
+        for agent in agents:
+            self._release(agent)
+        logger.info(f"SYSTEM | Built {missing} pooled response agents")
+
+    async def _acquire(self):
+        while True:
+            if self.idle:
+                return self.idle.pop()
+            if self.created < self.size:
+                self.created += 1
+                try:
+                    return (await self._build(1))[0]
+                except Exception:
+                    self.created -= 1
+                    self._wake()
+                    raise
+            self.stats["waits"] += 1
+            waiter = asyncio.get_running_loop().create_future()
+            self.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter received but can no longer use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+
+    def _release(self, agent, discard=False):
+        if discard:
+            self.created -= 1
+            self.stats["discarded"] += 1
+        else:
+            self.idle.append(agent)
+        self._wake()
+
+    def _wake(self):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _replace(self, agent):
+        # Agents reset_agent() does not know how to clear are only used once
+        if not self.warned_unresettable:
+            self.warned_unresettable = True
+            logger.warning(f"SYSTEM | {type(agent).__name__} has no per-email state to reset; building a fresh agent per email")
+        # If the build fails, borrow() discards the old agent and frees the slot
+        fresh = (await self._build(1))[0]
+        self.stats["discarded"] += 1
+        return fresh
+
+    @asynccontextmanager
+    async def borrow(self):
+        """Use an agent for one email: `async with pool.borrow() as agent:`."""
+        agent = await self._acquire()
+        self.stats["borrowed"] += 1
+        try:
+            if not reset_agent(agent):
+                agent = await self._replace(agent)
+            yield agent
+        except BaseException:
+            self._release(agent, discard=True)
+            raise
+        else:
+            self._release(agent)
+
+    def get_stats(self):
+        """Pool size, idle and in-use agents, waits and rebuilds."""
+        return {
+            **self.stats,
+            "size": self.size,
+            "created": self.created,
+            "idle": len(self.idle),
+            "in_use": self.created - len(self.idle),
+            "waiting": sum(1 for waiter in self.waiters if not waiter.done())
+        }
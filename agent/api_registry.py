@@ -0,0 +1,59 @@
+# ApiRegistry instances by tool name, for the benchmark
+API_REGISTRIES = {}
+
+# Template values that are copied instead of shared between responses
+_CONTAINERS = (dict, list)
+
+
+def _copy_response(template):
+    """Fresh copy of a response template, so callers can mutate what they get."""
+    if type(template) is dict:
+        return {key: _copy_response(value) if type(value) in _CONTAINERS else value for key, value in template.items()}
+    if type(template) is list:
+        return [_copy_response(value) if type(value) in _CONTAINERS else value for value in template]
+    return template
+
+
+class ApiRegistry:
+    """api_name -> response dispatch for one *_api_caller function.
+
+    An api_name maps either to a static response template (add_templates)
+    or to a handler function of api_args (handler) for responses built
+    from the arguments. Templates are kept as given and each call returns
+    a copy. call() is a single dict lookup instead of an if/elif chain over
+    every known name. unknown is the response for an unrecognised
+    api_name: a template, or a function of the api_name.
+    """
+    def __init__(self, tool_name, unknown=None):
+        self.tool_name = tool_name
+        self.unknown = {} if unknown is None else unknown
+        # api_name -> (handler, template); exactly one of the two is set
+        self.routes = {}
+        API_REGISTRIES[tool_name] = self
+
+    def add_templates(self, templates):
+        for api_name, template in templates.items():
+            self.routes[api_name] = (None, _copy_response(template))
+
+    def handler(self, api_name):
+        def register(fn):
+            self.routes[api_name] = (fn, None)
+            return fn
+        return register
+
+    def names(self):
+        return list(self.routes)
+
+    def call(self, api_name, api_args=None, record_api_call=None):
+        """Response for api_name, passed to record_api_call when given."""
+        if api_args is None:
+            api_args = {}
+        route = self.routes.get(api_name)
+        if route is None:
+            response = self.unknown(api_name) if callable(self.unknown) else _copy_response(self.unknown)
+        else:
+            handler, template = route
+            response = handler(api_args) if handler is not None else _copy_response(template)
+        if callable(record_api_call):
+            record_api_call(api_name, api_args, response)
+        return response
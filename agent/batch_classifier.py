@@ -0,0 +1,188 @@
+import time
+import asyncio
+import logging
+
+from langchain_openai import ChatOpenAI
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
+
+from agent.classifier_agent import classifier_agent, parse_json_string
+from agent.classifier_agent_prompt import get_classifier_agent_prompt
+from storage import serialization
+
+logger = logging.getLogger("talisma_processor")
+
+CATEGORY_FIELDS = ("classification", "is_spam", "escalation_required", "escalation_reason")
+
+# Appended to the classifier's own system prompt; the taxonomy and rules stay the same
+BATCH_INSTRUCTIONS = """You will receive a JSON list of emails instead of a single email. Each item has an "id", "from_email", "user_type", "subject" and "content".
+Classify every email independently, exactly as you would classify it on its own.
+Return a valid JSON object of the form {{"results": [{{"id": "<id of the email>", "classification": ..., "is_spam": ..., "escalation_required": ..., "escalation_reason": ...}}]}} with one result per email, in the order given."""
+
+
+def build_batch_prompt(base_prompt):
+    """Prompt with the classifier's system messages followed by the batch instructions.
+
+    Raises ValueError when the classifier prompt has no system message that
+    can be reused as is (one that needs per-email variables).
+    """
+    system_messages = []
+    for message in base_prompt.messages:
+        if isinstance(message, SystemMessage):
+            system_messages.append(message)
+        elif isinstance(message, SystemMessagePromptTemplate):
+            if message.input_variables:
+                raise ValueError(f"classifier system prompt needs per-email variables: {', '.join(message.input_variables)}")
+            system_messages.append(message)
+    if not system_messages:
+        raise ValueError("classifier prompt has no system message")
+    return ChatPromptTemplate.from_messages(system_messages + [
+        ("system", BATCH_INSTRUCTIONS),
+        ("human", "{emails}")
+    ])
+
+
+def parse_batch_result(text, ids):
+    """Map each id to its category dict; ids with a missing or incomplete result are left out."""
+    data = parse_json_string(text)
+    results = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(results, list):
+        raise ValueError("batch result has no results list")
+    categories = {}
+    for result in results:
+        if not isinstance(result, dict) or str(result.get("id")) not in ids:
+            continue
+        if any(field not in result for field in CATEGORY_FIELDS):
+            continue
+        categories[str(result["id"])] = {
+            "status": "success",
+            "classification": result["classification"],
+            "is_spam": bool(result["is_spam"]),
+            "escalation_required": bool(result["escalation_required"]),
+            "escalation_reason": result["escalation_reason"],
+            "batched": True
+        }
+    return categories
+
+
+class BatchClassifier:
+    """Packs short emails into one classifier call during backlogs.
+
+    classify() has the signature of classifier_agent. Calls made while a
+    batch is collecting wait up to max_wait_seconds for batch_size emails
+    (the concurrent emails of one queue batch arrive together), then the
+    whole batch is sent as one request with the classifier's system prompt,
+    so the prompt overhead is paid once per batch. Emails longer than
+    max_chars, batches of one, and any email whose result is missing or
+    malformed (including a batch response that does not parse) go through
+    classifier_agent on their own. Callers decide when batching is worth
+    the extra wait; main.py only uses it when the queue is deep.
+    """
+    def __init__(self, model="o3-mini", batch_size=8, max_wait_seconds=0.5, max_chars=1500):
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_chars = max_chars
+        self.chain = build_batch_prompt(get_classifier_agent_prompt()) | ChatOpenAI(
+            model=model,
+            reasoning_effort="high",
+            model_kwargs={"response_format": {"type": "json_object"}}
+        ) | StrOutputParser()
+        self.pending = []
+        self.flush_handle = None
+        self.tasks = set()
+        self.stats = {
+            "batches": 0,
+            "batched_emails": 0,
+            "fallback_emails": 0,
+            "failed_batches": 0,
+            "single_emails": 0,
+            "batch_seconds": 0.0
+        }
+
+    async def classify(self, from_email, subject, content, user_type):
+        if len(subject or "") + len(content or "") > self.max_chars:
+            self.stats["single_emails"] += 1
+            return await classifier_agent(from_email, subject, content, user_type)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append(({
+            "from_email": from_email,
+            "user_type": user_type,
+            "subject": subject,
+            "content": content
+        }, future))
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        items, self.pending = self.pending, []
+        if items:
+            # Keep a reference so the task is not garbage collected mid-run
+            task = asyncio.get_running_loop().create_task(self._run(items))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, items):
+        categories = {}
+        if len(items) > 1:
+            ids = {str(i): i for i in range(len(items))}
+            emails = [dict(email, id=id) for id, (email, _) in zip(ids, items)]
+            start = time.time()
+            try:
+                text = await self.chain.ainvoke({"emails": serialization.dumps_str(emails)})
+                categories = parse_batch_result(text, ids)
+                self.stats["batches"] += 1
+                self.stats["batched_emails"] += len(categories)
+            except Exception as e:
+                self.stats["failed_batches"] += 1
+                logger.warning(f"SYSTEM | Batch classification of {len(items)} emails failed, classifying one by one: {e}")
+            self.stats["batch_seconds"] += time.time() - start
+
+        missing = []
+        for id, (email, future) in enumerate(items):
+            if str(id) not in categories:
+                missing.append((email, future))
+            elif not future.done():
+                future.set_result(categories[str(id)])
+        if len(items) > 1:
+            self.stats["fallback_emails"] += len(missing)
+        else:
+            self.stats["single_emails"] += 1
+        singles = await asyncio.gather(*(
+            classifier_agent(email["from_email"], email["subject"], email["content"], email["user_type"])
+            for email, _ in missing
+        ), return_exceptions=True)
+        for (_, future), category in zip(missing, singles):
+            if future.done():
+                continue
+            if isinstance(category, Exception):
+                future.set_exception(category)
+            else:
+                future.set_result(category)
+
+    def get_stats(self):
+        """Batches sent, emails classified per batch and fallbacks to single calls."""
+        stats = dict(self.stats)
+        stats["avg_batch_size"] = round(stats["batched_emails"] / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["batch_seconds"] = round(stats["batch_seconds"], 2)
+        stats["pending"] = len(self.pending)
+        return stats
+
+
+def load_batch_classifier(model, batch_size, max_wait_seconds, max_chars):
+    """Create a BatchClassifier, or None when batching is off or the prompt cannot be batched."""
+    if batch_size < 2:
+        return None
+    try:
+        return BatchClassifier(model, batch_size, max_wait_seconds, max_chars)
+    except Exception as e:
+        logger.error(f"SYSTEM | Batch classification disabled: {e}")
+        return None
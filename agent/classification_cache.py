@@ -0,0 +1,160 @@
+import re
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Parts of otherwise identical templated emails that differ per sender
+EMAIL_ADDRESS = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+NUMBER = re.compile(r"\d+")
+NON_WORD = re.compile(r"[^\w@#]+")
+# Tokens of an email that identify the sender's account (codes, numbers, addresses)
+IDENTIFIER = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+|\b\w*\d\w*\b")
+
+# Stands in for the client id in cached drafts
+CLIENT_ID_PLACEHOLDER = "{{client_id}}"
+
+
+def normalize_text(text):
+    """Lowercase, mask addresses and numbers (codes, dates, amounts) and drop punctuation."""
+    text = EMAIL_ADDRESS.sub("@", (text or "").lower())
+    text = NUMBER.sub("#", text)
+    return " ".join(NON_WORD.sub(" ", text).split())
+
+
+def cache_key(subject, content, user_type):
+    """Hash of the normalized subject and content plus the user type."""
+    normalized = "\0".join((
+        (user_type or "").lower(),
+        normalize_text(subject),
+        normalize_text(content)
+    ))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """TTL + LRU cache of classifier_agent results and generic drafts.
+
+    Entries are keyed on cache_key(), so the hundreds of daily copies of a
+    templated query ("send my contract note") share one LLM result. The
+    category methods take a list of keys: the exact content key and, when
+    the email has near-duplicates in the queue, a key for its cluster.
+    Drafts are only stored under the exact content key, since a reply
+    written for one email does not fit a merely similar one. They are
+    only cached when the response called no APIs and does not
+    repeat any code, number or address from the email: those depend on the
+    text alone. The client id is replaced by a placeholder when stored and
+    filled in for the email the draft is reused for.
+    """
+    def __init__(self, max_entries=10000, ttl_seconds=6 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {
+            "classification_lookups": 0,
+            "classification_hits": 0,
+            "draft_lookups": 0,
+            "draft_hits": 0,
+            "saved_llm_seconds": 0.0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    def _entry(self, key, now):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry["expires_at"] <= now:
+            del self.entries[key]
+            self.stats["expirations"] += 1
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, values, now):
+        entry = self._entry(key, now)
+        if entry is None:
+            entry = {"expires_at": now + self.ttl_seconds}
+            self.entries[key] = entry
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        entry.update(values)
+
+    def get_category(self, keys):
+        """Cached category for the first of keys that has one, or None."""
+        now = time.time()
+        with self.lock:
+            self.stats["classification_lookups"] += 1
+            for key in keys:
+                entry = self._entry(key, now)
+                if entry is not None and "category" in entry:
+                    self.stats["classification_hits"] += 1
+                    self.stats["saved_llm_seconds"] += entry["category_seconds"]
+                    return dict(entry["category"], cached=True)
+            return None
+
+    def put_category(self, keys, category, llm_seconds):
+        """Cache a successful classifier_agent result and the time it took."""
+        if category.get("status") == "error":
+            return
+        now = time.time()
+        with self.lock:
+            for key in keys:
+                self._store(key, {"category": dict(category), "category_seconds": llm_seconds}, now)
+
+    def get_draft(self, key, classification, client_id):
+        """Cached response for the exact content key personalised with client_id, or None.
+
+        A draft is only reused for the classification it was written for,
+        and drafts that mention a client id only when the email has one.
+        """
+        now = time.time()
+        with self.lock:
+            self.stats["draft_lookups"] += 1
+            entry = self._entry(key, now)
+            if entry is None or "response" not in entry or entry["classification"] != classification:
+                return None
+            response = dict(entry["response"])
+            if CLIENT_ID_PLACEHOLDER in response.get("draft", ""):
+                if not client_id:
+                    return None
+                response["draft"] = response["draft"].replace(CLIENT_ID_PLACEHOLDER, client_id)
+            self.stats["draft_hits"] += 1
+            self.stats["saved_llm_seconds"] += entry["response_seconds"]
+            return response
+
+    def put_draft(self, key, classification, response, client_id, email_text, llm_seconds):
+        """Cache a generated response if it is not specific to the sender. Returns True if cached."""
+        if response.get("status") == "error" or response.get("apis_called"):
+            return False
+        draft = response.get("draft")
+        if not isinstance(draft, str):
+            return False
+        if client_id:
+            draft = re.sub(rf"\b{re.escape(client_id)}\b", CLIENT_ID_PLACEHOLDER, draft, flags=re.IGNORECASE)
+        lowered = draft.lower()
+        if any(token.lower() in lowered for token in set(IDENTIFIER.findall(email_text or ""))):
+            return False
+        response = dict(response, draft=draft)
+        now = time.time()
+        with self.lock:
+            self._store(key, {
+                "classification": classification,
+                "response": response,
+                "response_seconds": llm_seconds
+            }, now)
+        return True
+
+    def get_stats(self):
+        """Hit rates, saved LLM seconds, evictions and size."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self.entries)
+        stats["classification_hit_rate"] = round(
+            stats["classification_hits"] / stats["classification_lookups"], 4
+        ) if stats["classification_lookups"] else 0.0
+        stats["draft_hit_rate"] = round(stats["draft_hits"] / stats["draft_lookups"], 4) if stats["draft_lookups"] else 0.0
+        stats["saved_llm_seconds"] = round(stats["saved_llm_seconds"], 2)
+        return stats
@@ -0,0 +1,100 @@
+import copy
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class ClosureValidationCache:
+    """TTL + LRU cache of closure validation results by client code, with single-flight lookups.
+
+    The agent often validates the same client more than once while
+    answering one email, and closure request waves repeat clients across
+    emails. get_or_fetch() answers from the cache while an entry is fresh;
+    concurrent lookups of a client that is being fetched wait for that
+    fetch instead of starting their own. Only results the API actually
+    answered are cached, so a failed token or request is retried on the
+    next lookup. Callers get their own copy of the cached result.
+    """
+    def __init__(self, ttl_seconds=300, max_entries=5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.stats = {
+            "lookups": 0,
+            "hits": 0,
+            "coalesced": 0,
+            "fetches": 0,
+            "uncached": 0,
+            "expirations": 0,
+            "evictions": 0
+        }
+
+    def _entry(self, client_code, now):
+        entry = self.entries.get(client_code)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self.entries[client_code]
+            self.stats["expirations"] += 1
+            return None
+        self.entries.move_to_end(client_code)
+        return entry
+
+    def get_or_fetch(self, client_code, fetch):
+        """Result for client_code; fetch() returns (result, cacheable) and runs at most once at a time per client."""
+        with self.lock:
+            self.stats["lookups"] += 1
+            entry = self._entry(client_code, time.time())
+            if entry is not None:
+                self.stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+            future = self.inflight.get(client_code)
+            owner = future is None
+            if owner:
+                future = self.inflight[client_code] = Future()
+                self.stats["fetches"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            result, cacheable = fetch()
+        except BaseException as e:
+            with self.lock:
+                del self.inflight[client_code]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            del self.inflight[client_code]
+            if cacheable and self.ttl_seconds > 0:
+                self.entries[client_code] = (time.time() + self.ttl_seconds, copy.deepcopy(result))
+                self.entries.move_to_end(client_code)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+            else:
+                self.stats["uncached"] += 1
+        future.set_result(result)
+        return result
+
+    def invalidate(self, client_code=None):
+        """Drop one client's cached result, or all of them."""
+        with self.lock:
+            if client_code is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(client_code, None)
+
+    def get_stats(self):
+        """Lookups, cache hits, coalesced lookups, API fetches and size."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self.entries)
+            stats["inflight"] = len(self.inflight)
+        stats["hit_rate"] = round(stats["hits"] / stats["lookups"], 4) if stats["lookups"] else 0.0
+        return stats
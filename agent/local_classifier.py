@@ -0,0 +1,355 @@
+import io
+import os
+import re
+import time
+import zlib
+import random
+import logging
+import argparse
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from queueing.record import content_with_context
+
+logger = logging.getLogger("talisma_processor")
+
+# Pseudo-labels for outputs the LLM flagged as spam or for escalation.
+# Spam is predicted like any other class; escalations always fall through
+# to classifier_agent, which writes the escalation reason.
+SPAM_LABEL = "__spam__"
+ESCALATE_LABEL = "__escalate__"
+
+# Only outputs whose category came from classifier_agent are used for
+# training, so the model never learns from its own (or the rules') output
+TRAINABLE_SOURCES = (None, "classifier_agent")
+TRAINABLE_USER_TYPES = ("client", "ba")
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashedFeaturizer:
+    """Turns an email into a sparse, L2-normalized vector of hashed n-grams.
+
+    Subject and content words (unigrams and bigrams, subject words
+    prefixed so they weigh separately) and the user type are hashed with
+    CRC32 into n_features buckets; counts are log-scaled. No vocabulary
+    is stored, so the model file is just the weight matrix.
+    """
+    def __init__(self, n_features=2 ** 16, max_chars=3000):
+        self.n_features = int(n_features)
+        self.max_chars = int(max_chars)
+
+    def _tokens(self, subject, content, user_type):
+        yield f"u:{(user_type or '').lower()}"
+        for prefix, text in (("s:", subject or ""), ("", (content or "")[:self.max_chars])):
+            words = TOKEN.findall(text.lower())
+            for i, word in enumerate(words):
+                yield prefix + word
+                if i:
+                    yield f"{prefix}{words[i - 1]} {word}"
+
+    def transform(self, subject, content, user_type):
+        """Return (indices, values) of the email's non-zero features."""
+        counts = {}
+        n_features = self.n_features
+        for token in self._tokens(subject, content, user_type):
+            index = zlib.crc32(token.encode("utf-8")) % n_features
+            counts[index] = counts.get(index, 0) + 1
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        values /= np.sqrt(np.dot(values, values))
+        return indices, values
+
+    def transform_batch(self, examples):
+        """Featurize (subject, content, user_type) tuples into concatenated arrays plus row offsets."""
+        rows = [self.transform(*example) for example in examples]
+        offsets = np.zeros(len(rows), dtype=np.int64)
+        if rows:
+            offsets[1:] = np.cumsum([len(indices) for indices, _ in rows])[:-1]
+        return (
+            np.concatenate([indices for indices, _ in rows]),
+            np.concatenate([values for _, values in rows]).astype(np.float32),
+            offsets
+        )
+
+
+class LocalClassifier:
+    """Linear (softmax) model over hashed n-grams, trained from processed outputs.
+
+    classify() returns a category dict shaped like the classifier_agent
+    result when the top class is confident enough (and is not an
+    escalation), and None otherwise so the email falls through to the LLM.
+    """
+    def __init__(self, weights, bias, labels, featurizer, threshold=0.9):
+        self.weights = weights
+        self.bias = bias
+        self.labels = list(labels)
+        self.featurizer = featurizer
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.evaluated = 0
+        self.confident = 0
+        self.total_seconds = 0.0
+        self.hits = {}
+
+    def predict(self, subject, content, user_type):
+        """Return (label, confidence) of the most likely class."""
+        indices, values = self.featurizer.transform(subject, content, user_type)
+        scores = values @ self.weights[indices] + self.bias
+        scores = np.exp(scores - scores.max())
+        best = int(scores.argmax())
+        return self.labels[best], float(scores[best] / scores.sum())
+
+    def classify(self, subject, content, user_type):
+        """Category dict for a confident prediction, or None."""
+        start = time.perf_counter()
+        label, confidence = self.predict(subject, content, user_type)
+        elapsed = time.perf_counter() - start
+        confident = confidence >= self.threshold and label != ESCALATE_LABEL
+        with self.lock:
+            self.evaluated += 1
+            self.total_seconds += elapsed
+            if confident:
+                self.confident += 1
+                self.hits[label] = self.hits.get(label, 0) + 1
+        if not confident:
+            return None
+        is_spam = label == SPAM_LABEL
+        return {
+            "status": "success",
+            "classification": "na" if is_spam else label,
+            "is_spam": is_spam,
+            "escalation_required": False,
+            "escalation_reason": "na",
+            "model": "local",
+            "confidence": round(confidence, 4)
+        }
+
+    def get_stats(self):
+        """Predictions made, share confident enough to skip the LLM, latency and hits per class."""
+        with self.lock:
+            return {
+                "threshold": self.threshold,
+                "evaluated": self.evaluated,
+                "confident": self.confident,
+                "confident_rate": round(self.confident / self.evaluated, 4) if self.evaluated else 0.0,
+                "avg_predict_us": round(self.total_seconds / self.evaluated * 1e6, 1) if self.evaluated else 0.0,
+                "hits": dict(self.hits)
+            }
+
+    def save(self, path):
+        """Write the model atomically as a .npz file."""
+        from storage.persistence import atomic_write
+
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            weights=self.weights,
+            bias=self.bias,
+            labels=np.array(self.labels),
+            n_features=self.featurizer.n_features,
+            max_chars=self.featurizer.max_chars
+        )
+        atomic_write(path, buffer.getvalue())
+
+    @classmethod
+    def load(cls, path, threshold=0.9):
+        with np.load(path, allow_pickle=False) as data:
+            featurizer = HashedFeaturizer(int(data["n_features"]), int(data["max_chars"]))
+            return cls(data["weights"], data["bias"], [str(label) for label in data["labels"]], featurizer, threshold)
+
+
+def load_local_classifier(path, threshold=0.9):
+    """Load the trained model, or return None when numpy or the model file is missing."""
+    if np is None:
+        logger.info("SYSTEM | numpy is not installed, local classifier disabled")
+        return None
+    if not path or not os.path.exists(path):
+        logger.info(f"SYSTEM | No local classifier model at {path}, local classifier disabled")
+        return None
+    try:
+        model = LocalClassifier.load(path, threshold)
+    except Exception as e:
+        logger.error(f"SYSTEM | Could not load local classifier from {path}: {e}")
+        return None
+    logger.info(f"SYSTEM | Loaded local classifier with {len(model.labels)} classes (threshold {threshold})")
+    return model
+
+
+def label_of(output):
+    """Training label of a stored output, or None if it should not be trained on."""
+    if output.get("classified_by") not in TRAINABLE_SOURCES:
+        return None
+    body = output.get("body", {})
+    if body.get("user_type") not in TRAINABLE_USER_TYPES:
+        return None
+    if body.get("is_spam"):
+        return SPAM_LABEL
+    if (body.get("escalation") or {}).get("escalation_required"):
+        return ESCALATE_LABEL
+    classification = body.get("classification")
+    if not classification or classification == "na":
+        return None
+    return classification
+
+
+def is_holdout(output, holdout_percent):
+    """Stable train/holdout split on the interaction id."""
+    return zlib.crc32(str(output.get("interaction_id")).encode("utf-8")) % 100 < holdout_percent
+
+
+def iter_examples(store, holdout_percent, holdout):
+    """Yield ((subject, content, user_type), label) from the store for one side of the split."""
+    for output in store.iter_records():
+        label = label_of(output)
+        if label is None or is_holdout(output, holdout_percent) != holdout:
+            continue
+        body = output["body"]
+        # Same text the classifier sees at runtime: the content plus the thread's earlier messages
+        content = content_with_context(body.get("body", ""), (output.get("thread") or {}).get("context"))
+        yield (body.get("subject", ""), content, body.get("user_type", "")), label
+
+
+def _shuffled(examples, buffer_size, rng):
+    """Approximate shuffle of a stream with a fixed-size buffer."""
+    buffer = []
+    for example in examples:
+        buffer.append(example)
+        if len(buffer) >= buffer_size:
+            rng.shuffle(buffer)
+            yield from buffer[buffer_size // 2:]
+            del buffer[buffer_size // 2:]
+    rng.shuffle(buffer)
+    yield from buffer
+
+
+def _batches(examples, batch_size):
+    batch = []
+    for example in examples:
+        batch.append(example)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def train(store, n_features=2 ** 16, epochs=5, learning_rate=0.2, l2=1e-6, batch_size=256,
+          min_examples=20, holdout_percent=10, seed=13):
+    """Train a LocalClassifier on the outputs in store (streamed, so memory stays flat).
+
+    Classes with fewer than min_examples training examples are left out;
+    emails of those classes will simply not reach the confidence threshold.
+    """
+    counts = {}
+    for _, label in iter_examples(store, holdout_percent, holdout=False):
+        counts[label] = counts.get(label, 0) + 1
+    labels = sorted(label for label, count in counts.items() if count >= min_examples)
+    if len(labels) < 2:
+        raise ValueError(f"Need at least two classes with {min_examples}+ examples, found {counts}")
+    label_ids = {label: i for i, label in enumerate(labels)}
+
+    featurizer = HashedFeaturizer(n_features)
+    weights = np.zeros((featurizer.n_features, len(labels)), dtype=np.float32)
+    bias = np.zeros(len(labels), dtype=np.float32)
+    # AdaGrad accumulators: rare n-grams keep a large step size, common ones settle
+    weight_history = np.full_like(weights, 1e-8)
+    bias_history = np.full_like(bias, 1e-8)
+    rng = random.Random(seed)
+
+    for epoch in range(epochs):
+        seen = 0
+        loss = 0.0
+        stream = ((example, label_ids[label]) for example, label in iter_examples(store, holdout_percent, holdout=False)
+                  if label in label_ids)
+        for batch in _batches(_shuffled(stream, 20000, rng), batch_size):
+            indices, values, offsets = featurizer.transform_batch([example for example, _ in batch])
+            targets = np.array([label_id for _, label_id in batch])
+            rows = np.repeat(np.arange(len(batch)), np.diff(np.append(offsets, len(indices))))
+
+            scores = np.add.reduceat(weights[indices] * values[:, None], offsets, axis=0) + bias
+            scores -= scores.max(axis=1, keepdims=True)
+            probabilities = np.exp(scores)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            loss -= float(np.log(probabilities[np.arange(len(batch)), targets] + 1e-12).sum())
+
+            gradient = probabilities
+            gradient[np.arange(len(batch)), targets] -= 1.0
+            gradient /= len(batch)
+
+            # Sum the per-feature updates before touching the weight rows
+            order = np.argsort(indices, kind="stable")
+            unique, starts = np.unique(indices[order], return_index=True)
+            updates = np.add.reduceat(values[order, None] * gradient[rows[order]], starts, axis=0)
+            updates += l2 * weights[unique]
+            weight_history[unique] += updates ** 2
+            weights[unique] -= learning_rate * updates / np.sqrt(weight_history[unique])
+            bias_update = gradient.sum(axis=0)
+            bias_history += bias_update ** 2
+            bias -= learning_rate * bias_update / np.sqrt(bias_history)
+            seen += len(batch)
+        logger.info(f"SYSTEM | Local classifier epoch {epoch + 1}/{epochs}: {seen} examples, loss {loss / max(seen, 1):.4f}")
+
+    return LocalClassifier(weights, bias, labels, featurizer)
+
+
+def evaluate(model, examples, thresholds=(0.5, 0.7, 0.8, 0.9, 0.95, 0.98)):
+    """Coverage and accuracy of the LLM-skipping predictions at each threshold."""
+    predictions = []
+    for (subject, content, user_type), label in examples:
+        predicted, confidence = model.predict(subject, content, user_type)
+        predictions.append((predicted, confidence, label))
+    report = []
+    for threshold in thresholds:
+        covered = [(predicted, label) for predicted, confidence, label in predictions
+                   if confidence >= threshold and predicted != ESCALATE_LABEL]
+        correct = sum(1 for predicted, label in covered if predicted == label)
+        report.append({
+            "threshold": threshold,
+            "coverage": len(covered) / len(predictions) if predictions else 0.0,
+            "accuracy": correct / len(covered) if covered else 0.0
+        })
+    return len(predictions), report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the local first-pass classifier from stored outputs")
+    parser.add_argument("--db", default=os.getenv("OUTPUT_DB", "processed_output.db"))
+    parser.add_argument("--dict", default=os.getenv("COMPRESSION_DICT_FILE", "compression.dict"))
+    parser.add_argument("--out", default=os.getenv("LOCAL_CLASSIFIER_MODEL", "local_classifier.npz"))
+    parser.add_argument("--features", type=int, default=2 ** 16)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--learning-rate", type=float, default=0.2)
+    parser.add_argument("--min-examples", type=int, default=20)
+    parser.add_argument("--holdout-percent", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(levelname)s] - %(message)s')
+    if np is None:
+        parser.error("numpy is required to train the local classifier")
+
+    from storage.compression import load_codec
+    from storage.output_store import OutputStore
+
+    store = OutputStore(args.db, codec=load_codec(args.dict))
+    model = train(
+        store,
+        n_features=args.features,
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        min_examples=args.min_examples,
+        holdout_percent=args.holdout_percent
+    )
+    model.save(args.out)
+    print(f"Saved {len(model.labels)}-class model to {args.out}")
+
+    evaluated, report = evaluate(model, iter_examples(store, args.holdout_percent, holdout=True))
+    print(f"Holdout: {evaluated} examples")
+    print(f"{'threshold':>10}{'coverage':>10}{'accuracy':>10}")
+    for row in report:
+        print(f"{row['threshold']:>10.2f}{row['coverage']:>10.1%}{row['accuracy']:>10.1%}")
+    store.close()
@@ -0,0 +1,191 @@
+import os
+import re
+import logging
+import threading
+
+from storage import serialization
+
+logger = logging.getLogger("talisma_processor")
+
+# Only the start of the content is scanned; auto-replies and bounces say
+# what they are in the first lines, and long threads would slow every rule
+MAX_CONTENT_CHARS = 4000
+
+FIELDS = ("subject", "sender", "content")
+
+# Rules are checked in order and the first match wins. Each condition
+# looks at one field with either a regex "pattern" or a list of
+# "keywords" (whole words/phrases, case-insensitive); "match" decides
+# whether any or all conditions must hold.
+DEFAULT_RULES = [
+    {
+        "name": "delivery_failure",
+        "match": "any",
+        "conditions": [
+            {"field": "sender", "pattern": r"^(mailer-daemon|postmaster|mail-?delivery-?subsystem)@"},
+            {"field": "subject", "pattern": r"^\s*(undeliverable|undelivered mail|delivery status notification|mail delivery (failed|failure)|returned mail|delivery has failed)\b"}
+        ],
+        "category": {
+            "classification": "na",
+            "is_spam": False,
+            "escalation_required": False,
+            "escalation_reason": "Delivery failure notification"
+        }
+    },
+    {
+        "name": "auto_reply",
+        "match": "any",
+        "conditions": [
+            {"field": "subject", "pattern": r"^\s*(auto(matic)?[ -]?(reply|response)|out of (the )?office|ooo\b|away from (the )?office)"},
+            # Only wording an auto-responder uses; a client may well write that they
+            # are out of the office, and out-of-office replies are caught by subject
+            {"field": "content", "keywords": [
+                "this is an auto-generated reply",
+                "this is an automated response",
+                "this is an automatic reply"
+            ]}
+        ],
+        "category": {
+            "classification": "na",
+            "is_spam": False,
+            "escalation_required": False,
+            "escalation_reason": "Auto-reply or out-of-office notice"
+        }
+    },
+    {
+        "name": "newsletter",
+        "match": "all",
+        "conditions": [
+            {"field": "sender", "pattern": r"^[^@]*(no-?reply|donotreply|newsletter|news|marketing)[^@]*@"},
+            {"field": "content", "keywords": ["unsubscribe"]}
+        ],
+        "category": {
+            "classification": "na",
+            "is_spam": False,
+            "escalation_required": False,
+            "escalation_reason": "Newsletter or bulk mail"
+        }
+    },
+    {
+        "name": "prize_spam",
+        "match": "any",
+        "conditions": [
+            {"field": "subject", "keywords": ["you have won", "lottery winner", "claim your prize"]},
+            {"field": "content", "keywords": ["you have won a lottery", "claim your prize money", "transfer the processing fee"]}
+        ],
+        "category": {
+            "classification": "na",
+            "is_spam": True,
+            "escalation_required": False,
+            "escalation_reason": "na"
+        }
+    }
+]
+
+
+class Rule:
+    """One precompiled rule of the classifier."""
+    def __init__(self, name, conditions, category, match="any"):
+        if match not in ("any", "all"):
+            raise ValueError(f"Rule {name}: match must be 'any' or 'all', not {match!r}")
+        if not conditions:
+            raise ValueError(f"Rule {name}: at least one condition is required")
+        self.name = name
+        self.match_all = match == "all"
+        self.conditions = [self._compile(condition) for condition in conditions]
+        self.category = {
+            "status": "success",
+            "classification": category.get("classification", "na"),
+            "is_spam": bool(category.get("is_spam", False)),
+            "escalation_required": bool(category.get("escalation_required", False)),
+            "escalation_reason": category.get("escalation_reason", "na"),
+            "rule": name
+        }
+        self.hits = 0
+
+    def _compile(self, condition):
+        field = condition.get("field")
+        if field not in FIELDS:
+            raise ValueError(f"Rule {self.name}: unknown field {field!r}, expected one of {', '.join(FIELDS)}")
+        if "pattern" in condition:
+            regex = condition["pattern"]
+        elif condition.get("keywords"):
+            regex = r"\b(?:" + "|".join(re.escape(keyword) for keyword in condition["keywords"]) + r")\b"
+        else:
+            raise ValueError(f"Rule {self.name}: a condition needs a pattern or keywords")
+        return field, re.compile(regex, re.IGNORECASE)
+
+    def matches(self, fields):
+        results = (regex.search(fields[field]) is not None for field, regex in self.conditions)
+        return all(results) if self.match_all else any(results)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data.get("conditions", []), data.get("category", {}), data.get("match", "any"))
+
+
+class RuleClassifier:
+    """Fast-path pre-classifier that runs before classifier_agent.
+
+    Recognises auto-replies, bounces, newsletters and obvious spam with
+    ordered, precompiled rules over subject, sender and content. When a
+    rule matches, classify() returns a category dict shaped like the
+    classifier_agent result (plus the rule name) and the LLM call can be
+    skipped; otherwise it returns None. Hit counts are kept per rule.
+    """
+    def __init__(self, rules):
+        self.rules = [rule if isinstance(rule, Rule) else Rule.from_dict(rule) for rule in rules]
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names must be unique")
+        self.lock = threading.Lock()
+        self.evaluated = 0
+
+    def classify(self, sender, subject, content):
+        """Return the category of the first matching rule, or None."""
+        fields = {
+            "sender": (sender or "").strip().lower(),
+            "subject": subject or "",
+            "content": (content or "")[:MAX_CONTENT_CHARS]
+        }
+        matched = None
+        for rule in self.rules:
+            if rule.matches(fields):
+                matched = rule
+                break
+        with self.lock:
+            self.evaluated += 1
+            if matched is not None:
+                matched.hits += 1
+        return dict(matched.category) if matched is not None else None
+
+    def get_stats(self):
+        """Evaluation count and hit counts/rates overall and per rule."""
+        with self.lock:
+            evaluated = self.evaluated
+            hits = {rule.name: rule.hits for rule in self.rules}
+        total_hits = sum(hits.values())
+        return {
+            "evaluated": evaluated,
+            "matched": total_hits,
+            "hit_rate": round(total_hits / evaluated, 4) if evaluated else 0.0,
+            "rules": [
+                {"name": name, "hits": count, "hit_rate": round(count / evaluated, 4) if evaluated else 0.0}
+                for name, count in hits.items()
+            ]
+        }
+
+
+def load_rule_classifier(rules_file=None):
+    """Create a RuleClassifier from a JSON list of rules, or the built-in rules.
+
+    Falls back to DEFAULT_RULES when the file does not exist or is invalid.
+    """
+    if rules_file and os.path.exists(rules_file):
+        try:
+            classifier = RuleClassifier(serialization.load_file(rules_file))
+            logger.info(f"SYSTEM | Loaded {len(classifier.rules)} classifier rules from {rules_file}")
+            return classifier
+        except Exception as e:
+            logger.error(f"SYSTEM | Invalid classifier rules in {rules_file}, using built-in rules: {e}")
+    return RuleClassifier(DEFAULT_RULES)
@@ -0,0 +1,399 @@
+import argparse
+
+from storage import serialization
+
+# Argument types are "str" unless given; a trailing "?" marks an optional argument
+
+
+class Api:
+    """One api_name a tool accepts, with its api_args and a one-line purpose."""
+    __slots__ = ("name", "purpose", "args")
+
+    def __init__(self, name, purpose, **args):
+        self.name = name
+        self.purpose = purpose
+        self.args = args
+
+    def signature(self):
+        """Compact argument list, e.g. "client_code, quantity:int?"."""
+        parts = []
+        for arg, kind in self.args.items():
+            optional = kind.endswith("?")
+            kind = kind.rstrip("?")
+            parts.append(f"{arg}{'' if kind == 'str' else ':' + kind}{'?' if optional else ''}")
+        return ", ".join(parts)
+
+
+class ToolSpec:
+    """The API catalogue of one tool in agent/classtool.py.
+
+    The function docstring (docstring()), the description the model sees
+    (description()) and a JSON schema of the arguments (json_schema()) are
+    all generated from it, so each API is declared once. Tools that take
+    their own arguments instead of api_name/api_args list them in args.
+    """
+    def __init__(self, summary, apis=(), args=None):
+        self.summary = summary
+        self.apis = list(apis)
+        self.args = args or {}
+
+    def api_names(self):
+        return [api.name for api in self.apis]
+
+    def description(self):
+        """Model-facing description: the summary and one line per API."""
+        if not self.apis:
+            return self.summary
+        lines = [f"{self.summary} Call with api_name and api_args (arguments in brackets, ? = optional):"]
+        lines.extend(f"- {api.name}({api.signature()}): {api.purpose}" for api in self.apis)
+        return "\n".join(lines)
+
+    def docstring(self):
+        """Reference documentation for the tool function."""
+        lines = [self.summary, ""]
+        if not self.apis:
+            lines.append("Args:")
+            lines.extend(f"    {arg} ({kind.rstrip('?')}{', optional' if kind.endswith('?') else ''})" for arg, kind in self.args.items())
+            lines.append("    record_api_call: Called with (api_name, api_args, response) after the call.")
+            return "\n".join(lines)
+        lines.extend([
+            "Args:",
+            "    api_name: One of the APIs below.",
+            "    api_args: Arguments of that API.",
+            "    record_api_call: Called with (api_name, api_args, response) after the call.",
+            "",
+            "Returns:",
+            "    dict: The API response.",
+            "",
+            "APIs:"
+        ])
+        for api in self.apis:
+            lines.append(f"    {api.name}")
+            lines.append(f"        {api.purpose}")
+            if api.args:
+                lines.append(f"        api_args: {api.signature()}")
+        return "\n".join(lines)
+
+    def json_schema(self):
+        """JSON schema of the tool arguments, with api_name limited to the known APIs."""
+        if not self.apis:
+            return {
+                "type": "object",
+                "properties": {arg: {"type": _json_type(kind)} for arg, kind in self.args.items()},
+                "required": [arg for arg, kind in self.args.items() if not kind.endswith("?")]
+            }
+        return {
+            "type": "object",
+            "properties": {
+                "api_name": {"type": "string", "enum": self.api_names()},
+                "api_args": {"type": "object", "description": "Arguments of the chosen API"}
+            },
+            "required": ["api_name"]
+        }
+
+
+def _json_type(kind):
+    return {"int": "integer", "bool": "boolean", "float": "number", "list": "array", "dict": "object"}.get(kind.rstrip("?"), "string")
+
+
+CATALOG = {
+    "account_opening_api_caller": ToolSpec(
+        "Account opening and KYC status: Saathi leads, PAN, IPV, objections, KRA, IAA/TBA status, dormant accounts, couriers and forms.",
+        [
+            Api("lead_not_found_in_saathi", "Whether a lead exists in Saathi for the client code.", client_code="str"),
+            Api("why_pan_already_exists", "Whether the PAN is already present in the system.", pan_number="str"),
+            Api("provide_zoom_link_non_individual", "Zoom link details for non-individual account verification."),
+            Api("checklist_for_individual", "Where to find the checklist for opening an individual account."),
+            Api("checklist_for_non_individual", "Where to find the checklist for opening a non-individual account."),
+            Api("why_acop_form_rejected", "Why a physical ACOP form was rejected.", client_code="str"),
+            Api("kyc_non_compliance_clarification", "Reasons for a KYC non-compliance objection.", client_code="str"),
+            Api("ipv_not_found", "Whether an IPV code or name is present.", ipv_code="str", ipv_name="str"),
+            Api("email_mobile_validation_link", "Whether an email/mobile validation link was sent.", client_code="str", email="str", mobile="str"),
+            Api("segment_activation_status", "Segment activation status of the client.", client_code="str"),
+            Api("where_to_check_sample_form", "Where to find sample forms."),
+            Api("code_blocked_iaa", "Why a code is blocked as IAA although KRA is validated.", client_code="str"),
+            Api("nri_dormant_activation", "Documents and steps to reactivate a dormant NRI account.", client_code="str", location="str"),
+            Api("dormant_status_online", "Status of a dormant reactivation request placed online.", client_code="str"),
+            Api("dormant_status_offline", "Status of a dormant reactivation request placed offline.", sr_number="str"),
+            Api("check_objection_new_account", "Objection raised on a new account application.", client_code="str"),
+            Api("check_objection_modification", "Objection raised on a modification request.", client_code="str"),
+            Api("clear_objection_new_account", "Whether the objection on a new account was cleared.", client_code="str"),
+            Api("clear_objection_modification", "Whether the objection on a modification was cleared.", client_code="str"),
+            Api("clear_objection_closure", "Whether the objection on a closure request was cleared.", client_code="str"),
+            Api("what_is_my_objection", "The objection recorded against the client code.", client_code="str"),
+            Api("why_objection_raised", "Why an objection was raised.", client_code="str"),
+            Api("cvl_kra_valid_but_iaa", "Why the account is IAA although CVL KRA is valid.", client_code="str"),
+            Api("why_dp_freeze", "Why the DP account is frozen.", client_code="str"),
+            Api("why_ac_suspended_iaa", "Why the account is suspended for IAA/KYC non-compliance.", client_code="str"),
+            Api("kra_validated_but_cannot_trade", "Why the client cannot trade although KRA is validated.", client_code="str"),
+            Api("kra_validation_failure", "Status and next steps for a failed KRA validation.", pan_number="str", mobile="str", email="str"),
+            Api("invalid_pan", "Whether the PAN is invalid or mismatched.", pan_number="str"),
+            Api("segment_status_check", "Detailed activation status of each segment.", client_code="str"),
+            Api("why_new_ac_tba", "Why a new account is TBA (to be activated).", client_code="str"),
+            Api("why_account_status_iaa", "Why the account is IAA while the DP is not frozen.", client_code="str"),
+            Api("when_will_activate", "Expected time until the account is activated.", client_code="str"),
+            Api("why_dp_activation_pending", "Why DP activation is pending.", client_code="str"),
+            Api("why_validation_error", "Cause of a validation error the user sees.", client_code="str"),
+            Api("dispatch_details_not_showing", "Why courier dispatch details are not visible in CBOS 2.0.", client_code="str"),
+            Api("courier_received_confirmation", "Whether a courier was received at HO.", packet_number="str"),
+            Api("courier_dispatched_not_ack", "Whether a dispatched courier is still awaiting acknowledgement.", packet_number="str"),
+            Api("code_not_reflecting_in_dispatch", "Why a code does not show in courier dispatch records.", client_code="str"),
+            Api("why_ekyc_ac_tba", "Why an eKYC account is still TBA.", client_code="str"),
+            Api("single_holder_rejected_to_ekyc", "Why a single-holder physical application must go through eKYC.", client_code="str"),
+            Api("not_able_to_request_kyc_form", "How to get a KYC form that cannot be requested.", form_type="str"),
+            Api("i_want_my_acop_form", "Where to get the client's ACOP form.", client_code="str"),
+            Api("where_check_kyc_scan", "Where to view the client's KYC scan.", client_code="str")
+        ]
+    ),
+    "banking_api_caller": ToolSpec(
+        "Banking: payouts, fund transfers, UTRs, CMS/ECMS/Razorpay collections, third-party transactions and BA brokerage payouts.",
+        [
+            Api("check_payout_status_yesterday", "Why a payout requested yesterday was not received.", client_code="str", payout_date="str"),
+            Api("get_utr_ref_details", "UTR / reference number of a transfer.", client_code="str", date="str"),
+            Api("check_fund_transfer_status", "Status of a fund transfer.", client_code="str", transfer_id="str"),
+            Api("get_payout_rejection_reason", "Why a payout was rejected.", client_code="str", payout_date="str"),
+            Api("check_cms_fund_transfer_status", "Status of a CMS fund transfer.", client_code="str", date="str"),
+            Api("check_razorpay_collection_status", "Status of a Razorpay collection.", client_code="str", date="str"),
+            Api("fetch_third_party_transaction_details", "Details of a third-party transaction.", client_code="str", transaction_id="str"),
+            Api("check_ecms_fund_transfer_status", "Status of an ECMS fund transfer.", client_code="str", date="str"),
+            Api("ba_brokerage_payout_rejected_reason", "Why a BA brokerage payout was rejected.", ba_code="str"),
+            Api("ba_partial_brokerage_payout", "Why only part of a BA brokerage payout was released.", ba_code="str", partial_amount="float?", blocked_amount="float?"),
+            Api("ba_sufficient_ledger_but_payout_rejected", "Why a payout was rejected despite sufficient ledger balance.", ba_code="str")
+        ]
+    ),
+    "bo_franchise_signoff_api_caller": ToolSpec(
+        "BA/franchise sign-off: registration status, NISM certificates, CTCL IDs and BA mobile, email and address changes.",
+        [
+            Api("getFranchiseeRegistrationStatus", "Status of the franchisee (BA) registration.", ba_code="str"),
+            Api("verifyNISMCertificateUpload", "Whether an NISM certificate was uploaded.", certificate_number="str", ba_code="str"),
+            Api("checkNISMCertificateValidity", "Validity (expiry) of an NISM certificate.", certificate_number="str", ba_code="str"),
+            Api("verifyCTCLIDActivation", "Whether a CTCL ID is activated.", ctcl_id="str", ba_code="str"),
+            Api("verifyCTCLIDDeactivation", "Whether a CTCL ID is deactivated.", ctcl_id="str", ba_code="str"),
+            Api("initiateMobileNumberChange", "Start a BA mobile number change across exchanges.", ba_code="str", new_mobile_number="str"),
+            Api("getMobileNumberChangeDocuments", "Documents required to change the BA mobile number.", ba_code="str"),
+            Api("checkMobileNumberUpdateStatus", "Whether the BA mobile number is updated in CBOS and the exchange.", ba_code="str"),
+            Api("initiateEmailChange", "Start a BA email ID change across exchanges.", ba_code="str", new_email="str"),
+            Api("getEmailChangeDocuments", "Documents required to change the BA email ID.", ba_code="str"),
+            Api("checkEmailUpdateStatus", "Whether the BA email ID is updated in CBOS and the exchange.", ba_code="str"),
+            Api("initiateAddressChange", "Start a BA address change across exchanges.", ba_code="str", new_address="str"),
+            Api("getAddressChangeDocuments", "Documents required to change the BA address.", ba_code="str"),
+            Api("checkAddressUpdateStatus", "Whether the BA address is updated in CBOS and the exchange.", ba_code="str")
+        ]
+    ),
+    "clarification_on_brokerage_api_caller": ToolSpec(
+        "Brokerage clarifications: brokerage slabs, slab revisions and brokerage charged on options, intraday equity and futures trades.",
+        [
+            Api("get_brokerage_slab_all_segments", "Brokerage slab of the client for all segments.", client_id="str", include_history="bool?"),
+            Api("get_revised_brokerage_slab_status", "Status of a requested brokerage slab revision.", client_id="str"),
+            Api("get_brokerage_slab", "Brokerage slab when the client or BA cannot access the Rise app or web portal.", client_id="str"),
+            Api("get_options_brokerage_details", "Brokerage charged on options trades.", client_id="str"),
+            Api("get_equity_intraday_brokerage_report", "Breakdown of intraday equity brokerage charges.", client_id="str", trade_date="str", segment="str?"),
+            Api("get_futures_brokerage_report", "Breakdown of futures brokerage charges.", client_id="str", trade_date="str", segment="str?")
+        ]
+    ),
+    "compliance_api_caller": ToolSpec(
+        "Compliance: penalty circulars and DPC interest and penalty reports.",
+        [
+            Api("get_circular_for_penalty_charges", "Circular on penalty charges and where to find it.", scenario_id="int?"),
+            Api("download_interest_file", "How to download the DPC interest file.", scenario_id="int?"),
+            Api("download_penalty_report", "How to download the penalty bifurcation report.", scenario_id="int?")
+        ]
+    ),
+    "dp_api_caller": ToolSpec(
+        "Depository (DP) processes: beneficiaries, DIS, DRF/RRF and demat, BSDA, DP schemes, pledges and BA deposits. Returns the CBOS path and process type.",
+        [
+            Api("add_beneficiary_manually", "Add a beneficiary manually."),
+            Api("unable_to_add_beneficiary", "Unable to add a beneficiary."),
+            Api("is_beneficiary_added", "Whether a beneficiary is added."),
+            Api("why_beneficiary_rejected", "Why a beneficiary is rejected."),
+            Api("how_to_add_beneficiary", "How to add a beneficiary."),
+            Api("check_beneficiary_details", "Where to check added beneficiary details."),
+            Api("beneficiary_active_but_dis_not_processing", "Beneficiary is active but the DIS cannot be processed."),
+            Api("process_punched_dis", "Process a DIS that has been punched."),
+            Api("why_is_dis_rejected", "Why a DIS was rejected."),
+            Api("dis_not_processed_yet", "DIS not processed yet."),
+            Api("dis_execution_completed_no_stocks", "DIS executed but stocks not yet credited."),
+            Api("rejection_clarification_dis", "Clarification of a DIS rejection."),
+            Api("online_dis_option", "Online DIS execution option (e-off market)."),
+            Api("where_form_add_beneficiary", "Where to find the form to add a beneficiary."),
+            Api("undelivered_dis_book_returned", "What happens to an undelivered DIS book returned to HO."),
+            Api("dis_book_not_received", "DIS book not received yet."),
+            Api("dis_book_returned_back", "DIS book returned back."),
+            Api("transfer_shares_charges", "Charges for transferring shares."),
+            Api("drf_current_status", "Current status of a DRF."),
+            Api("rejected_drf_not_returned_yet", "Rejected DRF not returned yet."),
+            Api("drf_rejection_clarification", "Clarification of a DRF rejection."),
+            Api("drf_processed_no_shares_credited", "DRF processed but shares not credited yet."),
+            Api("convert_physical_to_demat", "What is required to convert physical shares to demat."),
+            Api("demat_processed_unable_to_sell", "Demat shows processed but shares cannot be sold or seen for selling."),
+            Api("tat_sending_shares_to_rta", "TAT for the DP to send shares to the RTA for dematerialisation."),
+            Api("sign_mismatch_drf_docs", "Documents required for a signature mismatch in a DRF."),
+            Api("name_mismatch_drf_docs", "Documents required for a name mismatch."),
+            Api("drf_equity_vs_mf", "Whether the DRF differs for equity and mutual funds."),
+            Api("rrf_process", "RRF process."),
+            Api("rrf_checklist", "Checklist / documents required for an RRF."),
+            Api("check_bsda_status", "Where to check BSDA status."),
+            Api("how_to_know_bsda_flag", "How to know if an account is mapped under the BSDA flag."),
+            Api("ledger_debit_after_funds_transfer", "Why there is a debit entry after a funds transfer."),
+            Api("how_to_change_dp_scheme", "How to change the DP scheme."),
+            Api("check_pledge_status", "How to check pledge status."),
+            Api("ba_deposit_for_nsdl_dp", "Whether a BA deposit can be accepted for an NSDL DP."),
+            Api("ba_check_pledge_request_status", "How a BA can check the status of a pledge request punched in CBOS."),
+            Api("offline_pledge_request_rejected", "Offline pledge request rejected."),
+            Api("check_ba_security_deposit", "How to check the BA security deposit."),
+            Api("tat_for_ba_deposit_pledge", "TAT for a BA deposit request for pledge."),
+            Api("loan_pledge_which_dp", "Which DP the client must activate for a loan pledge request."),
+            Api("why_unpledged_rejected", "Why an unpledge request was rejected."),
+            Api("loan_pledge_request_rejected", "Loan pledge request rejected."),
+            Api("drf_delete_request", "DRF delete request."),
+            Api("charges_for_scheme_off_market", "Scheme and off-market transaction charges."),
+            Api("provide_pledge_form", "Provide the pledge form.")
+        ]
+    ),
+    "edp_api_caller": ToolSpec(
+        "EDP reports and bills: GST B2B invoices, ledgers, contract notes, levies, brokerage and cash, F&O, commodity, MF, SLBM and auction bills.",
+        [
+            Api("generate_gst_b2b_report", "GST B2B invoices."),
+            Api("generate_ledger", "Ledger, e.g. to clarify a ledger debit.", client_id="str", from_date="str?", to_date="str?"),
+            Api("fetch_contract_note_details", "Contract note details."),
+            Api("get_levies_and_charges_details", "How other charges in a contract note are calculated."),
+            Api("get_brokerage_details", "Brokerage applicable to the client."),
+            Api("generate_contract_note", "How to generate a contract note."),
+            Api("generate_auction_bill", "How to generate an auction bill.", client_id="str?", bill_date="str?"),
+            Api("generate_physical_settlement_contract_note", "How to generate a physical settlement contract note."),
+            Api("generate_cash_bill", "How to generate a cash bill."),
+            Api("generate_fno_bill", "How to generate an F&O bill."),
+            Api("generate_commodity_bill", "How to generate a commodity bill."),
+            Api("generate_mf_bill", "How to generate a mutual fund bill."),
+            Api("generate_slbm_bill", "How to generate an SLBM bill.")
+        ]
+    ),
+    "front_office_sales_query_api_caller": ToolSpec(
+        "Branding and marketing material: order materials, check order status and branding approvals.",
+        [
+            Api("request_branding_material", "Order branding material (logo, visiting cards, flex boards, banners, standees, ...).", material_type="str", branch_code="str?", quantity="int?", dimensions="str?", priority="str?"),
+            Api("check_branding_order_status", "Status of a branding material order.", order_id="str", branch_code="str?"),
+            Api("initiate_branding_approval", "Submit or check approval of a branding creative or advertisement.", creative_details="str", branch_code="str?", additional_notes="str?")
+        ]
+    ),
+    "mo_genie_api_caller": ToolSpec(
+        "Branding and marketing material: order materials, check order status and branding approvals.",
+        [
+            Api("requestBrandingMaterial", "Place or update a branding material request (logo, flex board, banner, ...).", material_type="str", quantity="int?", branch_id="str?", notes="str?"),
+            Api("checkBrandingMaterialOrderStatus", "Status of a branding material order.", request_id="str"),
+            Api("requestBrandingApproval", "Approval of branding text, creative or design.", branding_text="str", disclaimer="str?", license_details="str?")
+        ]
+    ),
+    "modification_api_caller": ToolSpec(
+        "Branding and marketing material: order collateral, check order status and branding approvals.",
+        [
+            Api("create_marketing_collateral_order", "Order marketing collateral.", partner_id="str", materials_requested="list", quantity_info="dict?", remarks="str?"),
+            Api("check_marketing_collateral_status", "Status of a marketing collateral order.", order_id="str"),
+            Api("fetch_branding_approval_details", "Details of a branding approval.", approval_reference="str")
+        ]
+    ),
+    "mtf_api_caller": ToolSpec(
+        "Branding and marketing material: order materials, check order status and branding approvals.",
+        [
+            Api("requestBrandingMaterial", "Order branding material (logo, flex board, standee, ...).", branch_id="str", material_type="str", quantity="int?", additional_notes="str?"),
+            Api("checkBrandingMaterialStatus", "Status of a branding material order.", order_id="str"),
+            Api("requestBrandingApproval", "Approval of a branding creative.", creative_id="str", license_details="str?", disclaimer_included="bool?", revisions="list?")
+        ]
+    ),
+    "operations_api_caller": ToolSpec(
+        "Branding and marketing material: order collateral, check order status and branding approvals.",
+        [
+            Api("place_marketing_collateral_order", "Order marketing collateral (logo, banner, visiting cards, boards).", branch_id="str", material_type="str", quantity="int", needed_by="str"),
+            Api("check_marketing_order_status", "Status and expected delivery of a marketing collateral order.", order_id="str"),
+            Api("branding_approval", "Status of a branding approval.", approval_id="str", creative_details="dict?")
+        ]
+    ),
+    "processing_activities_api_caller": ToolSpec(
+        "Branding and marketing material: order collateral, check order status and branding approvals.",
+        [
+            Api("place_marketing_collateral_order", "Order marketing material (logo, flex board, standee, ...).", items_requested="list", branch_id="str"),
+            Api("check_marketing_collateral_order_status", "Status of a marketing collateral order.", order_id="str"),
+            Api("request_branding_approval", "Branding approval request (e.g. AYAC1200).", approval_request_id="str")
+        ]
+    ),
+    "rms_api_caller": ToolSpec(
+        "Branding and marketing material: order materials, check order status and branding approvals.",
+        [
+            Api("order_branding_material", "Order marketing or branding material.", material_type="str", branch_id="str?", quantity="int?"),
+            Api("check_branding_material_status", "Status of a branding material order.", order_id="str"),
+            Api("branding_approval", "Submit or check a branding approval.", approval_id="str", creative_details="str?", disclaimers="str?", license_details="str?")
+        ]
+    ),
+    "settlement_api_caller": ToolSpec(
+        "Branding and marketing material: order materials, check order status and branding approvals.",
+        [
+            Api("order_marketing_material", "Order marketing/branding collateral (flex boards, banners, visiting cards).", material_type="str", quantity="int?", branch_code="str?", additional_notes="str?"),
+            Api("check_marketing_material_status", "Status of a marketing material order, within or beyond TAT.", order_id="str"),
+            Api("branding_approval", "Submit or check a branding approval (logo updates, disclaimers).", request_id="str", creative_details="str?")
+        ]
+    ),
+    "ekyc_api_caller": ToolSpec(
+        "eKYC and account opening lookups in CBOS, the EKYC utility and Saathi.",
+        [
+            Api("check_pan_existence", "Whether a PAN exists and its status (active/inactive/closed).", pan_number="str"),
+            Api("get_ipv_master_status", "IPV (in-person verification) master record by IPV code or name.", ipv_code="str?", ipv_name="str?"),
+            Api("check_ekyc_migration_status", "Status of an eKYC account's migration to CBOS.", client_code="str"),
+            Api("get_client_cbos_status", "Client status in CBOS.", client_code="str"),
+            Api("get_ekyc_objection", "Objections recorded for an eKYC client.", client_code="str"),
+            Api("find_lead_in_saathi", "Whether a lead exists in Saathi for a mobile number.", mobile_number="str"),
+            Api("get_ekyc_details", "eKYC details by PAN, mobile, email or Aadhaar (at least one).", pan="str?", mobile="str?", email="str?", aadhaar="str?"),
+            Api("lead_delete_status", "Status of a lead delete approval/rejection.", mobile_number="str")
+        ]
+    ),
+    "closure_validation_fetch_data_tool": ToolSpec(
+        "Account closure validation: whether the client is ready for closure, with ledger balance, accrued interest, ageing debit, DP holding value and MF SIP status.",
+        args={"client_code": "str"}
+    )
+}
+
+
+def size_report(descriptions=None):
+    """Characters of the generated description and docstring per tool.
+
+    With descriptions (tool name -> description text, e.g. of an older
+    classtool), the old size and the reduction are included too.
+    """
+    rows = []
+    for name, spec in CATALOG.items():
+        row = {
+            "tool": name,
+            "apis": len(spec.apis),
+            "description_chars": len(spec.description()),
+            "docstring_chars": len(spec.docstring()),
+            "json_schema_chars": len(serialization.dumps_str(spec.json_schema()))
+        }
+        if descriptions and name in descriptions:
+            row["old_description_chars"] = len(descriptions[name])
+            row["reduction"] = round(1 - row["description_chars"] / row["old_description_chars"], 4)
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    import re
+
+    parser = argparse.ArgumentParser(description="Report the size of generated tool descriptions")
+    parser.add_argument("--compare", help="An older classtool.py whose literal descriptions to compare against")
+    args = parser.parse_args()
+
+    old = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            source = f.read()
+        old = dict(re.findall(r'name: str = "(\w+)"\n    description: str = """(.*?)"""', source, re.S))
+
+    rows = size_report(old)
+    for row in rows:
+        line = f"{row['tool']:40} {row['apis']:3} apis  description {row['description_chars']:6}  docstring {row['docstring_chars']:6}  schema {row['json_schema_chars']:5}"
+        if "old_description_chars" in row:
+            line += f"  old {row['old_description_chars']:6} ({-row['reduction']:+.0%})"
+        print(line)
+    total = sum(row["description_chars"] for row in rows)
+    print(f"Total description characters: {total}" + (
+        f" (was {sum(row.get('old_description_chars', 0) for row in rows)})" if old else ""
+    ))
@@ -1,5 +1,4 @@
 import os
-import json
 import time
 import logging
 from logging.handlers import RotatingFileHandler
@@ -13,9 +12,10 @@ import datetime
 import requests
 import schedule
 from threading import Thread
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from typing import List, Optional
 import uvicorn
 from dotenv import load_dotenv
 
@@ -24,6 +24,22 @@ load_dotenv()
 
 from agent.classifier_agent import classifier_agent
 from agent.generate_response_agent import ResponseGeneratorAgent
+from agent.rule_classifier import load_rule_classifier
+from agent.local_classifier import load_local_classifier
+from agent.classification_cache import ClassificationCache, cache_key
+from agent.batch_classifier import load_batch_classifier
+from agent.agent_pool import AgentPool
+from agent.classtool import closure_validation_cache
+from storage.persistence import GroupCommitWriter
+from storage.output_store import OutputStore
+from storage import serialization
+from storage.compression import load_codec
+from storage.blob_store import BlobStore
+from queueing.record import EmailRecord
+from queueing.ack import AckCommitter
+from queueing.coalescing import subject_thread_key, coalesce, is_repull
+from queueing.near_duplicate import NearDuplicateIndex
+from queueing.scheduler import PriorityPolicy, DeadlineScheduler, FairShareScheduler, parse_mapping, parse_list
 
 # Create logs directory if it doesn't exist
 os.makedirs("logs", exist_ok=True)
@@ -97,32 +113,379 @@ CONFIG = {
     "processed_emails_file": os.getenv("PROCESSED_EMAILS_FILE", "processed_emails.json"),
     "queue_file": os.getenv("QUEUE_FILE", "email_queue.json"),
     "output_dir": os.getenv("OUTPUT_DIR", "processed_output"),
+    "output_db": os.getenv("OUTPUT_DB", "processed_output.db"),
+    "compression_dict_file": os.getenv("COMPRESSION_DICT_FILE", "compression.dict"),
+    # Level for the compression format in use (zlib 0-9, zstd 1-22); unset uses its default
+    "compression_level": int(os.getenv("COMPRESSION_LEVEL")) if os.getenv("COMPRESSION_LEVEL") else None,
+    "email_body_db": os.getenv("EMAIL_BODY_DB", "email_bodies.db"),
     "poll_interval_minutes": int(os.getenv("POLL_INTERVAL_MINUTES", "1")),
     "max_concurrent_emails": int(os.getenv("MAX_CONCURRENT_EMAILS", "5")),
     "queue_check_interval_seconds": int(os.getenv("QUEUE_CHECK_INTERVAL_SECONDS", "10")),
     "last_pull_time_file": os.getenv("LAST_PULL_TIME_FILE", "last_pull_time.json"),
+    "dead_letter_file": os.getenv("DEAD_LETTER_FILE", "dead_letter_emails.json"),
+    "checkpoint_file": os.getenv("CHECKPOINT_FILE", "email_checkpoints.json"),
+    "ack_commit_window_ms": int(os.getenv("ACK_COMMIT_WINDOW_MS", "200")),
+    "state_commit_window_ms": int(os.getenv("STATE_COMMIT_WINDOW_MS", "50")),
+    "loop_lag_interval_ms": int(os.getenv("LOOP_LAG_INTERVAL_MS", "500")),
+    "loop_lag_warn_ms": int(os.getenv("LOOP_LAG_WARN_MS", "200")),
+    "max_retry_attempts": int(os.getenv("MAX_RETRY_ATTEMPTS", "5")),
+    "retry_base_delay_seconds": int(os.getenv("RETRY_BASE_DELAY_SECONDS", "60")),
+    "retry_max_delay_seconds": int(os.getenv("RETRY_MAX_DELAY_SECONDS", "3600")),
+    # TAT target per scheduling category, in minutes (see queueing.scheduler.PriorityPolicy)
+    "tat_targets_minutes": parse_mapping(os.getenv("TAT_TARGETS_MINUTES", "priority=60,client=240,ba=480,default=480,bulk=2880")),
+    "priority_sender_domains": parse_list(os.getenv("PRIORITY_SENDER_DOMAINS", "")),
+    "bulk_sender_patterns": parse_list(os.getenv("BULK_SENDER_PATTERNS", "noreply,no-reply,donotreply,newsletter,mailer-daemon,notification,alerts")),
+    "lease_timeout_seconds": int(os.getenv("LEASE_TIMEOUT_SECONDS", "900")),
+    # Pending follow-ups on the same case (or same sender and subject) are merged into one email
+    "coalesce_by_subject": os.getenv("COALESCE_BY_SUBJECT", "true").lower() == "true",
+    "coalesce_max_context": int(os.getenv("COALESCE_MAX_CONTEXT", "5")),
+    # Near-identical pending emails share classifications and drafts through the classification cache
+    "near_duplicate_enabled": os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true",
+    "near_duplicate_threshold": float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.7")),
+    # "fair" shares batches across senders (queueing.scheduler.FairShareScheduler), "deadline" is plain EDF
+    "scheduling_policy": os.getenv("SCHEDULING_POLICY", "fair"),
+    "sender_weights": parse_mapping(os.getenv("SENDER_WEIGHTS", "priority=4,client=2,default=1,bulk=1")),
+    "sender_cost_unit_bytes": int(os.getenv("SENDER_COST_UNIT_BYTES", "4096")),
+    "sender_max_in_flight": int(os.getenv("SENDER_MAX_IN_FLIGHT", "2")),
+    "sender_rate_per_minute": float(os.getenv("SENDER_RATE_PER_MINUTE", "0")),
+    "rule_classifier_enabled": os.getenv("RULE_CLASSIFIER_ENABLED", "true").lower() == "true",
+    "classifier_rules_file": os.getenv("CLASSIFIER_RULES_FILE", "classifier_rules.json"),
+    # Trained with `python -m agent.local_classifier`; needs numpy
+    "local_classifier_model": os.getenv("LOCAL_CLASSIFIER_MODEL", "local_classifier.npz"),
+    "local_classifier_threshold": float(os.getenv("LOCAL_CLASSIFIER_THRESHOLD", "0.9")),
+    "classification_cache_enabled": os.getenv("CLASSIFICATION_CACHE_ENABLED", "true").lower() == "true",
+    "classification_cache_size": int(os.getenv("CLASSIFICATION_CACHE_SIZE", "10000")),
+    "classification_cache_ttl_seconds": int(os.getenv("CLASSIFICATION_CACHE_TTL_SECONDS", "21600")),
+    "cache_drafts": os.getenv("CACHE_DRAFTS", "true").lower() == "true",
+    # Short emails are classified several per LLM call while the queue is at least this deep (batch size < 2 turns it off)
+    "classifier_batch_size": int(os.getenv("CLASSIFIER_BATCH_SIZE", "8")),
+    "classifier_batch_min_queue_depth": int(os.getenv("CLASSIFIER_BATCH_MIN_QUEUE_DEPTH", "50")),
+    "classifier_batch_max_wait_seconds": float(os.getenv("CLASSIFIER_BATCH_MAX_WAIT_SECONDS", "0.5")),
+    "classifier_batch_max_chars": int(os.getenv("CLASSIFIER_BATCH_MAX_CHARS", "1500")),
+    "classifier_batch_model": os.getenv("CLASSIFIER_BATCH_MODEL", "o3-mini"),
+    # Pre-built response agents reused across emails (0 = one per concurrent email)
+    "response_agent_pool_size": int(os.getenv("RESPONSE_AGENT_POOL_SIZE", "0")),
     "base_url": os.getenv("BASE_URL", "http://localhost:8000")
 }
 
-# Ensure output directory exists
-os.makedirs(CONFIG["output_dir"], exist_ok=True)
+# Email bodies and output records are compressed at rest with a shared
+# dictionary (trained once with `python -m storage.compression`)
+codec = load_codec(CONFIG["compression_dict_file"], level=CONFIG["compression_level"])
+
+# Processed outputs live in a single SQLite store; an existing output_dir
+# can be imported once with `python -m storage.output_store migrate`
+output_store = OutputStore(CONFIG["output_db"], codec=codec)
+
+# Bodies of queued emails, loaded only when an email is picked for processing
+email_bodies = BlobStore(CONFIG["email_body_db"], codec=codec)
+
+# Auto-replies, bounces and obvious spam are classified by rules without an LLM call
+rule_classifier = load_rule_classifier(CONFIG["classifier_rules_file"])
+
+# Routine emails the local model is confident about skip the classifier agent (None if not trained)
+local_classifier = load_local_classifier(CONFIG["local_classifier_model"], CONFIG["local_classifier_threshold"])
+
+# Classifier agent results (and generic drafts) for repeated templated emails
+classification_cache = ClassificationCache(
+    CONFIG["classification_cache_size"],
+    CONFIG["classification_cache_ttl_seconds"]
+)
+
+# Packs short emails into one classifier call during backlogs (None if disabled)
+batch_classifier = load_batch_classifier(
+    CONFIG["classifier_batch_model"],
+    CONFIG["classifier_batch_size"],
+    CONFIG["classifier_batch_max_wait_seconds"],
+    CONFIG["classifier_batch_max_chars"]
+)
+
+# Response agents are built once and reset between emails instead of rebuilt per email
+response_agents = AgentPool(
+    ResponseGeneratorAgent,
+    CONFIG["response_agent_pool_size"] or CONFIG["max_concurrent_emails"],
+    thread_pool
+)
+
+def decompress_email(stored):
+    """Restore the content of an email saved by an older queue file with compressed content."""
+    if "content_z" in stored:
+        stored["content"] = codec.decompress_text(stored.pop("content_z"))
+    return stored
+
+# Shared writer for all state files: atomic replace plus group commit.
+# submit() only records the latest payload per file, so saves never block
+# the event loop and pending work stays bounded by the number of files
+state_writer = GroupCommitWriter(CONFIG["state_commit_window_ms"] / 1000)
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up from a fixed-interval sleep.
+    
+    Any lag beyond a few milliseconds means a coroutine (or a synchronous
+    call made from one) held the loop; values above loop_lag_warn_ms are
+    logged as stalls.
+    """
+    def __init__(self, interval_seconds, warn_seconds):
+        self.interval_seconds = interval_seconds
+        self.warn_seconds = warn_seconds
+        self.samples = 0
+        self.total_lag = 0.0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+    
+    async def run(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, loop.time() - started - self.interval_seconds)
+            self.samples += 1
+            self.total_lag += lag
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.warn_seconds:
+                self.stalls += 1
+                logger.warning(f"SYSTEM | Event loop stalled for {lag * 1000:.0f}ms")
+    
+    def get_stats(self):
+        return {
+            "last_lag_ms": round(self.last_lag * 1000, 2),
+            "avg_lag_ms": round(self.total_lag / self.samples * 1000, 2) if self.samples else 0.0,
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "stalls": self.stalls,
+            "samples": self.samples
+        }
+
+loop_lag_monitor = LoopLagMonitor(
+    CONFIG["loop_lag_interval_ms"] / 1000,
+    CONFIG["loop_lag_warn_ms"] / 1000
+)
 
 # Email Queue Class
 class EmailQueue:
-    def __init__(self, queue_file):
+    """Persistent queue of emails waiting to be processed.
+    
+    Queued emails are EmailRecords holding only compact metadata (ids,
+    sender, sizes, timestamps, retry state), which is also all the queue
+    file contains. Subject and content are spilled to the body store on
+    enqueue and loaded by load_bodies() right before processing, so
+    memory use does not grow with the size of the emails.
+    
+    Emails are handed out earliest TAT deadline first rather than in
+    arrival order (see queueing.scheduler), so urgent client queries are
+    not stuck behind a backlog of bulk mail.
+    
+    Follow-ups on a thread that is still waiting are coalesced: only the
+    latest email is processed, with the earlier ones as context. A
+    follow-up on a case that is being processed is held as that email's
+    successor and queued once the processing ends. With a near_duplicates
+    index, emails are also grouped into clusters of near-identical content
+    (see cluster_of()).
+    """
+    def __init__(self, queue_file, dead_letter_file, body_store, scheduler, near_duplicates=None):
         self.queue_file = queue_file
+        self.dead_letter_file = dead_letter_file
+        self.body_store = body_store
+        self.scheduler = scheduler
+        self.near_duplicates = near_duplicates
         self.lock = threading.Lock()
-        self.queue = self._load_queue()
+        self.queue = {}
+        # Subject thread key -> interaction id of the queued email on that thread
+        self.threads = {}
+        # Interaction id of a leased email -> follow-up on the same case, queued when the lease ends
+        self.successors = {}
+        # Sender -> queued interaction ids, and the user type looked up for that sender
+        self.sender_ids = {}
+        self.sender_types = {}
+        self.coalesced_count = 0
+        successors = []
+        queue = self._load_queue(successors)
+        dead_letters = self._load_dead_letters()
+        # Files saved by older versions still carry email bodies and are rewritten
+        queue_has_bodies = any(record.has_body for record in queue)
+        dead_letters_have_bodies = any(record.has_body for record in dead_letters)
+        for record in self._spill_bodies(queue):
+            self._track(record)
+        self.dead_letters = self._spill_bodies(dead_letters)
+        if queue_has_bodies:
+            self._save_queue()
+        if dead_letters_have_bodies:
+            self._save_dead_letters()
+        self._index_near_duplicates(list(self.queue.values()))
+        # Nothing is leased after a restart, so held follow-ups are queued right away
+        with self.lock:
+            for record in successors:
+                record.body_loader = self._successor_loader(record.interaction_id)
+                self.successors[record.interaction_id] = record
+        self._promote_successors([record.interaction_id for record in successors])
+    
+    def _track(self, record, signature=None):
+        """Add a record to the queue, the thread and near-duplicate indexes and the scheduler (lock held)."""
+        self.queue[record.interaction_id] = record
+        if record.thread_key:
+            self.threads[record.thread_key] = record.interaction_id
+        sender = record.sender.lower()
+        self.sender_ids.setdefault(sender, set()).add(record.interaction_id)
+        if not record.user_type and sender in self.sender_types:
+            record.user_type = self.sender_types[sender]
+        if signature is not None:
+            self.near_duplicates.add(record.interaction_id, signature)
+        self.scheduler.push(record)
+    
+    def _untrack(self, interaction_id):
+        """Remove a record from the queue, the thread index and the scheduler (lock held)."""
+        record = self.queue.pop(interaction_id, None)
+        if record is not None and record.thread_key and self.threads.get(record.thread_key) == interaction_id:
+            del self.threads[record.thread_key]
+        if record is not None:
+            sender = record.sender.lower()
+            ids = self.sender_ids.get(sender)
+            if ids is not None:
+                ids.discard(interaction_id)
+                if not ids:
+                    del self.sender_ids[sender]
+                    self.sender_types.pop(sender, None)
+        if self.near_duplicates is not None:
+            self.near_duplicates.remove(interaction_id)
+        self.scheduler.discard(interaction_id)
+        return record
+    
+    def _index_near_duplicates(self, records, batch_size=500):
+        """Add queued records to the near-duplicate index, loading their bodies in batches."""
+        if self.near_duplicates is None or not records:
+            return
+        start = time.time()
+        for i in range(0, len(records), batch_size):
+            loaded = [full for full in self.load_bodies(records[i:i + batch_size]) if full is not None]
+            signatures = [(full.interaction_id, self.near_duplicates.signature(full.subject, full.content)) for full in loaded]
+            with self.lock:
+                for interaction_id, signature in signatures:
+                    if interaction_id in self.queue:
+                        self.near_duplicates.add(interaction_id, signature)
+        logger.info(f"SYSTEM | Indexed {len(records)} queued emails for near-duplicates in {time.time() - start:.2f}s")
+    
+    def _spill_bodies(self, records):
+        """Move loaded subjects and contents into the body store and drop them from memory."""
+        records = list(records)
+        self.body_store.put_many(
+            (record.interaction_id, record.body()) for record in records if record.has_body
+        )
+        for record in records:
+            record.drop_body()
+            record.body_loader = self.body_store.get
+        return records
+    
+    def _successor_key(self, interaction_id):
+        return f"{interaction_id}:successor"
+    
+    def _successor_loader(self, interaction_id):
+        key = self._successor_key(interaction_id)
+        return lambda _: self.body_store.get(key)
+    
+    def _hold_successor(self, record):
+        """Keep a follow-up on a leased email until its lease ends (lock held).
+        
+        The body goes to its own key, so the leased email's body is left alone.
+        """
+        self.body_store.put_many([(self._successor_key(record.interaction_id), record.body())])
+        record.drop_body()
+        record.body_loader = self._successor_loader(record.interaction_id)
+        self.successors[record.interaction_id] = record
+    
+    def _promote_successors(self, interaction_ids):
+        """Queue the follow-ups held for emails whose lease has ended.
+        
+        A follow-up carries the earlier message as context, so it replaces
+        the email when that is still queued (waiting for a retry) or was
+        just dead-lettered. Returns the number of follow-ups queued.
+        """
+        promoted = []
+        with self.lock:
+            for interaction_id in interaction_ids:
+                record = self.successors.get(interaction_id)
+                if record is None or self.scheduler.is_leased(interaction_id):
+                    continue
+                key = self._successor_key(interaction_id)
+                body = self.body_store.get(key)
+                del self.successors[interaction_id]
+                if body is None:
+                    logger.error(f"Interaction id: {interaction_id} | Body of held follow-up missing from body store")
+                    continue
+                # Moved under the lock, so the email cannot be leased while its body changes
+                self.body_store.put_many([(interaction_id, body)])
+                self.body_store.delete_many([key])
+                record.body_loader = self.body_store.get
+                self._untrack(interaction_id)
+                self._track(record)
+                promoted.append(record)
+            # A dead-lettered email whose body was just replaced lives on as the follow-up's context
+            promoted_ids = {record.interaction_id for record in promoted}
+            superseded = [record for record in self.dead_letters if record.interaction_id in promoted_ids]
+            if superseded:
+                self.dead_letters = [record for record in self.dead_letters if record.interaction_id not in promoted_ids]
+        if not promoted:
+            return 0
+        for record in promoted:
+            # Stages completed for the earlier content no longer apply
+            checkpoint_store.clear(record.interaction_id)
+            logger.info(f"Interaction id: {record.interaction_id} | Queued follow-up held while the case was being processed")
+        self._index_near_duplicates(promoted)
+        self._save_queue()
+        if superseded:
+            self._save_dead_letters()
+        return len(promoted)
     
-    def _load_queue(self):
-        """Load queue from file."""
+    def _load_successors(self, records):
+        """Copies of held follow-ups with subject and content loaded (None when missing)."""
+        bodies = self.body_store.get_many([self._successor_key(record.interaction_id) for record in records])
+        loaded = []
+        for record in records:
+            body = bodies.get(self._successor_key(record.interaction_id))
+            if body is None:
+                loaded.append(None)
+                continue
+            full = record.copy()
+            full.set_body(body.get("subject", ""), body.get("content", ""), body.get("context"))
+            loaded.append(full)
+        return loaded
+    
+    def load_bodies(self, records):
+        """Return copies of queued records with subject and content loaded.
+        
+        Records whose body is missing from the store are returned as None.
+        """
+        bodies = self.body_store.get_many([record.interaction_id for record in records])
+        loaded = []
+        for record in records:
+            body = bodies.get(str(record.interaction_id))
+            if body is None:
+                logger.error(f"Interaction id: {record.interaction_id} | Email body missing from body store")
+                loaded.append(None)
+                continue
+            full = record.copy()
+            full.set_body(body.get("subject", ""), body.get("content", ""), body.get("context"))
+            loaded.append(full)
+        return loaded
+    
+    def _load_records(self, path, successors=None):
+        records = []
+        with open(path, "rb") as f:
+            for data in serialization.loads(f.read()):
+                record = EmailRecord.from_dict(decompress_email(data))
+                if successors is not None and data.get("successor"):
+                    successors.append(record)
+                else:
+                    records.append(record)
+        return records
+    
+    def _load_queue(self, successors=None):
+        """Load queue from file; held follow-ups are appended to successors."""
         try:
             if os.path.exists(self.queue_file):
                 with self.lock:
-                    with open(self.queue_file, "r") as f:
-                        data = json.load(f)
-                        logger.info(f"SYSTEM | Loaded {len(data)} emails in queue")
-                        return data
+                    data = self._load_records(self.queue_file, successors)
+                    logger.info(f"SYSTEM | Loaded {len(data)} emails in queue")
+                    return data
             logger.info("SYSTEM | No existing queue found, starting fresh")
             return []
         except Exception as e:
@@ -130,37 +493,202 @@ class EmailQueue:
             return []
     
     def _save_queue(self):
-        """Save queue to file."""
+        """Schedule an atomic save of the queue file."""
+        return state_writer.submit(self.queue_file, self._serialize_queue)
+    
+    def _serialize_queue(self):
+        # Copy under the lock, serialize outside it
+        with self.lock:
+            snapshot = [record.to_dict() for record in self.queue.values()]
+            snapshot.extend(dict(record.to_dict(), successor=True) for record in self.successors.values())
+        logger.info(f"SYSTEM | Saved {len(snapshot)} emails to queue")
+        return serialization.dumps(snapshot)
+    
+    def _load_dead_letters(self):
+        """Load dead-lettered emails from file."""
         try:
-            with self.lock:
-                with open(self.queue_file, "w") as f:
-                    json.dump(self.queue, f, indent=2)
-                    logger.info(f"SYSTEM | Saved {len(self.queue)} emails to queue")
+            if os.path.exists(self.dead_letter_file):
+                with self.lock:
+                    data = self._load_records(self.dead_letter_file)
+                    logger.info(f"SYSTEM | Loaded {len(data)} dead-lettered emails")
+                    return data
+            return []
         except Exception as e:
-            logger.error(f"SYSTEM | Error saving queue: {e}")
+            logger.error(f"SYSTEM | Error loading dead letters: {e}")
+            return []
+    
+    def _save_dead_letters(self):
+        """Schedule an atomic save of the dead-letter file."""
+        return state_writer.submit(self.dead_letter_file, self._serialize_dead_letters)
     
-    def add_emails(self, emails):
-        """Add emails to queue. Avoid duplicates."""
+    def _serialize_dead_letters(self):
+        with self.lock:
+            snapshot = [record.to_dict() for record in self.dead_letters]
+        logger.info(f"SYSTEM | Saved {len(snapshot)} dead-lettered emails")
+        return serialization.dumps(snapshot)
+    
+    def add_emails(self, records):
+        """Add EmailRecords to queue, coalescing follow-ups on waiting threads.
+        
+        An email on the same case (interaction id), or from the same sender
+        with the same normalized subject, as an email that is still waiting
+        replaces it and carries the earlier message as context. A follow-up
+        on a case that is being processed right now is held and queued, with
+        the earlier message as context, once that processing ends. Emails
+        whose content is already queued or being processed are ignored as
+        duplicates.
+        """
+        coalesced = []
+        
+        # Collapse follow-ups within this pull first, oldest first
+        incoming = {}
+        incoming_threads = {}
+        for record in sorted(records, key=lambda record: record.created_at or record.enqueued_at):
+            record.thread_key = subject_thread_key(record) if CONFIG["coalesce_by_subject"] else None
+            match = incoming.get(record.interaction_id)
+            if match is not None and is_repull(match, record):
+                continue
+            if match is None and record.thread_key:
+                match = incoming.get(incoming_threads.get(record.thread_key))
+            if match is not None:
+                record, superseded = coalesce(match, record, CONFIG["coalesce_max_context"])
+                incoming.pop(superseded.interaction_id, None)
+                coalesced.append((record.interaction_id, superseded.interaction_id))
+            incoming[record.interaction_id] = record
+            if record.thread_key:
+                incoming_threads[record.thread_key] = record.interaction_id
+        
+        # Match against emails already queued: the same case (the follow-up held
+        # for it, if it is being processed), else a waiting email on the same thread
+        matches = {}
+        with self.lock:
+            for record in list(incoming.values()):
+                queued_id = record.interaction_id if record.interaction_id in self.queue else None
+                if queued_id is None and record.thread_key:
+                    queued_id = self.threads.get(record.thread_key)
+                    if queued_id is not None and self.scheduler.is_leased(queued_id):
+                        queued_id = None
+                if queued_id is None or queued_id in matches.values():
+                    continue
+                matches[record.interaction_id] = queued_id
+            queued = [self.queue[queued_id] for queued_id in matches.values()]
+            held = [self.successors[queued_id] for queued_id in matches.values() if queued_id in self.successors]
+        
+        loaded = dict(zip(matches.values(), self.load_bodies(queued)))
+        loaded.update((record.interaction_id, full) for record, full in zip(held, self._load_successors(held)) if full is not None)
+        replaced = {}
+        for incoming_id, queued_id in matches.items():
+            full = loaded[queued_id]
+            if full is None:
+                if queued_id == incoming_id:
+                    replaced[incoming_id] = queued_id
+                continue
+            if is_repull(full, incoming[incoming_id]):
+                # Same message pulled again; keep the queued email and its checkpoints
+                del incoming[incoming_id]
+                continue
+            survivor, superseded = coalesce(full, incoming.pop(incoming_id), CONFIG["coalesce_max_context"])
+            incoming[survivor.interaction_id] = survivor
+            replaced[survivor.interaction_id] = queued_id
+            coalesced.append((survivor.interaction_id, superseded.interaction_id))
+        
+        signatures = {}
+        if self.near_duplicates is not None:
+            signatures = {
+                record.interaction_id: self.near_duplicates.signature(record.subject, record.content)
+                for record in incoming.values()
+            }
+        
         added_count = 0
+        removed_ids = []
+        replaced_ids = []
+        held_ids = []
         with self.lock:
-            existing_ids = {email["interaction_id"] for email in self.queue}
-            for email in emails:
-                if email["interaction_id"] not in existing_ids:
-                    self.queue.append(email)
-                    existing_ids.add(email["interaction_id"])
+            # Leases are checked before any body is written, so the body of an
+            # email that is being processed is never overwritten
+            new_records = []
+            for record in incoming.values():
+                interaction_id = record.interaction_id
+                if interaction_id in self.queue and self.scheduler.is_leased(interaction_id):
+                    self._hold_successor(record)
+                    held_ids.append(interaction_id)
+                    continue
+                queued_id = replaced.get(interaction_id)
+                if queued_id is not None and (queued_id not in self.queue or self.scheduler.is_leased(queued_id)):
+                    # Picked up for processing in the meantime
+                    queued_id = None
+                if queued_id is None and interaction_id in self.queue:
+                    # Queued by a concurrent pull since the match above
+                    logger.warning(f"Interaction id: {interaction_id} | Already queued by a concurrent pull, ignoring this copy")
+                    continue
+                if queued_id is not None:
+                    self._untrack(queued_id)
+                    replaced_ids.append(queued_id)
+                    if queued_id != interaction_id:
+                        removed_ids.append(queued_id)
+                else:
                     added_count += 1
+                new_records.append(record)
+            # Bodies are stored before the records become visible to get_batch
+            for record in self._spill_bodies(new_records):
+                self._track(record, signatures.get(record.interaction_id))
+            self.coalesced_count += len(coalesced)
+        self.body_store.delete_many(removed_ids)
+        # Stages completed for the earlier content no longer apply
+        for interaction_id in replaced_ids:
+            checkpoint_store.clear(interaction_id)
         
+        for survivor_id, superseded_id in coalesced:
+            logger.info(f"Interaction id: {survivor_id} | Coalesced earlier interaction {superseded_id} on the same thread")
+        for interaction_id in held_ids:
+            logger.info(f"Interaction id: {interaction_id} | Follow-up arrived while the case is being processed, queued to run after it")
         if added_count > 0:
             logger.info(f"SYSTEM | Added {added_count} new emails to queue")
+        if added_count > 0 or coalesced or held_ids:
             self._save_queue()
         
         return added_count
     
+    def set_user_type(self, sender, user_type):
+        """Record the user type looked up for a sender on all of its queued emails.
+        
+        User types are only known once an email is processed, so emails
+        are queued under the default TAT target. This re-keys the sender's
+        queued emails (and ones it sends while any are still queued) to
+        the target for its user type.
+        """
+        if not user_type:
+            return 0
+        sender = (sender or "").lower()
+        rekeyed = 0
+        with self.lock:
+            ids = self.sender_ids.get(sender)
+            if not ids or self.sender_types.get(sender) == user_type:
+                return 0
+            self.sender_types[sender] = user_type
+            for interaction_id in ids:
+                record = self.queue[interaction_id]
+                if record.user_type == user_type:
+                    continue
+                record.user_type = user_type
+                # Leased emails keep their lease; a retry is pushed with the new type
+                if not self.scheduler.is_leased(interaction_id):
+                    self.scheduler.push(record)
+                rekeyed += 1
+        if rekeyed:
+            logger.info(f"SYSTEM | Rescheduled {rekeyed} queued emails from {sender} as user type {user_type}")
+            self._save_queue()
+        return rekeyed
+    
     def get_batch(self, batch_size):
-        """Get a batch of emails for processing."""
+        """Get a batch of due emails, earliest deadline first.
+        
+        Emails waiting out a retry backoff are skipped so they do not
+        hold batch slots ahead of fresh emails. Returned emails are leased
+        until they are removed or marked failed.
+        """
         with self.lock:
-            batch = self.queue[:batch_size]
-            return batch
+            return self.scheduler.pop_due(batch_size)
     
     def remove_emails(self, interaction_ids):
         """Remove processed emails from queue."""
@@ -168,53 +696,270 @@ class EmailQueue:
             return 0
         
         removed_count = 0
+        removed_ids = set(interaction_ids)
         with self.lock:
-            self.queue = [email for email in self.queue if email["interaction_id"] not in interaction_ids]
-            removed_count = len(interaction_ids)
+            for interaction_id in removed_ids:
+                if self._untrack(interaction_id) is not None:
+                    removed_count += 1
+        self.body_store.delete_many(removed_ids)
         
         if removed_count > 0:
             logger.info(f"SYSTEM | Removed {removed_count} processed emails from queue")
             self._save_queue()
+        self._promote_successors(removed_ids)
         
         return removed_count
     
+    def mark_failed(self, interaction_ids, error=None):
+        """Record a failed attempt for each email and schedule its retry.
+        
+        The retry delay doubles with every attempt (capped at
+        retry_max_delay_seconds). Once an email reaches max_retry_attempts
+        it is moved out of the queue into the dead-letter store.
+        """
+        if not interaction_ids:
+            return 0
+        
+        now = time.time()
+        retried = []
+        dead = []
+        with self.lock:
+            for interaction_id in set(interaction_ids):
+                record = self.queue.get(interaction_id)
+                if record is None:
+                    continue
+                delay = record.record_failure(
+                    error, now, CONFIG["max_retry_attempts"],
+                    CONFIG["retry_base_delay_seconds"], CONFIG["retry_max_delay_seconds"]
+                )
+                if delay is None:
+                    self._untrack(interaction_id)
+                    self.dead_letters.append(record)
+                    dead.append(record.interaction_id)
+                else:
+                    self.scheduler.push(record)
+                    retried.append((record.interaction_id, record.attempts, delay))
+        
+        for interaction_id, attempts, delay in retried:
+            logger.info(f"Interaction id: {interaction_id} | Attempt {attempts} failed, retrying in {delay}s")
+        for interaction_id in dead:
+            logger.error(f"Interaction id: {interaction_id} | Moved to dead-letter store after {CONFIG['max_retry_attempts']} attempts")
+        
+        if retried or dead:
+            self._save_queue()
+        if dead:
+            self._save_dead_letters()
+        self._promote_successors(interaction_ids)
+        
+        return len(retried) + len(dead)
+    
+    def get_dead_letters(self):
+        """Get the metadata of all dead-lettered emails."""
+        with self.lock:
+            return [record.to_dict() for record in self.dead_letters]
+    
+    def requeue_dead_letters(self, interaction_ids=None):
+        """Move dead-lettered emails back into the queue with a fresh retry budget.
+        
+        Requeues every dead letter when interaction_ids is None.
+        """
+        wanted = None if interaction_ids is None else {str(i) for i in interaction_ids}
+        requeued = []
+        with self.lock:
+            remaining = []
+            for record in self.dead_letters:
+                if wanted is not None and str(record.interaction_id) not in wanted:
+                    remaining.append(record)
+                    continue
+                record.reset_retries()
+                requeued.append(record)
+            self.dead_letters = remaining
+            for record in requeued:
+                if record.interaction_id not in self.queue:
+                    self._track(record)
+        self._index_near_duplicates(requeued)
+        
+        if requeued:
+            logger.info(f"SYSTEM | Requeued {len(requeued)} dead-lettered emails")
+            self._save_queue()
+            self._save_dead_letters()
+        
+        return [record.interaction_id for record in requeued]
+    
     def get_length(self):
         """Get current queue length."""
         with self.lock:
             return len(self.queue)
+    
+    def get_schedule_stats(self):
+        """Ready, backing-off, leased and overdue counts from the scheduler."""
+        with self.lock:
+            stats = self.scheduler.get_stats()
+            stats["coalesced"] = self.coalesced_count
+            stats["held_follow_ups"] = len(self.successors)
+            return stats
+    
+    def cluster_of(self, interaction_id):
+        """Id of the near-duplicate cluster a queued email belongs to, or None."""
+        if self.near_duplicates is None:
+            return None
+        with self.lock:
+            return self.near_duplicates.cluster_of(interaction_id)
+    
+    def get_near_duplicate_stats(self):
+        """Indexed emails and near-duplicate clusters, or None when the index is off."""
+        if self.near_duplicates is None:
+            return None
+        with self.lock:
+            return self.near_duplicates.get_stats()
+    
+    def get_dead_letter_length(self):
+        """Get current dead-letter store size."""
+        with self.lock:
+            return len(self.dead_letters)
+
+def create_scheduler():
+    """Build the queue scheduler selected by CONFIG["scheduling_policy"]."""
+    policy = PriorityPolicy(
+        CONFIG["tat_targets_minutes"],
+        CONFIG["priority_sender_domains"],
+        CONFIG["bulk_sender_patterns"]
+    )
+    if CONFIG["scheduling_policy"] == "deadline":
+        return DeadlineScheduler(policy, lease_seconds=CONFIG["lease_timeout_seconds"])
+    return FairShareScheduler(
+        policy,
+        lease_seconds=CONFIG["lease_timeout_seconds"],
+        weights=CONFIG["sender_weights"],
+        cost_unit_bytes=CONFIG["sender_cost_unit_bytes"],
+        max_in_flight=CONFIG["sender_max_in_flight"],
+        rate_per_minute=CONFIG["sender_rate_per_minute"]
+    )
 
 # Initialize email queue
-email_queue = EmailQueue(CONFIG["queue_file"])
+email_queue = EmailQueue(
+    CONFIG["queue_file"],
+    CONFIG["dead_letter_file"],
+    email_bodies,
+    create_scheduler(),
+    NearDuplicateIndex(threshold=CONFIG["near_duplicate_threshold"]) if CONFIG["near_duplicate_enabled"] else None
+)
+
+# Per-email stage checkpoints
+class CheckpointStore:
+    """Persist intermediate results of process_single_email per interaction.
+    
+    Stages are recorded in the order they complete (user_lookup,
+    classification, response, submitted) so a retried email resumes at
+    the first incomplete stage instead of repeating LLM calls.
+    """
+    def __init__(self, checkpoint_file):
+        self.checkpoint_file = checkpoint_file
+        self.lock = threading.Lock()
+        self.checkpoints = self._load_checkpoints()
+    
+    def _load_checkpoints(self):
+        """Load checkpoints from file."""
+        try:
+            if os.path.exists(self.checkpoint_file):
+                with self.lock:
+                    with open(self.checkpoint_file, "rb") as f:
+                        data = serialization.loads(f.read())
+                        logger.info(f"SYSTEM | Loaded checkpoints for {len(data)} emails")
+                        return data
+            return {}
+        except Exception as e:
+            logger.error(f"SYSTEM | Error loading checkpoints: {e}")
+            return {}
+    
+    def _save_checkpoints(self):
+        """Schedule an atomic save of the checkpoint file."""
+        return state_writer.submit(self.checkpoint_file, self._serialize_checkpoints)
+    
+    def _serialize_checkpoints(self):
+        with self.lock:
+            snapshot = {interaction_id: dict(stages) for interaction_id, stages in self.checkpoints.items()}
+        return serialization.dumps(snapshot)
+    
+    def get(self, interaction_id):
+        """Get the completed stages recorded for an email."""
+        with self.lock:
+            return dict(self.checkpoints.get(str(interaction_id), {}))
+    
+    def save_stage(self, interaction_id, stage, result):
+        """Record the result of a completed stage."""
+        with self.lock:
+            self.checkpoints.setdefault(str(interaction_id), {})[stage] = result
+        self._save_checkpoints()
+    
+    def clear(self, interaction_id):
+        """Drop all checkpoints of an email once it is fully processed."""
+        with self.lock:
+            removed = self.checkpoints.pop(str(interaction_id), None)
+        if removed is not None:
+            self._save_checkpoints()
+
+checkpoint_store = CheckpointStore(CONFIG["checkpoint_file"])
+
+# In-memory copy of the processed list; the file is only read once since
+# writes reach the disk asynchronously through state_writer
+processed_emails_cache = None
+processed_emails_lock = threading.Lock()
 
 def load_processed_emails():
     """Load the list of already processed email IDs."""
+    global processed_emails_cache
+    with processed_emails_lock:
+        if processed_emails_cache is not None:
+            return list(processed_emails_cache)
     try:
         if os.path.exists(CONFIG["processed_emails_file"]):
-            with open(CONFIG["processed_emails_file"], "r") as f:
-                data = json.load(f)
+            with open(CONFIG["processed_emails_file"], "rb") as f:
+                data = serialization.loads(f.read())
                 logger.info(f"SYSTEM | Loaded {len(data)} previously processed emails")
-                return data
-        logger.info("SYSTEM | No previously processed emails found, starting fresh")
-        return []
+        else:
+            logger.info("SYSTEM | No previously processed emails found, starting fresh")
+            data = []
     except Exception as e:
         logger.error(f"SYSTEM | Error loading processed emails: {e}")
         return []
+    with processed_emails_lock:
+        if processed_emails_cache is None:
+            processed_emails_cache = data
+        return list(processed_emails_cache)
 
 def save_processed_emails(processed_emails):
-    """Save the updated list of processed email IDs."""
-    try:
-        with open(CONFIG["processed_emails_file"], "w") as f:
-            json.dump(processed_emails, f, indent=2)
-            logger.info(f"SYSTEM | Saved {len(processed_emails)} processed email IDs")
-    except Exception as e:
-        logger.error(f"SYSTEM | Error saving processed emails: {e}")
+    """Schedule an atomic save of the updated list of processed email IDs."""
+    global processed_emails_cache
+    with processed_emails_lock:
+        processed_emails_cache = list(processed_emails)
+    return state_writer.submit(CONFIG["processed_emails_file"], _serialize_processed_emails)
+
+def _serialize_processed_emails():
+    with processed_emails_lock:
+        snapshot = list(processed_emails_cache)
+    logger.info(f"SYSTEM | Saved {len(snapshot)} processed email IDs")
+    return serialization.dumps(snapshot)
+
+def commit_processed_emails(interaction_ids):
+    """Record emails as processed and drop them from the queue."""
+    processed_email_ids = load_processed_emails()
+    known_ids = set(processed_email_ids)
+    processed_email_ids.extend(i for i in interaction_ids if i not in known_ids)
+    save_processed_emails(processed_email_ids)
+    email_queue.remove_emails(interaction_ids)
+    logger.info(f"SYSTEM | Committed {len(interaction_ids)} processed emails")
+
+ack_committer = AckCommitter(
+    CONFIG["ack_commit_window_ms"] / 1000, commit_processed_emails, state_writer.barrier, thread_pool
+)
 
 def get_last_pull_time():
     """Get the timestamp of the last successful pull."""
     try:
         if os.path.exists(CONFIG["last_pull_time_file"]):
-            with open(CONFIG["last_pull_time_file"], "r") as f:
-                data = json.load(f)
+            with open(CONFIG["last_pull_time_file"], "rb") as f:
+                data = serialization.loads(f.read())
                 return datetime.datetime.fromisoformat(data["last_pull_time"])
         # Default to 1 day ago if no previous pull
         return datetime.datetime.now() - datetime.timedelta(minutes=30)
@@ -223,13 +968,13 @@ def get_last_pull_time():
         return datetime.datetime.now() - datetime.timedelta(minutes=30)
 
 def save_last_pull_time(pull_time):
-    """Save the timestamp of the last successful pull."""
-    try:
-        with open(CONFIG["last_pull_time_file"], "w") as f:
-            json.dump({"last_pull_time": pull_time.isoformat()}, f)
-            logger.info(f"SYSTEM | Last pull time saved: {pull_time.isoformat()}")
-    except Exception as e:
-        logger.error(f"SYSTEM | Error saving last pull time: {e}")
+    """Schedule an atomic save of the timestamp of the last successful pull."""
+    future = state_writer.submit(
+        CONFIG["last_pull_time_file"],
+        serialization.dumps({"last_pull_time": pull_time.isoformat()})
+    )
+    logger.info(f"SYSTEM | Last pull time saved: {pull_time.isoformat()}")
+    return future
 
 def clean_html(raw_html):
     # Use BeautifulSoup to remove HTML tags.
@@ -260,7 +1005,7 @@ def getUserType(email):
         token_payload = {"username": "TOKEN"}
         token_headers = {"Content-Type": "application/json"}
         
-        token_response = requests.post(token_url, json=token_payload, headers=token_headers)
+        token_response = requests.post(token_url, data=serialization.dumps(token_payload), headers=token_headers)
         token = token_response.json()
         
         # Step 2: Get user info with token
@@ -271,7 +1016,7 @@ def getUserType(email):
         }
         user_payload = {"emailid": email}
         
-        user_response = requests.post(user_url, json=user_payload, headers=user_headers)
+        user_response = requests.post(user_url, data=serialization.dumps(user_payload), headers=user_headers)
         user_data = user_response.json()
 
         if "Table" in user_data and len(user_data["Table"]) > 0:
@@ -294,7 +1039,7 @@ async def pull_emails_from_talisma_async():
 def pull_emails_from_talisma():
     """
     Retrieve new emails from Talisma database using ODBC connection.
-    Returns a list of email dictionaries.
+    Returns a list of EmailRecords.
     """
     logger.info(f"SYSTEM | Pulling emails from Talisma ({CONFIG['environment']} environment)")
     
@@ -371,15 +1116,15 @@ def pull_emails_from_talisma():
             content=clean_html(mMsgContent)
 
       
-            email_data = {
-                "interaction_id": row_dict.get("aGlobalCaseId",""),
-                "from_email": from_email,
-                "to_email": row_dict.get("tTo", ""),
-                "subject": case_subject,
-                "content": content,
-                "user_type": ""
-            }
-            data.append(email_data)
+            email_record = EmailRecord(
+                interaction_id=interaction_id,
+                from_email=from_email,
+                to_email=row_dict.get("tTo", ""),
+                subject=case_subject,
+                content=content,
+                created_at=created_at.timestamp()
+            )
+            data.append(email_record)
         
         # If successful, update the last pull time
         if len(rows) > 0:
@@ -417,7 +1162,7 @@ def generate_token(username):
     data = {"username": username}
 
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = requests.post(url, data=serialization.dumps(data), headers=headers)
         response.raise_for_status()
         return response.json()  # Assuming the response contains the token in JSON format
     except requests.exceptions.HTTPError as e:
@@ -427,6 +1172,7 @@ def generate_token(username):
     return None
 
 async def sendResponseToMO(response: dict):
+    """Submit the processed output to MO. Returns True on success."""
     interaction_id = response['interaction_id']
     token = await generate_token_async("TOKEN")
     if token:
@@ -438,7 +1184,7 @@ async def sendResponseToMO(response: dict):
         
         # Run this potentially blocking call in a thread pool
         def send_api_request():
-            return requests.post(url, json=response, headers=headers)
+            return requests.post(url, data=serialization.dumps(response), headers=headers)
         
         api_response = await asyncio.get_event_loop().run_in_executor(
             thread_pool, send_api_request
@@ -446,32 +1192,57 @@ async def sendResponseToMO(response: dict):
 
         if api_response.status_code == 200:
             logger.info(f"Interaction id: {interaction_id} | Response sent to MO successfully")
+            return True
         else:
             logger.error(f"Interaction id: {interaction_id} | Failed to send response to MO: Status {api_response.status_code}")
     else:
         logger.error(f"Interaction id: {interaction_id} | Failed to generate token")
+    return False
 
-async def process_single_email(email):
-    """Process a single email."""
+async def process_single_email(email, checkpoints=True):
+    """Process a single email (an EmailRecord with its body loaded).
+    
+    With checkpoints, completed stages are saved so a retry of a queued
+    email resumes after them. Emails that are not in the queue (e.g. from
+    /api/process-email) are never retried and pass checkpoints=False.
+    """
     email_start_time = time.time()
-    interaction_id = email["interaction_id"]
+    interaction_id = email.interaction_id
+    
+    def save_stage(stage, result):
+        if checkpoints:
+            checkpoint_store.save_stage(interaction_id, stage, result)
     
     try:
         logger.info(f"Interaction id: {interaction_id} | Processing started")
+        checkpoint = checkpoint_store.get(interaction_id) if checkpoints else {}
+        if checkpoint:
+            logger.info(f"Interaction id: {interaction_id} | Resuming after completed stages: {', '.join(checkpoint)}")
         # Classify the email
         logger.info(f"Interaction id: {interaction_id} | Sending to classifier")
         category_start_time = time.time()
-        # actual_from_email=from_email.split("\r")[1]
-        actual_from_email=email["from_email"].split("\r")[1]
+        actual_from_email=email.sender
+        cache_keys = []
         # Get user type asynchronously
-        [user_type, ClientId] = await getUserType_async(actual_from_email)
+        if "user_lookup" in checkpoint:
+            user_type = checkpoint["user_lookup"]["user_type"]
+            ClientId = checkpoint["user_lookup"]["client_id"]
+        else:
+            [user_type, ClientId] = await getUserType_async(actual_from_email)
+            if user_type:
+                save_stage("user_lookup", {"user_type": user_type, "client_id": ClientId})
         logger.info(f"Interaction id: {interaction_id} | User Classification: User type: {user_type} | ClientId: {ClientId}")
 
         category={}
 
         if user_type=="nonclient":
             user_type="ba"
-        if not(user_type=="client" or user_type=="ba"):
+        # Queued emails from this sender are now scheduled by their user type's TAT target
+        email_queue.set_user_type(actual_from_email, user_type)
+        if "classification" in checkpoint:
+            email.user_type=checkpoint["classification"]["user_type"]
+            category = checkpoint["classification"]["category"]
+        elif not(user_type=="client" or user_type=="ba"):
             logger.info(f"Interaction id: {interaction_id} | Skipping email from {actual_from_email} - User type is {user_type}")
             category = {
                 "status": "success",
@@ -481,19 +1252,51 @@ async def process_single_email(email):
                 "escalation_reason": f"User is not a client or BA. Current User Type is {user_type}"
             }
         else:
-            email["user_type"]=user_type
-            category = await classifier_agent(
-                email["from_email"], 
-                email["subject"], 
-                email["content"], 
-                email["user_type"]
-            )
+            email.user_type=user_type
+            category = None
+            if CONFIG["rule_classifier_enabled"]:
+                category = rule_classifier.classify(email.sender, email.subject, email.content)
+                if category:
+                    logger.info(f"Interaction id: {interaction_id} | Classified by rule {category['rule']}, skipping classifier agent")
+            if CONFIG["classification_cache_enabled"]:
+                cache_keys = [cache_key(email.subject, email.content_with_context(), email.user_type)]
+                # Near-identical emails in the queue share their category (not drafts) through the cluster's key
+                cluster = email_queue.cluster_of(interaction_id)
+                if cluster is not None and not email.context:
+                    cache_keys.append(f"cluster:{cluster}:{email.user_type}")
+                if category is None:
+                    category = classification_cache.get_category(cache_keys)
+                    if category:
+                        logger.info(f"Interaction id: {interaction_id} | Classification cache hit, skipping classifier agent")
+            if category is None and local_classifier is not None:
+                category = local_classifier.classify(email.subject, email.content_with_context(), email.user_type)
+                if category:
+                    logger.info(f"Interaction id: {interaction_id} | Classified locally as {category['classification']} (confidence {category['confidence']}), skipping classifier agent")
+            if category is None:
+                # Batching adds up to max_wait to each call, so it is only worth it in a backlog
+                if batch_classifier is not None and email_queue.get_length() >= CONFIG["classifier_batch_min_queue_depth"]:
+                    classify = batch_classifier.classify
+                else:
+                    classify = classifier_agent
+                category = await classify(
+                    email.from_email, 
+                    email.subject, 
+                    email.content_with_context(), 
+                    email.user_type
+                )
+                if cache_keys:
+                    classification_cache.put_category(cache_keys, category, time.time() - category_start_time)
 
         classification_time = time.time() - category_start_time
         
         if category.get("status") == "error":
             logger.error(f"Interaction id: {interaction_id} | Classification error: {category.get('error_message')}")
-            return False
+            return {
+                "status": "error",
+                "error": f"Classification failed: {category.get('error_message')}"
+            }
+        if "classification" not in checkpoint:
+            save_stage("classification", {"user_type": email.user_type, "category": category})
 
         # Log classification results
         classification = category.get("classification", "na")
@@ -515,6 +1318,12 @@ async def process_single_email(email):
             }
         }
         
+        # Reuse the draft of an identical templated email when there is one
+        cached_response = None
+        needs_response = not (category["is_spam"] or category["escalation_required"] or category["classification"] == "na")
+        if needs_response and cache_keys and CONFIG["cache_drafts"] and "response" not in checkpoint:
+            cached_response = classification_cache.get_draft(cache_keys[0], category["classification"], ClientId)
+        
         # Handle spam or escalation
         if category["is_spam"]:
             logger.info(f"Interaction id: {interaction_id} | Identified as spam")
@@ -522,43 +1331,58 @@ async def process_single_email(email):
             logger.info(f"Interaction id: {interaction_id} | Requires escalation: {category['escalation_reason']}")
         elif category["classification"] == "na":
             logger.info(f"Interaction id: {interaction_id} | Classification not available")
+        elif "response" in checkpoint:
+            response = checkpoint["response"]
+        elif cached_response is not None:
+            logger.info(f"Interaction id: {interaction_id} | Reusing cached draft, skipping response generation")
+            response = cached_response
+            save_stage("response", response)
         else:
             # Generate response
             response_start_time = time.time()
             logger.info(f"Interaction id: {interaction_id} | Generating response")
-            custom_subject=email['subject']
+            custom_subject=email.subject_with_client_id(ClientId)
             if ClientId != "":
-                custom_subject=f"{email['subject']} - my ClientId is {ClientId}"
                 logger.info(f"Interaction id: {interaction_id} | custom_subject : {custom_subject}")
             
-            response_generator = ResponseGeneratorAgent()
-            
-            response = await response_generator.process_email(
-                
-                email_data = {
-                    "from_email": email["from_email"],
-                    "subject": custom_subject,
-                    "content": email["content"],
-                    "user_type": email["user_type"],
-                    "classification": category["classification"]
-                }
-            )
+            async with response_agents.borrow() as response_generator:
+                response = await response_generator.process_email(
+                    
+                    email_data = {
+                        "from_email": email.from_email,
+                        "subject": custom_subject,
+                        "content": email.content_with_context(),
+                        "user_type": email.user_type,
+                        "classification": category["classification"]
+                    }
+                )
             if response.get("status") == "error":
                 logger.error(f"Interaction id: {interaction_id} | Response error: {response.get('error_message')}")
-                return False
+                return {
+                    "status": "error",
+                    "error": f"Response generation failed: {response.get('error_message')}"
+                }
+            
+            save_stage("response", response)
             
             response_time = time.time() - response_start_time
+            if cache_keys and CONFIG["cache_drafts"]:
+                # Only under the exact content key; a cluster is merely similar emails
+                classification_cache.put_draft(
+                    cache_keys[0], category["classification"], response, ClientId,
+                    f"{email.subject}\n{email.content_with_context()}", response_time
+                )
             logger.info(f"Interaction id: {interaction_id} | Response generated in {response_time:.2f}s")
         
         output = {
-            "interaction_id": email["interaction_id"],
+            "interaction_id": email.interaction_id,
             "body": {
-                "interaction_id": email["interaction_id"],
-                "from_email": email["from_email"],
-                "to_email": email["to_email"],
-                "subject": email["subject"],
-                "body": email["content"],
-                "user_type": email["user_type"],
+                "interaction_id": email.interaction_id,
+                "from_email": email.from_email,
+                "to_email": email.to_email,
+                "subject": email.subject,
+                "body": email.content,
+                "user_type": email.user_type,
                 "classification": category["classification"],
                 "escalation":{
                     "escalation_required": category["escalation_required"],
@@ -596,20 +1420,43 @@ async def process_single_email(email):
             }
         }
         
-        logger.info(f"Interaction id: {interaction_id} | {json.dumps(output['body']['apis_called'], indent=2)}")
+        # Log API names only; the full calls are kept in the output store
+        api_names = [api_call.get("api_name", "na") if isinstance(api_call, dict) else str(api_call) for api_call in output["body"]["apis_called"]]
+        logger.info(f"Interaction id: {interaction_id} | APIs called: {', '.join(api_names) or 'none'}")
 
         # Send response to MO asynchronously
-        await sendResponseToMO(output)
+        if "submitted" not in checkpoint:
+            if not await sendResponseToMO(output):
+                return {
+                    "status": "failed",
+                    "error": "Failed to send response to MO"
+                }
+            save_stage("submitted", True)
         
-        # Save to JSON file - run in thread pool to avoid blocking
-        async def save_output_file():
-            output_file = os.path.join(CONFIG["output_dir"], f"{email['interaction_id']}.json")
-            def save_file():
-                with open(output_file, "w") as f:
-                    json.dump(output, f, indent=2)
-            await asyncio.get_event_loop().run_in_executor(thread_pool, save_file)
+        # Record where the category came from (the local classifier only
+        # trains on classifier_agent results) and the earlier interactions
+        # this response also covers
+        if category.get("rule"):
+            classified_by = f"rule:{category['rule']}"
+        elif category.get("model") == "local":
+            classified_by = "local_classifier"
+        elif category.get("cached"):
+            classified_by = "classification_cache"
+        elif email.user_type in ("client", "ba"):
+            classified_by = "classifier_agent"
+        else:
+            classified_by = "user_type"
+        stored_output = {**output, "classified_by": classified_by}
+        if email.coalesced_ids or email.context:
+            stored_output["thread"] = {
+                "coalesced_interaction_ids": email.coalesced_ids,
+                "context": email.context
+            }
         
-        await save_output_file()
+        # Save to the output store - run in thread pool to avoid blocking
+        await asyncio.get_event_loop().run_in_executor(thread_pool, output_store.put, stored_output)
+        if checkpoints:
+            checkpoint_store.clear(interaction_id)
         
         # Log processing summary
         email_processing_time = time.time() - email_start_time
@@ -623,7 +1470,8 @@ async def process_single_email(email):
     except Exception as e:
         logger.error(f"Interaction id: {interaction_id} | Processing failed: {str(e)}")
         return {
-            "status":"failed"
+            "status":"failed",
+            "error": str(e)
         }
 
 async def process_email_batch():
@@ -642,35 +1490,51 @@ async def process_email_batch():
     logger.info(f"SYSTEM | Processing batch of {len(batch)} emails from queue")
     
     # Filter out already processed emails
-    new_emails = [email for email in batch if email["interaction_id"] not in processed_email_ids]
+    new_emails = [email for email in batch if email.interaction_id not in processed_email_ids]
     skipped_count = len(batch) - len(new_emails)
     
     if skipped_count > 0:
         logger.info(f"SYSTEM | Skipped {skipped_count} already processed emails")
+        # Remove emails from this batch that were already processed
+        email_queue.remove_emails([email.interaction_id for email in batch if email.interaction_id in processed_email_ids])
     
     if not new_emails:
-        # Remove all emails in this batch from queue since they're already processed
-        email_queue.remove_emails([email["interaction_id"] for email in batch])
         return
     
-    # Process emails concurrently
-    tasks = [process_single_email(email) for email in new_emails]
-    results = await asyncio.gather(*tasks)
-    
-    # Identify successfully processed emails
-    successful_ids = [email["interaction_id"] for email, result in zip(new_emails, results) if isinstance(result, dict) and result.get("status")=="success"]
+    # Load subject and content from the body store just before processing
+    loaded = await asyncio.get_event_loop().run_in_executor(
+        thread_pool, email_queue.load_bodies, new_emails
+    )
+    missing_ids = [email.interaction_id for email, full in zip(new_emails, loaded) if full is None]
+    if missing_ids:
+        email_queue.mark_failed(missing_ids, "Email body missing from body store")
+    new_emails = [full for full in loaded if full is not None]
     
-    # Update processed emails list
-    if successful_ids:
-        processed_email_ids.extend(successful_ids)
-        save_processed_emails(processed_email_ids)
+    async def process_and_commit(email):
+        try:
+            result = await process_single_email(email)
+        except Exception as e:
+            logger.error(f"Interaction id: {email.interaction_id} | Unexpected error while processing: {e}")
+            result = {"status": "error", "error": str(e)}
+        if isinstance(result, dict) and result.get("status") == "success":
+            # Commit right away so a crash later in the batch does not redo this email
+            try:
+                await ack_committer.ack(email.interaction_id, email.coalesced_ids)
+                return result
+            except Exception as e:
+                logger.error(f"Interaction id: {email.interaction_id} | Could not commit processed email: {e}")
+                result = {**result, "status": "error", "error": f"Commit failed: {e}"}
+        # Schedule a retry (or dead-letter) for the failed email so it does not stay leased
+        error = result.get("error") if isinstance(result, dict) else None
+        email_queue.mark_failed([email.interaction_id], error)
+        return result
     
-    # Remove processed emails from queue
-    removed_count = email_queue.remove_emails(successful_ids)
-    logger.info(f"SYSTEM | Removed {removed_count} successfully processed emails from queue")
+    # Process emails concurrently; one failure must not lose the other results
+    tasks = [process_and_commit(email) for email in new_emails]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
     
     # Log summary
-    success_count = len(successful_ids)
+    success_count = sum(1 for result in results if isinstance(result, dict) and result.get("status") == "success")
     failure_count = len(new_emails) - success_count
     logger.info(f"SYSTEM | Batch processing summary: {success_count} succeeded, {failure_count} failed, {skipped_count} skipped")
 
@@ -685,7 +1549,9 @@ async def pull_emails_task():
         
         # Add emails to queue
         if emails:
-            added_count = email_queue.add_emails(emails)
+            added_count = await asyncio.get_event_loop().run_in_executor(
+                thread_pool, email_queue.add_emails, emails
+            )
             logger.info(f"SYSTEM | Added {added_count} new emails to queue")
         
         logger.info(f"SYSTEM | Current queue size: {email_queue.get_length()} emails")
@@ -717,8 +1583,8 @@ async def queue_processor_task():
 
 async def api_process_single_email(email_data):
     """Process a single email received via API."""
-    # Add email to queue
-    added = await process_single_email(email_data)
+    # Processed right away rather than queued, so there is no retry to checkpoint for
+    added = await process_single_email(email_data, checkpoints=False)
     return added
 
 async def scheduler_loop():
@@ -743,9 +1609,20 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize everything when the FastAPI app starts
     logger.info("SYSTEM | Application starting")
     
+    # Load the processed list off the event loop
+    await asyncio.get_event_loop().run_in_executor(thread_pool, load_processed_emails)
+    
+    # Build the response agents now rather than on the first emails; any
+    # that fail here are built on first use instead
+    try:
+        await response_agents.fill()
+    except Exception as e:
+        logger.error(f"SYSTEM | Could not pre-build response agents: {e}")
+    
     # Start the background tasks
     task1 = asyncio.create_task(scheduler_loop())
     task2 = asyncio.create_task(queue_processor_task())
+    task3 = asyncio.create_task(loop_lag_monitor.run())
     
     logger.info("SYSTEM | Application initialized successfully")
     
@@ -757,6 +1634,13 @@ async def lifespan(app: FastAPI):
         # Cancel background tasks
         task1.cancel()
         task2.cancel()
+        task3.cancel()
+        # Let the cancelled tasks unwind so their last saves reach the writer
+        await asyncio.gather(task1, task2, task3, return_exceptions=True)
+        # Write out any pending state before exiting
+        await asyncio.get_event_loop().run_in_executor(None, state_writer.close)
+        output_store.close()
+        email_bodies.close()
         # Close thread pool
         thread_pool.shutdown(wait=False)
         logger.info("SYSTEM | Background tasks and resources cleaned up")
@@ -798,18 +1682,11 @@ async def api_process_email(email_data: EmailData):
     """
     logger.info(f"API | Received request to process email {email_data.interaction_id}")
     
-    # Convert Pydantic model to dict
-    email_dict = {
-        "interaction_id": email_data.interaction_id,
-        "from_email": email_data.from_email,
-        "to_email": email_data.to_email,
-        "subject": email_data.subject,
-        "content": email_data.content,
-        "user_type": email_data.user_type
-    }
+    # Convert Pydantic model to an EmailRecord
+    email_record = EmailRecord.from_api(email_data)
     
     # Add email to processing queue
-    result = await api_process_single_email(email_dict)
+    result = await api_process_single_email(email_record)
     return result
 
 # Queue status endpoint
@@ -818,15 +1695,124 @@ async def queue_status():
     """
     Get the current status of the email processing queue
     
-    Returns the number of emails currently in the queue
+    Returns the number of emails currently in the queue and how many of
+    them are due, backing off, in progress or past their TAT deadline
     """
     queue_length = email_queue.get_length()
     return {
         "status": "active",
         "queue_size": queue_length,
+        "dead_letter_size": email_queue.get_dead_letter_length(),
+        "schedule": email_queue.get_schedule_stats(),
+        "near_duplicates": email_queue.get_near_duplicate_stats(),
         "max_concurrent_processing": CONFIG["max_concurrent_emails"]
     }
 
+# Dead-letter inspection endpoint
+@app.get("/api/dead-letters", tags=["Queue Management"])
+async def list_dead_letters():
+    """
+    List emails that exhausted their retry budget
+    
+    Returns each dead-lettered email with its attempt count and last error
+    """
+    dead_letters = email_queue.get_dead_letters()
+    return {
+        "count": len(dead_letters),
+        "emails": dead_letters
+    }
+
+# Dead-letter requeue endpoint
+@app.post("/api/dead-letters/requeue", tags=["Queue Management"])
+async def requeue_dead_letters(interaction_ids: Optional[List[str]] = None):
+    """
+    Move dead-lettered emails back into the processing queue
+    
+    Requeues the given interaction ids, or every dead letter when none are given.
+    """
+    requeued = email_queue.requeue_dead_letters(interaction_ids)
+    logger.info(f"API | Requeued {len(requeued)} dead-lettered emails")
+    return {
+        "requeued_count": len(requeued),
+        "requeued": requeued
+    }
+
+# Processed output query endpoint
+@app.get("/api/outputs", tags=["Outputs"])
+async def query_outputs(
+    classification: Optional[str] = None,
+    is_spam: Optional[bool] = None,
+    escalation_required: Optional[bool] = None,
+    user_type: Optional[str] = None,
+    api_name: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: int = 50
+):
+    """
+    Search processed outputs
+    
+    Filters are served from the output store's indexes and only summary
+    fields are returned; fetch /api/outputs/{interaction_id} for the full
+    record. Pass next_cursor as cursor to get the next page.
+    """
+    limit = max(1, min(limit, 500))
+    items, next_cursor = await asyncio.get_event_loop().run_in_executor(
+        thread_pool,
+        lambda: output_store.query(
+            classification=classification,
+            is_spam=is_spam,
+            escalation_required=escalation_required,
+            user_type=user_type,
+            api_name=api_name,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit
+        )
+    )
+    return {
+        "count": len(items),
+        "items": items,
+        "next_cursor": next_cursor
+    }
+
+# Processed output lookup endpoint
+@app.get("/api/outputs/{interaction_id}", tags=["Outputs"])
+async def get_output(interaction_id: str):
+    """
+    Get the stored output of a processed interaction
+    
+    Returns the output record, or 404 if the interaction has not been processed
+    """
+    output = await asyncio.get_event_loop().run_in_executor(
+        thread_pool, output_store.get, interaction_id
+    )
+    if output is None:
+        raise HTTPException(status_code=404, detail=f"No output found for interaction {interaction_id}")
+    return output
+
+# Runtime metrics endpoint
+@app.get("/api/metrics", tags=["Health"])
+async def metrics():
+    """
+    Runtime metrics
+    
+    Returns event-loop lag, state writer and pre-classifier statistics
+    """
+    return {
+        "event_loop_lag": loop_lag_monitor.get_stats(),
+        "state_writer": state_writer.get_stats(),
+        "rule_classifier": rule_classifier.get_stats(),
+        "local_classifier": local_classifier.get_stats() if local_classifier is not None else None,
+        "classification_cache": classification_cache.get_stats(),
+        "batch_classifier": batch_classifier.get_stats() if batch_classifier is not None else None,
+        "response_agents": response_agents.get_stats(),
+        "closure_validation": closure_validation_cache.get_stats(),
+        "serializer": serialization.BACKEND
+    }
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -840,7 +1826,8 @@ async def health_check():
         "environment": CONFIG["environment"],
         "poll_interval": f"{CONFIG['poll_interval_minutes']} minutes",
         "queue_size": email_queue.get_length(),
-        "max_concurrent": CONFIG["max_concurrent_emails"]
+        "max_concurrent": CONFIG["max_concurrent_emails"],
+        "event_loop_lag_ms": loop_lag_monitor.get_stats()["last_lag_ms"]
     }
 
 # Main entry point
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+
+logger = logging.getLogger("talisma_processor")
+
+
+class AckCommitter:
+    """Commit completed emails as soon as they finish processing.
+
+    Acks arriving within window_seconds of each other are grouped into a
+    single call of commit(interaction_ids), run in the executor, so a burst
+    of completions does not turn into one write per email. barrier() is
+    then awaited (a concurrent.futures.Future that resolves once earlier
+    writes are on disk) before the acks return. Acks that arrive while a
+    group is being committed go into the next group of the same flush task.
+    """
+    def __init__(self, window_seconds, commit, barrier=None, executor=None):
+        self.window_seconds = window_seconds
+        self.commit = commit
+        self.barrier = barrier
+        self.executor = executor
+        self.pending = []
+        self.flush_task = None
+
+    async def ack(self, interaction_id, coalesced_ids=()):
+        """Mark an email (and the emails coalesced into it) as processed.
+
+        Returns once the commit is on disk.
+        """
+        loop = asyncio.get_event_loop()
+        committed = loop.create_future()
+        self.pending.append(([interaction_id, *coalesced_ids], committed))
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._flush_later())
+        await committed
+
+    async def flush(self):
+        """Wait for any scheduled group commit to finish."""
+        if self.flush_task is not None:
+            await self.flush_task
+
+    async def _flush_later(self):
+        # Keep committing until no acks are left, including ones added mid-commit
+        while self.pending:
+            await asyncio.sleep(self.window_seconds)
+            pending, self.pending = self.pending, []
+            await self._commit_group(pending)
+
+    async def _commit_group(self, pending):
+        interaction_ids = [interaction_id for ids, _ in pending for interaction_id in ids]
+        try:
+            await asyncio.get_event_loop().run_in_executor(self.executor, self.commit, interaction_ids)
+            if self.barrier is not None:
+                await asyncio.wrap_future(self.barrier())
+            for _, committed in pending:
+                if not committed.done():
+                    committed.set_result(True)
+        except Exception as e:
+            logger.error(f"SYSTEM | Error committing processed emails: {e}")
+            for _, committed in pending:
+                if not committed.done():
+                    committed.set_exception(e)
@@ -0,0 +1,67 @@
+import re
+
+# Reply and forward prefixes added by mail clients ("Re:", "FW:", "Fwd[2]:", "AW:", ...)
+REPLY_PREFIX = re.compile(r"^\s*(?:(?:re|fw|fwd|aw|sv|wg)\s*(?:\[\d+\])?\s*:\s*)+", re.IGNORECASE)
+
+# Subjects this short ("Hi", "Query") say nothing about which thread an email belongs to
+MIN_SUBJECT_LENGTH = 6
+
+
+def normalize_subject(subject):
+    """Subject without reply/forward prefixes, lowercased and with collapsed whitespace."""
+    subject = REPLY_PREFIX.sub("", subject or "")
+    return " ".join(subject.lower().split())
+
+
+def subject_thread_key(record):
+    """Thread identity of an email from its sender and normalized subject.
+
+    Catches follow-ups that Talisma opened as a new case. Returns None when
+    the subject is too generic to identify a thread.
+    """
+    subject = normalize_subject(record.subject)
+    if len(subject) < MIN_SUBJECT_LENGTH or not record.sender:
+        return None
+    return f"{record.sender.lower()}|{subject}"
+
+
+def is_repull(queued, record):
+    """Whether record is a message queued already holds (Talisma returned it again).
+
+    True when both share an interaction id and record's subject and content
+    equal the queued email's own, or those of an earlier message of the
+    same case in its context.
+    """
+    if queued.interaction_id != record.interaction_id:
+        return False
+    if (queued.subject, queued.content) == (record.subject, record.content):
+        return True
+    return any(
+        message.get("interaction_id") == record.interaction_id
+        and (message.get("subject"), message.get("content")) == (record.subject, record.content)
+        for message in queued.context
+    )
+
+
+def coalesce(first, second, max_context=5):
+    """Merge two pending emails of one thread into the one to process.
+
+    The later email (by created_at, then enqueue time) survives with the
+    earlier one, and anything it had already absorbed, as context. Both
+    records must have their bodies loaded. Returns (survivor, superseded).
+    The survivor keeps the superseded interaction id in coalesced_ids
+    unless both share an id (a follow-up on the same case).
+    """
+    def arrival(record):
+        return (record.created_at or record.enqueued_at, record.enqueued_at)
+
+    older, newer = (first, second) if arrival(first) <= arrival(second) else (second, first)
+    survivor = newer.copy()
+    context = older.context + [older.message()] + newer.context
+    survivor.set_body(newer.subject, newer.content, context[-max_context:] if max_context else [])
+
+    coalesced_ids = [i for i in older.coalesced_ids + newer.coalesced_ids if i != survivor.interaction_id]
+    if older.interaction_id != survivor.interaction_id:
+        coalesced_ids.append(older.interaction_id)
+    survivor.coalesced_ids = list(dict.fromkeys(coalesced_ids))
+    return survivor, older
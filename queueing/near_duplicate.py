@@ -0,0 +1,225 @@
+import re
+import time
+import zlib
+import random
+import argparse
+import tracemalloc
+from array import array
+
+NUMBER = re.compile(r"\d+")
+# Everything but letters, "#" (masked numbers) and "@" (masked addresses) separates words
+SEPARATORS = str.maketrans({chr(i): " " for i in range(128) if not chr(i).isalpha() and chr(i) not in "#@"})
+
+EMPTY_BIN = 0xFFFFFFFF
+
+
+def shingles(subject, content, max_chars=2000, size=3):
+    """Word 3-grams of the subject and start of the content, numbers and addresses masked."""
+    text = f"{subject or ''}\n{(content or '')[:max_chars]}".lower()
+    if "@" in text:
+        text = " ".join("@" if "@" in word else word for word in text.split())
+    words = NUMBER.sub(" # ", text).translate(SEPARATORS).split()
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return set(map(" ".join, zip(*(words[i:] for i in range(size)))))
+
+
+def minhash(tokens, num_perm=64):
+    """MinHash signature using one permutation hashing with rotation densification.
+
+    Each token is hashed once; the low bits pick one of num_perm bins and
+    the rest is the value whose minimum the bin keeps. Empty bins borrow
+    the value of the next non-empty bin, offset by the distance, so the
+    fraction of equal positions of two signatures still estimates the
+    Jaccard similarity of their token sets. One hash per token instead of
+    num_perm keeps this fast enough to run on every enqueued email.
+    """
+    bits = num_perm.bit_length() - 1
+    mask = num_perm - 1
+    bins = [EMPTY_BIN] * num_perm
+    for token in tokens:
+        h = zlib.crc32(token.encode("utf-8"))
+        index = h & mask
+        value = h >> bits
+        if value < bins[index]:
+            bins[index] = value
+    if EMPTY_BIN in bins and len(tokens):
+        # Walk right to left twice so every empty bin sees the nearest filled one to its right
+        densified = list(bins)
+        source = None
+        for i in range(2 * num_perm - 1, -1, -1):
+            position = i % num_perm
+            if bins[position] != EMPTY_BIN:
+                source = i
+            elif source is not None and densified[position] == EMPTY_BIN:
+                distance = source - i
+                densified[position] = (bins[source % num_perm] + distance * 0x9E3779B1) & 0xFFFFFFFE
+        bins = densified
+    return array("I", bins)
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class NearDuplicateIndex:
+    """LSH index over the MinHash signatures of pending emails.
+
+    Signatures are split into bands; emails sharing any band are
+    candidates, and a candidate whose estimated similarity reaches the
+    threshold puts the new email in its cluster. Emails that differ only
+    in client codes, greetings or signatures therefore end up in one
+    cluster, and a classification or draft produced for one member can be
+    reused for the others. Candidates checked per email are capped, so a
+    flood of near-identical emails does not make inserts linear.
+
+    With 64 bins in 16 bands of 4, pairs at 0.7 similarity are found 99%
+    of the time and pairs at 0.3 rarely become candidates. The index costs
+    about 2 KB per email (`python -m queueing.near_duplicate` measures
+    time and memory at a 100k backlog). Not thread-safe; EmailQueue calls
+    it under its own lock.
+    """
+    def __init__(self, num_perm=64, bands=16, threshold=0.7, max_candidates=32, max_chars=2000):
+        if num_perm & (num_perm - 1) or num_perm % bands:
+            raise ValueError("num_perm must be a power of two and divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.max_chars = max_chars
+        # One dict per band: band hash -> interaction id, or a set of ids when shared
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+        self.clusters = {}
+        self.cluster_sizes = {}
+
+    def signature(self, subject, content):
+        return minhash(shingles(subject, content, self.max_chars), self.num_perm)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [hash(signature[i * rows:(i + 1) * rows].tobytes()) for i in range(self.bands)]
+
+    def query(self, signature, exclude=None):
+        """Most similar indexed email at or above the threshold, as (interaction_id, similarity)."""
+        checked = set()
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members is None:
+                continue
+            for candidate in (members if isinstance(members, set) else (members,)):
+                if candidate == exclude or candidate in checked:
+                    continue
+                checked.add(candidate)
+                score = similarity(signature, self.signatures[candidate])
+                if score >= self.threshold:
+                    return candidate, score
+                if len(checked) >= self.max_candidates:
+                    return None, 0.0
+        return None, 0.0
+
+    def add(self, interaction_id, signature):
+        """Index an email and return the id of the cluster it joined."""
+        if interaction_id in self.signatures:
+            self.remove(interaction_id)
+        match, _ = self.query(signature)
+        cluster = self.clusters[match] if match is not None else interaction_id
+        self.signatures[interaction_id] = signature
+        self.clusters[interaction_id] = cluster
+        self.cluster_sizes[cluster] = self.cluster_sizes.get(cluster, 0) + 1
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members is None:
+                bucket[key] = interaction_id
+            elif isinstance(members, set):
+                members.add(interaction_id)
+            else:
+                bucket[key] = {members, interaction_id}
+        return cluster
+
+    def remove(self, interaction_id):
+        """Drop an email from the index."""
+        signature = self.signatures.pop(interaction_id, None)
+        if signature is None:
+            return
+        cluster = self.clusters.pop(interaction_id)
+        self.cluster_sizes[cluster] -= 1
+        if not self.cluster_sizes[cluster]:
+            del self.cluster_sizes[cluster]
+        for bucket, key in zip(self.buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if isinstance(members, set):
+                members.discard(interaction_id)
+                if len(members) == 1:
+                    bucket[key] = next(iter(members))
+            elif members == interaction_id:
+                del bucket[key]
+
+    def cluster_of(self, interaction_id):
+        """Cluster id of an indexed email, or None."""
+        return self.clusters.get(interaction_id)
+
+    def get_stats(self):
+        """Indexed emails, multi-email clusters and the largest cluster."""
+        shared = [size for size in self.cluster_sizes.values() if size > 1]
+        return {
+            "indexed": len(self.signatures),
+            "clusters": len(shared),
+            "clustered_emails": sum(shared),
+            "largest_cluster": max(shared, default=0)
+        }
+
+
+def index_memory(signatures):
+    """Bytes allocated while indexing the given signatures."""
+    index = NearDuplicateIndex()
+    tracemalloc.start()
+    for i, signature in enumerate(signatures):
+        index.add(i, array("I", signature))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def benchmark(backlog=100000, templates=2000, seed=7):
+    """Time add() and query() per email on a synthetic templated backlog."""
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+    bodies = [" ".join(rng.choice(vocabulary) for _ in range(80)) for _ in range(templates)]
+    greetings = ["Dear Sir", "Hi team", "Hello", "Respected Sir/Madam"]
+    signatures = ["Regards", "Thanks and regards", "Sent from my phone", "Warm regards"]
+
+    def email(i):
+        body = rng.choice(bodies)
+        return f"Query {i % templates}", f"{rng.choice(greetings)}, my client code is X{rng.randint(10000, 99999)}. {body} {rng.choice(signatures)}"
+
+    emails = [email(i) for i in range(backlog)]
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    computed = [index.signature(subject, content) for subject, content in emails]
+    signature_us = (time.perf_counter() - start) / backlog * 1e6
+    start = time.perf_counter()
+    for i, signature in enumerate(computed):
+        index.add(i, signature)
+    add_us = (time.perf_counter() - start) / backlog * 1e6
+    probes = [index.signature(*email(i)) for i in range(1000)]
+    start = time.perf_counter()
+    found = sum(1 for signature in probes if index.query(signature)[0] is not None)
+    query_us = (time.perf_counter() - start) / len(probes) * 1e6
+
+    print(f"Backlog of {backlog} emails from {templates} templates")
+    print(f"  signature: {signature_us:.1f} us/email")
+    print(f"  add:       {add_us:.1f} us/email")
+    print(f"  query:     {query_us:.1f} us/email ({found / len(probes):.0%} of new near-duplicates found)")
+    print(f"  memory:    {index_memory(computed[:10000]) / 1e6 * backlog / 10000:.0f} MB for the index (extrapolated)")
+    print(f"  {index.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the near-duplicate index")
+    parser.add_argument("--backlog", type=int, default=100000)
+    parser.add_argument("--templates", type=int, default=2000)
+    args = parser.parse_args()
+    benchmark(args.backlog, args.templates)
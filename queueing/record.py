@@ -0,0 +1,264 @@
+import time
+
+
+def parse_sender(from_email):
+    """Extract the sender address from Talisma's tFrom value.
+
+    tFrom holds the display name and the address separated by a carriage
+    return ("Name\\raddress"). Values without a separator (e.g. emails
+    submitted through the API) are taken as the address itself.
+    """
+    parts = from_email.split("\r")
+    if len(parts) > 1:
+        return parts[1].strip()
+    return from_email.strip()
+
+
+def content_with_context(content, context):
+    """Content followed by the earlier messages of its thread (as stored in EmailRecord.context)."""
+    if not context:
+        return content
+    earlier = "\n\n".join(
+        f"Subject: {message.get('subject', '')}\n{message.get('content', '')}" for message in context
+    )
+    return f"{content}\n\n--- Earlier messages on this case (oldest first) ---\n{earlier}"
+
+
+class EmailRecord:
+    """One email as it moves from Talisma through the queue to processing.
+
+    Uses __slots__ so a queued email costs a fixed, small object instead
+    of a dict, and parses the sender address once at creation. Subject
+    and content are optional: queued records only carry metadata, and the
+    body is attached with set_body() (or fetched through body_loader on
+    first access) right before processing.
+    """
+    __slots__ = (
+        "interaction_id",
+        "from_email",
+        "sender",
+        "to_email",
+        "user_type",
+        "created_at",
+        "enqueued_at",
+        "subject_size",
+        "content_size",
+        "attempts",
+        "next_attempt_at",
+        "last_attempt_at",
+        "last_error",
+        "dead_lettered_at",
+        "thread_key",
+        "coalesced_ids",
+        "_subject",
+        "_content",
+        "_context",
+        "body_loader"
+    )
+
+    # Metadata written to the queue file, in order
+    METADATA_FIELDS = (
+        "interaction_id",
+        "from_email",
+        "to_email",
+        "user_type",
+        "created_at",
+        "enqueued_at",
+        "subject_size",
+        "content_size",
+        "attempts",
+        "next_attempt_at",
+        "last_attempt_at",
+        "last_error",
+        "dead_lettered_at",
+        "thread_key",
+        "coalesced_ids"
+    )
+
+    def __init__(self, interaction_id, from_email, to_email="", subject=None, content=None,
+                 user_type="", created_at=None, enqueued_at=None, subject_size=None, content_size=None,
+                 attempts=0, next_attempt_at=0, last_attempt_at=None, last_error=None,
+                 dead_lettered_at=None, thread_key=None, coalesced_ids=None, context=None,
+                 body_loader=None):
+        self.interaction_id = interaction_id
+        self.from_email = from_email
+        self.sender = parse_sender(from_email)
+        self.to_email = to_email
+        self.user_type = user_type
+        self.created_at = created_at
+        self.enqueued_at = enqueued_at if enqueued_at is not None else time.time()
+        self.attempts = attempts
+        self.next_attempt_at = next_attempt_at
+        self.last_attempt_at = last_attempt_at
+        self.last_error = last_error
+        self.dead_lettered_at = dead_lettered_at
+        self.thread_key = thread_key
+        self.coalesced_ids = coalesced_ids or []
+        self.body_loader = body_loader
+        self._subject = None
+        self._content = None
+        self._context = None
+        self.subject_size = subject_size or 0
+        self.content_size = content_size or 0
+        if subject is not None or content is not None:
+            self.set_body(subject or "", content or "", context)
+
+    @property
+    def has_body(self):
+        return self._content is not None
+
+    @property
+    def subject(self):
+        if self._subject is None:
+            self._load_body()
+        return self._subject
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._load_body()
+        return self._content
+
+    @property
+    def context(self):
+        """Earlier messages of the same thread that this email superseded, oldest first."""
+        if self._content is None:
+            self._load_body()
+        return self._context or []
+
+    def set_body(self, subject, content, context=None):
+        """Attach subject, content and thread context (and record their sizes)."""
+        self._subject = subject
+        self._content = content
+        self._context = context or None
+        self.subject_size = len(subject)
+        self.content_size = len(content) + sum(len(message.get("content", "")) for message in context or ())
+
+    def drop_body(self):
+        """Release subject, content and context; they can be reloaded through body_loader."""
+        self._subject = None
+        self._content = None
+        self._context = None
+
+    def body(self):
+        """Subject, content and context as the document stored in the body store."""
+        body = {"subject": self.subject, "content": self.content}
+        if self.context:
+            body["context"] = self.context
+        return body
+
+    def message(self):
+        """This email as an entry of another email's thread context."""
+        return {
+            "interaction_id": self.interaction_id,
+            "created_at": self.created_at,
+            "subject": self.subject,
+            "content": self.content
+        }
+
+    def content_with_context(self):
+        """Content followed by the earlier messages of the thread, for the classifier and responder."""
+        return content_with_context(self.content, self.context)
+
+    def _load_body(self):
+        if self.body_loader is None:
+            raise ValueError(f"Body of interaction {self.interaction_id} is not loaded")
+        body = self.body_loader(self.interaction_id)
+        if body is None:
+            raise ValueError(f"Body of interaction {self.interaction_id} is missing")
+        self.set_body(body.get("subject", ""), body.get("content", ""), body.get("context"))
+
+    def subject_with_client_id(self, client_id):
+        """Subject passed to the response generator, tagged with the client id when known."""
+        if client_id:
+            return f"{self.subject} - my ClientId is {client_id}"
+        return self.subject
+
+    def copy(self):
+        """Shallow copy sharing the loaded body."""
+        clone = EmailRecord.__new__(EmailRecord)
+        for slot in self.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        return clone
+
+    def record_failure(self, error, now, max_attempts, base_delay, max_delay):
+        """Count a failed attempt and schedule the retry.
+
+        The delay doubles with every attempt, capped at max_delay. Returns
+        the delay, or None once max_attempts is reached and the email
+        should go to the dead-letter store.
+        """
+        self.attempts += 1
+        self.last_error = error or "Processing failed"
+        self.last_attempt_at = now
+        if self.attempts >= max_attempts:
+            self.next_attempt_at = 0
+            self.dead_lettered_at = now
+            return None
+        delay = min(base_delay * (2 ** (self.attempts - 1)), max_delay)
+        self.next_attempt_at = now + delay
+        return delay
+
+    def reset_retries(self):
+        """Give a dead-lettered email a fresh retry budget."""
+        self.attempts = 0
+        self.next_attempt_at = 0
+        self.dead_lettered_at = None
+
+    def to_dict(self, include_body=False):
+        """Metadata (and optionally subject and content) as a JSON-ready dict."""
+        data = {field: getattr(self, field) for field in self.METADATA_FIELDS}
+        if include_body:
+            data.update(self.body())
+        return data
+
+    @classmethod
+    def from_dict(cls, data, body_loader=None):
+        """Build a record from to_dict() output or a legacy queue entry."""
+        return cls(
+            interaction_id=data["interaction_id"],
+            from_email=data.get("from_email", ""),
+            to_email=data.get("to_email", ""),
+            subject=data.get("subject"),
+            content=data.get("content"),
+            user_type=data.get("user_type", ""),
+            created_at=data.get("created_at"),
+            enqueued_at=data.get("enqueued_at"),
+            subject_size=data.get("subject_size"),
+            content_size=data.get("content_size"),
+            attempts=data.get("attempts", 0),
+            next_attempt_at=data.get("next_attempt_at", 0),
+            last_attempt_at=data.get("last_attempt_at"),
+            last_error=data.get("last_error"),
+            dead_lettered_at=data.get("dead_lettered_at"),
+            thread_key=data.get("thread_key"),
+            coalesced_ids=data.get("coalesced_ids"),
+            context=data.get("context"),
+            body_loader=body_loader
+        )
+
+    @classmethod
+    def from_api(cls, email_data):
+        """Build a record from the EmailData API model."""
+        return cls(
+            interaction_id=email_data.interaction_id,
+            from_email=email_data.from_email,
+            to_email=email_data.to_email,
+            subject=email_data.subject,
+            content=email_data.content,
+            user_type=email_data.user_type
+        )
+
+    def to_api(self):
+        """Fields of the EmailData API model."""
+        return {
+            "interaction_id": self.interaction_id,
+            "from_email": self.from_email,
+            "to_email": self.to_email,
+            "subject": self.subject,
+            "content": self.content,
+            "user_type": self.user_type
+        }
+
+    def __repr__(self):
+        return f"EmailRecord(interaction_id={self.interaction_id!r}, sender={self.sender!r})"
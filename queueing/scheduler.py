@@ -0,0 +1,338 @@
+import heapq
+import itertools
+import time
+from collections import deque
+
+
+def parse_mapping(value, cast=float):
+    """Parse "key=value,key=value" (as used in env vars) into a dict."""
+    mapping = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        key, raw = item.split("=", 1)
+        key = key.strip().lower()
+        if key:
+            mapping[key] = cast(raw.strip())
+    return mapping
+
+
+def parse_list(value):
+    """Parse a comma separated env var into a list of lowercase entries."""
+    return [item.strip().lower() for item in (value or "").split(",") if item.strip()]
+
+
+class PriorityPolicy:
+    """Decides how urgent a queued email is.
+
+    Every email is put in a category and gets a deadline of its creation
+    time plus the category's TAT target. Categories are checked in order:
+
+    - "bulk" when the sender's mailbox looks automated (noreply,
+      newsletter, ...), so newsletters and bulk mails sort last
+    - "priority" when the sender's domain is listed in priority_domains
+    - the email's user_type (client, ba, ...) when it is already known;
+      it is only looked up during processing, so the queue re-keys a
+      sender's waiting emails once the first of them has been looked up
+    - "default" otherwise
+
+    Scheduling by earliest deadline is also the aging rule: a deadline is
+    fixed when the email arrives, and new arrivals always get a deadline of
+    at least now plus the smallest TAT target, so every waiting email ends
+    up ahead of all newer ones and nothing starves.
+    """
+    def __init__(self, tat_targets_minutes, priority_domains=(), bulk_patterns=()):
+        self.tat_targets = {category: minutes * 60 for category, minutes in tat_targets_minutes.items()}
+        self.default_tat = self.tat_targets.get("default", 8 * 3600)
+        self.priority_domains = set(priority_domains)
+        self.bulk_patterns = tuple(bulk_patterns)
+
+    def category(self, record):
+        """Category whose TAT target applies to the record."""
+        sender = (record.sender or "").lower()
+        mailbox, _, domain = sender.partition("@")
+        if any(pattern in mailbox for pattern in self.bulk_patterns):
+            return "bulk"
+        if domain in self.priority_domains:
+            return "priority"
+        user_type = (record.user_type or "").lower()
+        if user_type in self.tat_targets:
+            return user_type
+        return "default"
+
+    def deadline(self, record):
+        """Time (epoch seconds) by which the record should be answered."""
+        arrived = record.created_at or record.enqueued_at
+        return arrived + self.tat_targets.get(self.category(record), self.default_tat)
+
+
+class DeadlineScheduler:
+    """Earliest-deadline-first index over the queued emails.
+
+    Emails that are due sit in a heap ordered by deadline; emails waiting
+    out a retry backoff sit in a second heap ordered by next_attempt_at
+    and move over once due, so picking the next email is O(log n) no
+    matter how many are queued or backing off. Removed or rescheduled
+    emails are dropped lazily when they surface at the top of a heap.
+
+    Emails handed out by pop_due() are leased: they are not handed out
+    again until they are removed, rescheduled with push(), or the lease
+    expires (e.g. the processing task died).
+
+    Not thread-safe; EmailQueue calls it under its own lock.
+    """
+    def __init__(self, policy, lease_seconds=900):
+        self.policy = policy
+        self.lease_seconds = lease_seconds
+        self.ready = []
+        self.delayed = []
+        self.entries = {}
+        self.leases = {}
+        self.counter = itertools.count()
+
+    def push(self, record):
+        """Schedule (or reschedule) a record according to its deadline and next_attempt_at."""
+        interaction_id = record.interaction_id
+        self._end_lease(interaction_id)
+        seq = next(self.counter)
+        deadline = self.policy.deadline(record)
+        self.entries[interaction_id] = seq
+        if record.next_attempt_at > time.time():
+            heapq.heappush(self.delayed, (record.next_attempt_at, seq, deadline, record))
+        else:
+            self._push_ready(deadline, seq, record)
+
+    def is_leased(self, interaction_id):
+        """Whether the record was handed out and has not been removed or rescheduled yet."""
+        return interaction_id in self.leases
+
+    def discard(self, interaction_id):
+        """Forget a record (processed or dead-lettered)."""
+        self.entries.pop(interaction_id, None)
+        self._end_lease(interaction_id)
+
+    def pop_due(self, limit, now=None):
+        """Lease and return up to limit due records, earliest deadline first."""
+        now = time.time() if now is None else now
+        self._expire_leases(now)
+        while self.delayed and self.delayed[0][0] <= now:
+            _, seq, deadline, record = heapq.heappop(self.delayed)
+            if self.entries.get(record.interaction_id) == seq:
+                self._push_ready(deadline, seq, record)
+
+        batch = self._pop_ready(limit, now)
+        for record in batch:
+            del self.entries[record.interaction_id]
+            self.leases[record.interaction_id] = (now + self.lease_seconds, record)
+        return batch
+
+    def _is_current(self, entry):
+        _, seq, record = entry
+        return self.entries.get(record.interaction_id) == seq
+
+    def _push_ready(self, deadline, seq, record):
+        heapq.heappush(self.ready, (deadline, seq, record))
+
+    def _pop_ready(self, limit, now):
+        batch = []
+        while self.ready and len(batch) < limit:
+            entry = heapq.heappop(self.ready)
+            if self._is_current(entry):
+                batch.append(entry[2])
+        return batch
+
+    def _ready_entries(self):
+        return self.ready
+
+    def _end_lease(self, interaction_id):
+        return self.leases.pop(interaction_id, None)
+
+    def _expire_leases(self, now):
+        expired = [record for expiry, record in self.leases.values() if expiry <= now]
+        for record in expired:
+            self.push(record)
+
+    def get_stats(self, now=None):
+        """Counts of ready, backing-off and leased emails, and how many are past their deadline."""
+        now = time.time() if now is None else now
+        ready = [(deadline, record) for deadline, seq, record in self._ready_entries()
+                 if self.entries.get(record.interaction_id) == seq]
+        delayed = sum(1 for _, seq, _, record in self.delayed
+                      if self.entries.get(record.interaction_id) == seq)
+        by_category = {}
+        for _, record in ready:
+            category = self.policy.category(record)
+            by_category[category] = by_category.get(category, 0) + 1
+        return {
+            "ready": len(ready),
+            "backing_off": delayed,
+            "leased": len(self.leases),
+            "overdue": sum(1 for deadline, _ in ready if deadline < now),
+            "ready_by_category": by_category
+        }
+
+
+class SenderState:
+    """Backlog, DRR deficit, in-flight count and rate-limit tokens of one sender."""
+    __slots__ = ("ready", "deficit", "in_flight", "tokens", "refilled_at", "active")
+
+    def __init__(self, tokens, now):
+        self.ready = []
+        self.deficit = 0.0
+        self.in_flight = 0
+        self.tokens = tokens
+        self.refilled_at = now
+        self.active = False
+
+
+class FairShareScheduler(DeadlineScheduler):
+    """Deficit round-robin across senders, earliest deadline first within each.
+
+    Every sender with due emails sits in a ring. Each visit adds the
+    sender's quantum (scaled by the weight of its most urgent email's
+    category) to its deficit, and emails are taken while the deficit
+    covers their cost of one unit plus one per cost_unit_bytes of subject
+    and content. One sender dropping hundreds of emails therefore only
+    gets its share of each batch, however deep its backlog.
+
+    On top of that, a sender is skipped while it has max_in_flight emails
+    leased and another sender has emails it could start instead (a lone
+    sender's backlog is not throttled), or, when rate_per_minute is set,
+    until its token bucket (holding up to a minute's worth) allows another
+    email. Senders with due emails and room under the cap are counted as
+    they change, so the cap check does not walk the ring; a sender that is
+    only waiting for tokens still counts as one that could go instead.
+    """
+    def __init__(self, policy, lease_seconds=900, weights=None, cost_unit_bytes=4096,
+                 max_in_flight=0, rate_per_minute=0):
+        super().__init__(policy, lease_seconds)
+        self.weights = weights or {}
+        self.cost_unit_bytes = cost_unit_bytes
+        self.max_in_flight = max_in_flight
+        self.rate_per_minute = rate_per_minute
+        self.senders = {}
+        self.active = deque()
+        # Active senders below max_in_flight
+        self.waiting = 0
+        self.throttled = 0
+
+    def _sender_key(self, record):
+        return (record.sender or "").lower()
+
+    def _state(self, sender, now):
+        state = self.senders.get(sender)
+        if state is None:
+            state = SenderState(self.rate_per_minute, now)
+            self.senders[sender] = state
+        return state
+
+    def _push_ready(self, deadline, seq, record):
+        sender = self._sender_key(record)
+        state = self._state(sender, time.time())
+        heapq.heappush(state.ready, (deadline, seq, record))
+        if not state.active:
+            self._update(state, active=True)
+            self.active.append(sender)
+
+    def _end_lease(self, interaction_id):
+        lease = super()._end_lease(interaction_id)
+        if lease is not None:
+            sender = self._sender_key(lease[1])
+            state = self.senders.get(sender)
+            if state is not None:
+                self._update(state, in_flight=-1)
+                self._forget_if_idle(sender, state)
+        return lease
+
+    def _is_waiting(self, state):
+        return state.active and not (self.max_in_flight and state.in_flight >= self.max_in_flight)
+
+    def _update(self, state, active=None, in_flight=0):
+        """Change a sender's active flag or in-flight count, keeping self.waiting in step."""
+        was_waiting = self._is_waiting(state)
+        if active is not None:
+            state.active = active
+        state.in_flight += in_flight
+        self.waiting += self._is_waiting(state) - was_waiting
+
+    def _forget_if_idle(self, sender, state):
+        # Senders with a partly drained token bucket are kept so the limit holds
+        if not state.active and state.in_flight <= 0 and state.tokens >= self.rate_per_minute:
+            del self.senders[sender]
+
+    def _drop_stale(self, state):
+        while state.ready and not self._is_current(state.ready[0]):
+            heapq.heappop(state.ready)
+
+    def _refill(self, state, now):
+        if self.rate_per_minute:
+            state.tokens = min(self.rate_per_minute, state.tokens + (now - state.refilled_at) * self.rate_per_minute / 60)
+            state.refilled_at = now
+
+    def _can_start(self, sender, state, now):
+        if self.rate_per_minute and state.tokens < 1:
+            return False
+        if self.max_in_flight and state.in_flight >= self.max_in_flight:
+            # The cap only holds a sender back while another one could go instead
+            return self.waiting == 0
+        return True
+
+    def _cost(self, record):
+        return 1 + (record.subject_size + record.content_size) // self.cost_unit_bytes
+
+    def _pop_ready(self, limit, now):
+        batch = []
+        # Consecutive visits to senders held back by their caps; once it
+        # covers the whole ring nobody can be served right now
+        blocked = 0
+        while self.active and len(batch) < limit and blocked < len(self.active):
+            sender = self.active[0]
+            state = self.senders[sender]
+            self._drop_stale(state)
+            if not state.ready:
+                self.active.popleft()
+                self._update(state, active=False)
+                state.deficit = 0.0
+                self._forget_if_idle(sender, state)
+                continue
+            self._refill(state, now)
+            if not self._can_start(sender, state, now):
+                self.active.rotate(-1)
+                self.throttled += 1
+                blocked += 1
+                continue
+            blocked = 0
+            head = state.ready[0][2]
+            state.deficit += self.weights.get(self.policy.category(head), 1.0)
+            while state.ready and len(batch) < limit and self._can_start(sender, state, now):
+                record = state.ready[0][2]
+                cost = self._cost(record)
+                if cost > state.deficit:
+                    break
+                heapq.heappop(state.ready)
+                state.deficit -= cost
+                self._update(state, in_flight=1)
+                if self.rate_per_minute:
+                    state.tokens -= 1
+                batch.append(record)
+                self._drop_stale(state)
+            if state.ready:
+                self.active.rotate(-1)
+        return batch
+
+    def _ready_entries(self):
+        for state in self.senders.values():
+            yield from state.ready
+
+    def get_stats(self, now=None):
+        """Scheduler counts plus active and capped senders."""
+        now = time.time() if now is None else now
+        stats = super().get_stats(now)
+        capped = 0
+        for state in self.senders.values():
+            if state.active and self.max_in_flight and state.in_flight >= self.max_in_flight:
+                capped += 1
+        stats["active_senders"] = len(self.active)
+        stats["senders_at_concurrency_cap"] = capped
+        stats["throttled_visits"] = self.throttled
+        return stats
@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import logging
+import threading
+
+from storage import serialization
+
+logger = logging.getLogger("talisma_processor")
+
+
+class BlobStore:
+    """Keyed on-disk store for JSON documents that are too large to keep in RAM.
+
+    Used for the bodies of queued emails: the queue only keeps compact
+    metadata and loads a body right before the email is processed.
+    Documents are stored in a WAL-mode SQLite table, compressed with the
+    given codec (storage.compression.Codec) when one is provided.
+    """
+    def __init__(self, db_path, codec=None):
+        self.db_path = db_path
+        self.codec = codec
+        self.lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " key TEXT PRIMARY KEY,"
+                " data BLOB NOT NULL"
+                ")"
+            )
+            self.conn.commit()
+
+    def put_many(self, items):
+        """Store several (key, document) pairs in one transaction."""
+        rows = [(str(key), self._encode(document)) for key, document in items]
+        if not rows:
+            return 0
+        with self.lock:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO blobs (key, data) VALUES (?, ?)", rows)
+        return len(rows)
+
+    def get_many(self, keys):
+        """Load documents by key. Returns a dict of key -> document for the keys found."""
+        keys = [str(key) for key in keys]
+        if not keys:
+            return {}
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT key, data FROM blobs WHERE key IN ({', '.join('?' * len(keys))})",
+                keys
+            ).fetchall()
+        return {key: self._decode(data) for key, data in rows}
+
+    def get(self, key):
+        """Load one document, or None if the key is not stored."""
+        return self.get_many([key]).get(str(key))
+
+    def delete_many(self, keys):
+        """Delete documents by key."""
+        rows = [(str(key),) for key in keys]
+        if not rows:
+            return
+        with self.lock:
+            with self.conn:
+                self.conn.executemany("DELETE FROM blobs WHERE key = ?", rows)
+
+    def count(self):
+        """Number of stored documents."""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def _encode(self, document):
+        data = serialization.dumps(document)
+        return self.codec.compress(data) if self.codec is not None else data
+
+    def _decode(self, data):
+        return serialization.loads(self.codec.decompress(data) if self.codec is not None else data)
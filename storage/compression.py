@@ -0,0 +1,172 @@
+import os
+import zlib
+import base64
+import logging
+import argparse
+from collections import Counter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger("talisma_processor")
+
+# First byte of a compressed blob. Plain JSON always starts with "{", "[" or
+# a quote, so uncompressed legacy data is recognised and passed through.
+FORMAT_ZLIB = b"\x01"
+FORMAT_ZSTD = b"\x02"
+HEADER_SIZE = 5
+
+# zlib only looks back 32KB, so a larger preset dictionary is wasted
+MAX_ZLIB_DICTIONARY_SIZE = 32768
+
+# Levels used when none is given; each format has its own scale
+DEFAULT_ZLIB_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+
+class Codec:
+    """Compress records and email bodies with an optional shared dictionary.
+
+    Blobs are laid out as a 1-byte format marker, the 4-byte CRC32 of the
+    dictionary they were compressed with (0 without one) and the payload.
+    zstd is used when the zstandard package is installed, raw deflate
+    otherwise; either format is decoded regardless of which is preferred.
+    Short emails share most of their wording (greetings, signatures,
+    disclaimers, output field names), which a trained dictionary captures
+    and plain per-record compression cannot.
+
+    level is passed to whichever format is used (zlib 0-9, zstd 1-22);
+    without one each format uses its own default.
+    """
+    def __init__(self, dictionary=None, level=None, prefer_zstd=True):
+        self.dictionary = dictionary or b""
+        self.dictionary_id = zlib.crc32(self.dictionary) if self.dictionary else 0
+        self.level = level
+        self.header_id = self.dictionary_id.to_bytes(4, "big")
+        self.use_zstd = prefer_zstd and zstandard is not None
+        self.zlib_dictionary = self.dictionary[-MAX_ZLIB_DICTIONARY_SIZE:]
+        if zstandard is not None:
+            zstd_dictionary = None
+            if self.dictionary:
+                zstd_dictionary = zstandard.ZstdCompressionDict(self.dictionary)
+            self.zstd_compressor = zstandard.ZstdCompressor(
+                level=DEFAULT_ZSTD_LEVEL if level is None else level, dict_data=zstd_dictionary
+            )
+            self.zstd_decompressor = zstandard.ZstdDecompressor(dict_data=zstd_dictionary)
+
+    def compress(self, data):
+        """Compress bytes into a self-describing blob."""
+        if self.use_zstd:
+            return FORMAT_ZSTD + self.header_id + self.zstd_compressor.compress(data)
+        level = DEFAULT_ZLIB_LEVEL if self.level is None else self.level
+        if self.zlib_dictionary:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=self.zlib_dictionary)
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return FORMAT_ZLIB + self.header_id + compressor.compress(data) + compressor.flush()
+
+    def decompress(self, blob):
+        """Decompress a blob produced by compress(); uncompressed data is returned as is."""
+        if isinstance(blob, str):
+            return blob.encode("utf-8")
+        marker = blob[:1]
+        if marker not in (FORMAT_ZLIB, FORMAT_ZSTD):
+            return blob
+        dictionary_id = int.from_bytes(blob[1:HEADER_SIZE], "big")
+        if dictionary_id and dictionary_id != self.dictionary_id:
+            raise ValueError(f"Blob was compressed with dictionary {dictionary_id:08x}, loaded dictionary is {self.dictionary_id:08x}")
+        payload = blob[HEADER_SIZE:]
+        if marker == FORMAT_ZSTD:
+            if zstandard is None:
+                raise ValueError("Blob is zstd-compressed but the zstandard package is not installed")
+            return self.zstd_decompressor.decompress(payload)
+        if dictionary_id:
+            decompressor = zlib.decompressobj(-15, zdict=self.zlib_dictionary)
+        else:
+            decompressor = zlib.decompressobj(-15)
+        return decompressor.decompress(payload) + decompressor.flush()
+
+    def compress_text(self, text):
+        """Compress a str into an ASCII-safe str for embedding in JSON files."""
+        return base64.b64encode(self.compress(text.encode("utf-8"))).decode("ascii")
+
+    def decompress_text(self, encoded):
+        """Reverse compress_text()."""
+        return self.decompress(base64.b64decode(encoded)).decode("utf-8")
+
+
+def train_dictionary(samples, size=MAX_ZLIB_DICTIONARY_SIZE):
+    """Build a shared dictionary from sample records.
+
+    With zstandard installed this is zstd's trainer. Otherwise the most
+    frequent lines and sentences across the samples are packed into a raw
+    dictionary, most frequent last, since deflate references recent bytes
+    most cheaply.
+    """
+    samples = [sample for sample in samples if sample]
+    if zstandard is not None and len(samples) >= 8:
+        try:
+            return zstandard.train_dictionary(size, samples).as_bytes()
+        except zstandard.ZstdError as e:
+            logger.warning(f"SYSTEM | zstd dictionary training failed, falling back to raw dictionary: {e}")
+
+    counts = Counter()
+    for sample in samples:
+        fragments = set()
+        for line in sample.replace(b". ", b".\n").replace(b",\"", b",\n\"").splitlines():
+            line = line.strip()
+            if 8 <= len(line) <= 512:
+                fragments.add(line)
+        counts.update(fragments)
+
+    chosen = []
+    total = 0
+    for fragment, count in counts.most_common():
+        if count < 2 or total + len(fragment) + 1 > size:
+            continue
+        chosen.append(fragment)
+        total += len(fragment) + 1
+    return b" ".join(reversed(chosen))
+
+
+def load_codec(dictionary_path=None, prefer_zstd=True, level=None):
+    """Create a Codec, using the dictionary at dictionary_path when it exists."""
+    dictionary = None
+    if dictionary_path and os.path.exists(dictionary_path):
+        with open(dictionary_path, "rb") as f:
+            dictionary = f.read()
+        logger.info(f"SYSTEM | Loaded {len(dictionary)} byte compression dictionary")
+    return Codec(dictionary, level, prefer_zstd)
+
+
+if __name__ == "__main__":
+    from storage.output_store import OutputStore
+    from storage.persistence import atomic_write
+
+    parser = argparse.ArgumentParser(description="Train the shared compression dictionary from stored outputs")
+    parser.add_argument("--db", default=os.getenv("OUTPUT_DB", "processed_output.db"))
+    parser.add_argument("--out", default=os.getenv("COMPRESSION_DICT_FILE", "compression.dict"))
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=MAX_ZLIB_DICTIONARY_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(levelname)s] - %(message)s')
+    if os.path.exists(args.out):
+        parser.error(f"{args.out} already exists; data compressed with it would become unreadable if it were replaced")
+
+    store = OutputStore(args.db, codec=load_codec(None))
+    samples = store.sample_records(args.samples)
+    if not samples:
+        parser.error(f"No records found in {args.db}")
+    dictionary = train_dictionary(samples, args.size)
+    atomic_write(args.out, dictionary)
+
+    plain = sum(len(sample) for sample in samples)
+    without = Codec(None)
+    trained = Codec(dictionary)
+    print(f"Trained {len(dictionary)} byte dictionary from {len(samples)} records -> {args.out}")
+    print(f"  uncompressed:       {plain} bytes")
+    print(f"  without dictionary: {sum(len(without.compress(s)) for s in samples)} bytes")
+    print(f"  with dictionary:    {sum(len(trained.compress(s)) for s in samples)} bytes")
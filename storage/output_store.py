@@ -0,0 +1,351 @@
+import os
+import time
+import sqlite3
+import logging
+import argparse
+import datetime
+import threading
+
+from storage import serialization
+
+logger = logging.getLogger("talisma_processor")
+
+# Columns extracted from each record's body and kept indexed for queries
+INDEXED_COLUMNS = {
+    "classification": "TEXT",
+    "is_spam": "INTEGER",
+    "escalation_required": "INTEGER",
+    "user_type": "TEXT",
+    "processed_date": "TEXT"
+}
+
+SUMMARY_COLUMNS = ["interaction_id", "created_at"] + list(INDEXED_COLUMNS)
+
+
+def _index_fields(output, created_at):
+    """Extract the indexed column values and called API names from an output record."""
+    body = output.get("body", {})
+    escalation = body.get("escalation", {})
+    api_names = set()
+    for api_call in body.get("apis_called", []) or []:
+        if isinstance(api_call, dict):
+            api_name = api_call.get("api_name")
+        else:
+            api_name = api_call
+        if api_name:
+            api_names.add(str(api_name))
+    fields = (
+        body.get("classification"),
+        None if body.get("is_spam") is None else int(bool(body.get("is_spam"))),
+        None if escalation.get("escalation_required") is None else int(bool(escalation.get("escalation_required"))),
+        body.get("user_type"),
+        datetime.date.fromtimestamp(created_at).isoformat()
+    )
+    return fields, api_names
+
+
+class OutputStore:
+    """SQLite-backed store for processed outputs, one row per interaction.
+
+    Replaces the one-JSON-file-per-interaction layout of processed_output/.
+    Records are stored as compact JSON in a single WAL-mode database, so a
+    write is an append to the WAL instead of a new inode, and lookups by
+    interaction_id go through the primary key index.
+
+    Classification, spam and escalation flags, user type and processing
+    date are copied into indexed columns, and the names of the APIs called
+    into the output_apis table, so query() can filter and paginate without
+    decoding any record.
+
+    When a codec (storage.compression.Codec) is given, records are stored
+    compressed; uncompressed records written earlier stay readable.
+    """
+    def __init__(self, db_path, codec=None):
+        self.db_path = db_path
+        self.codec = codec
+        self.lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS outputs ("
+                " interaction_id TEXT PRIMARY KEY,"
+                " created_at REAL NOT NULL,"
+                " record TEXT NOT NULL"
+                ")"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS output_apis ("
+                " api_name TEXT NOT NULL,"
+                " interaction_id TEXT NOT NULL,"
+                " PRIMARY KEY (api_name, interaction_id)"
+                ")"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_output_apis_interaction ON output_apis (interaction_id)")
+            existing = {row[1] for row in self.conn.execute("PRAGMA table_info(outputs)")}
+            added = [column for column in INDEXED_COLUMNS if column not in existing]
+            for column in added:
+                self.conn.execute(f"ALTER TABLE outputs ADD COLUMN {column} {INDEXED_COLUMNS[column]}")
+            for column in INDEXED_COLUMNS:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_outputs_{column} ON outputs ({column})")
+            self.conn.commit()
+        if added and self.count():
+            self.reindex()
+
+    def put(self, output, created_at=None):
+        """Insert or replace the output record of one interaction."""
+        self.put_many([output], created_at)
+
+    def put_many(self, outputs, created_at=None):
+        """Insert or replace several output records in a single transaction."""
+        if not outputs:
+            return 0
+        created_at = created_at if created_at is not None else time.time()
+        return self._insert([(output, created_at) for output in outputs])
+
+    def _insert(self, records):
+        rows = []
+        api_rows = []
+        for output, created_at in records:
+            interaction_id = str(output["interaction_id"])
+            fields, api_names = _index_fields(output, created_at)
+            rows.append((interaction_id, created_at, self._encode(output)) + fields)
+            api_rows.extend((api_name, interaction_id) for api_name in api_names)
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM output_apis WHERE interaction_id = ?",
+                    [(row[0],) for row in rows]
+                )
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO outputs (interaction_id, created_at, record, {', '.join(INDEXED_COLUMNS)})"
+                    f" VALUES (?, ?, ?{', ?' * len(INDEXED_COLUMNS)})",
+                    rows
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO output_apis (api_name, interaction_id) VALUES (?, ?)",
+                    api_rows
+                )
+        return len(rows)
+
+    def reindex(self, batch_size=1000):
+        """Rebuild the indexed columns and output_apis from the stored records."""
+        logger.info("SYSTEM | Rebuilding output store indexes")
+        last_rowid = 0
+        reindexed = 0
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    "SELECT rowid, record, created_at FROM outputs WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size)
+                ).fetchall()
+            if not rows:
+                break
+            last_rowid = rows[-1][0]
+            updates = []
+            api_rows = []
+            for rowid, record, created_at in rows:
+                output = self._decode(record)
+                fields, api_names = _index_fields(output, created_at)
+                updates.append(fields + (rowid,))
+                api_rows.extend((api_name, str(output["interaction_id"])) for api_name in api_names)
+            with self.lock:
+                with self.conn:
+                    self.conn.executemany(
+                        f"UPDATE outputs SET {', '.join(column + ' = ?' for column in INDEXED_COLUMNS)} WHERE rowid = ?",
+                        updates
+                    )
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO output_apis (api_name, interaction_id) VALUES (?, ?)",
+                        api_rows
+                    )
+            reindexed += len(rows)
+        logger.info(f"SYSTEM | Reindexed {reindexed} output records")
+        return reindexed
+
+    def query(self, classification=None, is_spam=None, escalation_required=None, user_type=None,
+              api_name=None, date_from=None, date_to=None, cursor=None, limit=50):
+        """Filter outputs through the secondary indexes, newest first.
+
+        Only the indexed summary columns are returned; use get() for the
+        full record. Pass the returned next_cursor back as cursor to fetch
+        the following page.
+
+        Args:
+            classification (str): Exact classification
+            is_spam (bool): Spam flag
+            escalation_required (bool): Escalation flag
+            user_type (str): "client", "ba", ...
+            api_name (str): Only outputs whose apis_called include this API
+            date_from (str): First processing date (YYYY-MM-DD), inclusive
+            date_to (str): Last processing date (YYYY-MM-DD), inclusive
+            cursor (int): Position returned by the previous page
+            limit (int): Page size
+
+        Returns:
+            tuple: (items, next_cursor) - next_cursor is None on the last page
+        """
+        conditions = []
+        params = []
+        for column, value in (
+            ("classification", classification),
+            ("user_type", user_type),
+            ("is_spam", None if is_spam is None else int(bool(is_spam))),
+            ("escalation_required", None if escalation_required is None else int(bool(escalation_required)))
+        ):
+            if value is not None:
+                conditions.append(f"o.{column} = ?")
+                params.append(value)
+        if date_from is not None:
+            conditions.append("o.processed_date >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append("o.processed_date <= ?")
+            params.append(date_to)
+        if cursor is not None:
+            conditions.append("o.rowid < ?")
+            params.append(int(cursor))
+        join = ""
+        if api_name is not None:
+            join = "JOIN output_apis a ON a.interaction_id = o.interaction_id AND a.api_name = ?"
+            params.insert(0, api_name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            f"SELECT o.rowid, {', '.join('o.' + column for column in SUMMARY_COLUMNS)} FROM outputs o {join}"
+            f" {where} ORDER BY o.rowid DESC LIMIT ?"
+        )
+        params.append(int(limit) + 1)
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        items = []
+        for row in rows[:limit]:
+            item = dict(zip(SUMMARY_COLUMNS, row[1:]))
+            for flag in ("is_spam", "escalation_required"):
+                if item[flag] is not None:
+                    item[flag] = bool(item[flag])
+            items.append(item)
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return items, next_cursor
+
+    def get(self, interaction_id):
+        """Get the output record of an interaction, or None if it is not stored."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT record FROM outputs WHERE interaction_id = ?",
+                (str(interaction_id),)
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def sample_records(self, limit):
+        """Return the JSON bytes of up to limit of the most recent records."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT record FROM outputs ORDER BY rowid DESC LIMIT ?",
+                (int(limit),)
+            ).fetchall()
+        return [self.codec.decompress(row[0]) if self.codec else row[0].encode("utf-8") for row in rows]
+
+    def iter_records(self, batch_size=1000):
+        """Yield every stored output record, oldest first, decoding batch_size at a time."""
+        last_rowid = 0
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    "SELECT rowid, record FROM outputs WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            for _, record in rows:
+                yield self._decode(record)
+
+    def _encode(self, output):
+        if self.codec is None:
+            return serialization.dumps_str(output)
+        return self.codec.compress(serialization.dumps(output))
+
+    def _decode(self, record):
+        if self.codec is None:
+            return serialization.loads(record)
+        return serialization.loads(self.codec.decompress(record))
+
+    def contains(self, interaction_id):
+        """Check whether an output record exists for an interaction."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM outputs WHERE interaction_id = ?",
+                (str(interaction_id),)
+            ).fetchone()
+        return row is not None
+
+    def count(self):
+        """Number of stored output records."""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def migrate_directory(store, directory, batch_size=500):
+    """Import every <interaction_id>.json file of a processed_output directory.
+
+    Files are read with os.scandir and inserted in batches of batch_size
+    rows per transaction. The file modification time becomes the record's
+    created_at. Existing records with the same interaction_id are replaced,
+    so the migration can safely be re-run.
+
+    Returns:
+        tuple: (imported, failed) - Number of imported and unreadable files
+    """
+    imported = 0
+    failed = 0
+    batch = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            try:
+                output = serialization.load_file(entry.path)
+                if "interaction_id" not in output:
+                    output["interaction_id"] = entry.name[:-len(".json")]
+                batch.append((output, entry.stat().st_mtime))
+            except Exception as e:
+                failed += 1
+                logger.error(f"SYSTEM | Could not migrate {entry.path}: {e}")
+                continue
+            if len(batch) >= batch_size:
+                imported += store._insert(batch)
+                batch.clear()
+                logger.info(f"SYSTEM | Migrated {imported} output files")
+
+    if batch:
+        imported += store._insert(batch)
+    logger.info(f"SYSTEM | Output migration complete: {imported} imported, {failed} failed")
+    return imported, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Processed output store utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = subparsers.add_parser("migrate", help="Import a processed_output directory into the store")
+    migrate_parser.add_argument("--dir", default=os.getenv("OUTPUT_DIR", "processed_output"))
+    migrate_parser.add_argument("--db", default=os.getenv("OUTPUT_DB", "processed_output.db"))
+    migrate_parser.add_argument("--batch-size", type=int, default=500)
+    migrate_parser.add_argument("--dict", default=os.getenv("COMPRESSION_DICT_FILE", "compression.dict"))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - [%(levelname)s] - %(message)s')
+    if args.command == "migrate":
+        from storage.compression import load_codec
+        store = OutputStore(args.db, codec=load_codec(args.dict))
+        imported, failed = migrate_directory(store, args.dir, args.batch_size)
+        print(f"Imported {imported} records into {args.db} ({failed} failed); store now holds {store.count()} records")
+        store.close()
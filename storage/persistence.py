@@ -0,0 +1,205 @@
+import os
+import time
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger("talisma_processor")
+
+
+def _fsync_directory(directory):
+    """Flush a directory entry so a completed rename survives a crash."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on some platforms (e.g. Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, sync_directory=True):
+    """Atomically replace the file at path with data.
+
+    The data is written to a temporary file in the same directory,
+    fsynced and renamed over the target, so readers (and a restart after
+    a crash) only ever see the old or the new content, never a truncated
+    file.
+
+    Args:
+        path (str): Target file path
+        data (bytes | str): Content to write; str is encoded as UTF-8
+        sync_directory (bool): Also fsync the parent directory after the rename
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if sync_directory:
+        _fsync_directory(directory)
+
+
+class GroupCommitWriter:
+    """Background writer that coalesces state file writes into group commits.
+
+    submit() only records the latest payload for a path and returns a
+    Future. A writer thread waits window_seconds after the first pending
+    write, then writes every pending path atomically and fsyncs each
+    touched directory once. Several submits for the same path inside the
+    window collapse into a single write.
+
+    A payload is bytes, str, or a callable returning either. Callables are
+    evaluated on the writer thread at flush time, so serialization is also
+    done once per flush instead of once per submit.
+
+    submit() never blocks. Because pending writes are kept per path, the
+    outstanding work is bounded by the number of state files rather than
+    the number of submits. After close(), submit() writes synchronously so
+    late savers (e.g. tasks still finishing at shutdown) are not lost.
+    """
+    def __init__(self, window_seconds=0.05):
+        self.window_seconds = window_seconds
+        self.cond = threading.Condition()
+        self.pending = {}
+        self.barriers = []
+        self.closed = False
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "flushes": 0,
+            "files_written": 0,
+            "errors": 0
+        }
+        self.thread = threading.Thread(target=self._run, name="state-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, path, payload):
+        """Schedule payload to be written to path. Returns a Future set once it is on disk."""
+        future = Future()
+        with self.cond:
+            closed = self.closed
+            if not closed:
+                self.stats["submitted"] += 1
+                if path in self.pending:
+                    self.stats["coalesced"] += 1
+                    self.pending[path][1].append(future)
+                    self.pending[path] = (payload, self.pending[path][1])
+                else:
+                    self.pending[path] = (payload, [future])
+                self.cond.notify_all()
+        if closed:
+            self._write_now(path, payload, future)
+        return future
+
+    def barrier(self):
+        """Return a Future set once every write submitted so far is on disk."""
+        future = Future()
+        with self.cond:
+            closed = self.closed
+            if not closed:
+                self.barriers.append(future)
+                self.cond.notify_all()
+        if closed:
+            # Writes after close() are synchronous, so only the final flush is outstanding
+            self.thread.join()
+            future.set_result(True)
+        return future
+
+    def flush(self, timeout=None):
+        """Block until every write submitted so far is on disk."""
+        self.barrier().result(timeout)
+
+    def close(self, timeout=None):
+        """Flush outstanding writes and stop the writer thread."""
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join(timeout)
+
+    def get_stats(self):
+        """Writer statistics plus the number of paths waiting to be written."""
+        with self.cond:
+            return {**self.stats, "pending": len(self.pending)}
+
+    def _write_now(self, path, payload, future):
+        # Let the final flush finish first so it cannot overwrite this newer payload
+        self.thread.join()
+        try:
+            data = payload() if callable(payload) else payload
+            atomic_write(path, data)
+            with self.cond:
+                self.stats["submitted"] += 1
+                self.stats["files_written"] += 1
+            future.set_result(True)
+        except Exception as e:
+            with self.cond:
+                self.stats["errors"] += 1
+            logger.error(f"SYSTEM | Error writing {path}: {e}")
+            future.set_exception(e)
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and not self.barriers and not self.closed:
+                    self.cond.wait()
+                if self.closed and not self.pending and not self.barriers:
+                    return
+                closing = self.closed
+
+            # Give concurrent writers a chance to join this commit
+            if not closing and self.window_seconds > 0:
+                time.sleep(self.window_seconds)
+
+            with self.cond:
+                batch, self.pending = self.pending, {}
+                barriers, self.barriers = self.barriers, []
+            if batch:
+                self._commit(batch)
+            for future in barriers:
+                future.set_result(True)
+
+    def _commit(self, batch):
+        directories = set()
+        results = []
+        for path, (payload, futures) in batch.items():
+            try:
+                data = payload() if callable(payload) else payload
+                atomic_write(path, data, sync_directory=False)
+                directories.add(os.path.dirname(os.path.abspath(path)))
+                results.append((futures, None))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"SYSTEM | Error writing {path}: {e}")
+                results.append((futures, e))
+
+        for directory in directories:
+            _fsync_directory(directory)
+
+        self.stats["flushes"] += 1
+        self.stats["files_written"] += len(batch) - sum(1 for _, error in results if error is not None)
+        for futures, error in results:
+            for future in futures:
+                if error is None:
+                    future.set_result(True)
+                else:
+                    future.set_exception(error)
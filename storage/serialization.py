@@ -0,0 +1,120 @@
+import json
+import time
+import argparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Name of the active backend, reported by the benchmark and /api/metrics
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+    The output has no indentation or spaces after separators; both
+    backends produce equivalent documents for the data we store.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_str(obj):
+    """Serialize obj to a compact JSON str (for logs and text columns)."""
+    return dumps(obj).decode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path):
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _sample_output(i):
+    """Build an output record shaped like the ones process_single_email produces."""
+    content = (
+        "Dear Sir/Madam, I have not received my contract note for the trades executed "
+        "yesterday on NSE. Kindly share the same on my registered email id at the earliest. "
+        "Also please confirm the brokerage charged on the intraday trades. Regards, Client. "
+    ) * 6
+    return {
+        "interaction_id": 900000 + i,
+        "body": {
+            "interaction_id": 900000 + i,
+            "from_email": f"Client Name\rclient{i}@example.com",
+            "to_email": "query@motilaloswal.com",
+            "subject": "Contract note not received",
+            "body": content,
+            "user_type": "client",
+            "classification": "clarification_on_brokerage",
+            "escalation": {"escalation_required": False, "escalation_reason": "na"},
+            "is_spam": False,
+            "ask": "Client requests the contract note and a brokerage clarification.",
+            "apis_called": [
+                {
+                    "api_name": "get_brokerage_details",
+                    "api_args": {"client_code": f"C{i:06d}"},
+                    "response": {
+                        "status": "success",
+                        "message": "Brokerage details fetched.",
+                        "data": {"client_code": f"C{i:06d}", "brokerage_plan": "Value Pack", "intraday_rate": 0.02}
+                    }
+                }
+            ],
+            "response_draft": "Dear Client, please find the contract note attached. " * 8,
+            "cpg": {"scenario_id": "712", "scenario_name": "Contract note", "sop": "na", "path": "na"},
+            "additional_fields": {key: "na" for key in (
+                "set_to_resolved", "pms_end_client", "lan", "query_nature", "location", "others",
+                "reopen", "ftr_or_follow_up", "mode_of_interaction", "master_department", "department",
+                "query_type", "sub_query_type", "interaction_category", "process_deviation", "originated",
+                "beyond_tat", "remark_of_deviation", "updated_value", "processed_by", "ebot_mail_received"
+            )}
+        }
+    }
+
+
+def benchmark(records=2000, rounds=5):
+    """Compare the previous json.dumps(indent=2) path with the central serializer."""
+    data = [_sample_output(i) for i in range(records)]
+    candidates = [
+        ("json indent=2 (previous)", lambda obj: json.dumps(obj, indent=2).encode("utf-8")),
+        ("json compact", lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")),
+    ]
+    if orjson is not None:
+        candidates.append(("orjson compact", lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)))
+
+    print(f"Serializing {records} output records x {rounds} rounds (active backend: {BACKEND})")
+    print(f"{'serializer':<28}{'bytes/record':>14}{'us/record':>12}{'us/parse':>12}")
+    for name, serialize in candidates:
+        encoded = [serialize(record) for record in data]
+        size = sum(len(item) for item in encoded) / records
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for record in data:
+                serialize(record)
+        dump_us = (time.perf_counter() - start) / (records * rounds) * 1e6
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for item in encoded:
+                loads(item)
+        load_us = (time.perf_counter() - start) / (records * rounds) * 1e6
+        print(f"{name:<28}{size:>14.0f}{dump_us:>12.1f}{load_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization of output records")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    benchmark(args.records, args.rounds)
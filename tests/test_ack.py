@@ -0,0 +1,42 @@
+import asyncio
+import threading
+import time
+
+from queueing.ack import AckCommitter
+
+
+def test_ack_arriving_during_commit_is_flushed():
+    commits = []
+    first_commit_started = threading.Event()
+
+    def commit(interaction_ids):
+        commits.append(list(interaction_ids))
+        first_commit_started.set()
+        time.sleep(0.2)
+
+    async def scenario():
+        committer = AckCommitter(0.01, commit)
+        first = asyncio.create_task(committer.ack("A", ["A2"]))
+        # Second ack lands while the first group is inside commit()
+        while not first_commit_started.is_set():
+            await asyncio.sleep(0.005)
+        second = asyncio.create_task(committer.ack("B"))
+        await asyncio.wait_for(asyncio.gather(first, second), timeout=2)
+        await committer.flush()
+        return committer
+
+    committer = asyncio.run(scenario())
+    assert commits == [["A", "A2"], ["B"]]
+    assert committer.pending == []
+
+
+def test_commit_failure_is_raised_to_every_ack():
+    def commit(interaction_ids):
+        raise OSError("disk full")
+
+    async def scenario():
+        committer = AckCommitter(0.01, commit)
+        return await asyncio.gather(committer.ack("A"), committer.ack("B"), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert [type(r) for r in results] == [OSError, OSError]
@@ -0,0 +1,57 @@
+import asyncio
+
+from agent.agent_pool import AgentPool
+
+
+class Tool:
+    def __init__(self):
+        self.metadata = {}
+
+
+class ResponseGenerator:
+    """Shaped like the compiled ResponseGenerator: it owns the per-email state."""
+    def __init__(self):
+        self.apis_called = []
+        self.tools = [Tool(), Tool()]
+
+    def record_api_call(self, api_name, api_args, api_output):
+        self.apis_called.append(api_name)
+
+
+class ResponseGeneratorAgent:
+    def __init__(self):
+        self.data_manager = object()
+        self.response_generator = ResponseGenerator()
+
+
+def test_reused_agent_starts_clean():
+    async def scenario():
+        pool = AgentPool(ResponseGeneratorAgent, 1)
+        async with pool.borrow() as agent:
+            agent.response_generator.record_api_call("ledger_api", {}, {})
+            agent.response_generator.tools[0].metadata["record_api_call"] = None
+            first = agent
+        async with pool.borrow() as agent:
+            return pool, first, agent
+
+    pool, first, second = asyncio.run(scenario())
+    assert second is first
+    generator = second.response_generator
+    assert generator.apis_called == []
+    assert all(tool.metadata["record_api_call"] == generator.record_api_call for tool in generator.tools)
+    assert pool.get_stats()["discarded"] == 0
+
+
+def test_agent_without_known_state_is_not_reused():
+    async def scenario():
+        pool = AgentPool(object, 1)
+        async with pool.borrow() as first:
+            pass
+        async with pool.borrow() as second:
+            pass
+        return pool, first, second
+
+    pool, first, second = asyncio.run(scenario())
+    assert second is not first
+    assert pool.get_stats()["created"] == 1
+    assert pool.get_stats()["discarded"] == 2
@@ -0,0 +1,60 @@
+import pytest
+
+from agent.api_registry import ApiRegistry, _copy_response
+from agent.tool_catalog import CATALOG
+
+TEMPLATE = {
+    "status": "success",
+    "data": {"holdings": [{"isin": "INE001", "qty": 10}], "message": "Holdings fetched."},
+    "tags": ("kept", "as is")
+}
+
+
+def test_copy_is_equal_but_does_not_share_containers():
+    copy = _copy_response(TEMPLATE)
+    assert copy == TEMPLATE
+    assert copy["data"] is not TEMPLATE["data"]
+    assert copy["data"]["holdings"][0] is not TEMPLATE["data"]["holdings"][0]
+    # Immutable values are shared rather than copied
+    assert copy["tags"] is TEMPLATE["tags"]
+
+
+def test_templates_are_fresh_on_every_call():
+    registry = ApiRegistry("test_templates")
+    registry.add_templates({"get_holdings": TEMPLATE})
+    first = registry.call("get_holdings")
+    first["data"]["holdings"].clear()
+    assert registry.call("get_holdings") == TEMPLATE
+    assert TEMPLATE["data"]["holdings"]
+
+
+def test_handlers_get_the_arguments_and_calls_are_recorded():
+    registry = ApiRegistry("test_handlers", unknown=lambda api_name: {"status": "error", "api_name": api_name})
+
+    @registry.handler("echo")
+    def echo(api_args):
+        return {"status": "success", "client_code": api_args.get("client_code")}
+
+    recorded = []
+    record = lambda *call: recorded.append(call)
+    assert registry.call("echo", {"client_code": "C1"}, record) == {"status": "success", "client_code": "C1"}
+    assert registry.call("echo") == {"status": "success", "client_code": None}
+    assert registry.call("nope", None, record) == {"status": "error", "api_name": "nope"}
+    assert recorded == [
+        ("echo", {"client_code": "C1"}, {"status": "success", "client_code": "C1"}),
+        ("nope", {}, {"status": "error", "api_name": "nope"})
+    ]
+    assert registry.names() == ["echo"]
+
+
+def test_unknown_template_is_copied():
+    registry = ApiRegistry("test_unknown", unknown={"status": "error", "data": {}})
+    registry.call("nope")["data"]["x"] = 1
+    assert registry.call("nope") == {"status": "error", "data": {}}
+
+
+def test_every_catalogued_api_is_routed():
+    classtool = pytest.importorskip("agent.classtool")
+    for tool_name, spec in CATALOG.items():
+        if spec.apis:
+            assert set(classtool.API_REGISTRIES[tool_name].names()) == set(spec.api_names()), tool_name
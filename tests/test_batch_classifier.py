@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+import pytest
+
+# Needs the agent runtime (langchain and the compiled classifier_agent)
+batch_classifier = pytest.importorskip("agent.batch_classifier")
+
+IDS = {"0": 0, "1": 1, "2": 2}
+
+
+def result(id, classification="dp", **fields):
+    return {"id": id, "classification": classification, "is_spam": False,
+            "escalation_required": False, "escalation_reason": None, **fields}
+
+
+def test_complete_results_are_mapped_by_id():
+    text = json.dumps({"results": [result("1", "kyc"), result("0")]})
+    categories = batch_classifier.parse_batch_result(text, IDS)
+    assert categories.keys() == {"0", "1"}
+    assert categories["1"]["classification"] == "kyc"
+    assert categories["1"]["batched"] is True
+
+
+def test_incomplete_unknown_and_malformed_results_are_left_out():
+    partial = {"id": "2", "classification": "dp"}
+    text = json.dumps({"results": [result("0"), partial, result("9"), "not a result"]})
+    assert batch_classifier.parse_batch_result(text, IDS).keys() == {"0"}
+
+
+def test_result_without_a_list_is_rejected():
+    with pytest.raises(ValueError):
+        batch_classifier.parse_batch_result(json.dumps({"classification": "dp"}), IDS)
+
+
+class FakeChain:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    async def ainvoke(self, inputs):
+        self.calls += 1
+        return self.text
+
+
+def test_emails_missing_from_the_batch_fall_back_to_single_calls(monkeypatch):
+    singles = []
+
+    async def classifier_agent(from_email, subject, content, user_type):
+        singles.append(subject)
+        return result(None, "single")
+
+    monkeypatch.setattr(batch_classifier, "classifier_agent", classifier_agent)
+    # ChatOpenAI only needs a key to be constructed; the chain is replaced before any call
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    classifier = batch_classifier.BatchClassifier(batch_size=3, max_wait_seconds=0.01)
+    classifier.chain = FakeChain(json.dumps({"results": [result("0"), result("2", "kyc")]}))
+
+    async def scenario():
+        return await asyncio.gather(*(classifier.classify("a@x.com", f"s{i}", "c", "client") for i in range(3)))
+
+    categories = asyncio.run(scenario())
+    assert [category["classification"] for category in categories] == ["dp", "single", "kyc"]
+    assert singles == ["s1"]
+    assert classifier.chain.calls == 1
+    assert classifier.get_stats()["fallback_emails"] == 1
@@ -0,0 +1,38 @@
+import pytest
+
+from queueing.record import EmailRecord
+from storage.blob_store import BlobStore
+from storage.compression import Codec
+
+
+def test_documents_round_trip_and_can_be_deleted(tmp_path):
+    store = BlobStore(str(tmp_path / "bodies.db"), codec=Codec(prefer_zstd=False))
+    assert store.put_many([(1, {"subject": "a", "content": "x" * 1000}), ("2", {"subject": "b", "content": "y"})]) == 2
+    assert store.get("1") == {"subject": "a", "content": "x" * 1000}
+    assert store.get_many([1, 2, 3]).keys() == {"1", "2"}
+    store.delete_many([1])
+    assert store.get(1) is None
+    assert store.count() == 1
+    store.close()
+
+
+def test_spilled_record_keeps_only_metadata_and_reloads_its_body(tmp_path):
+    store = BlobStore(str(tmp_path / "bodies.db"))
+    # A queue entry saved before bodies were spilled still carries them
+    record = EmailRecord.from_dict({"interaction_id": 1, "from_email": "a@x.com", "subject": "Hi", "content": "Body"})
+    store.put_many([(record.interaction_id, record.body())])
+    record.drop_body()
+    record.body_loader = store.get
+
+    assert not record.has_body
+    assert "content" not in record.to_dict()
+    assert (record.subject_size, record.content_size) == (2, 4)
+    assert record.content == "Body"
+    assert record.has_body
+
+
+def test_missing_body_is_an_error(tmp_path):
+    store = BlobStore(str(tmp_path / "bodies.db"))
+    record = EmailRecord(1, "a@x.com", body_loader=store.get)
+    with pytest.raises(ValueError):
+        record.content
@@ -0,0 +1,74 @@
+from agent.classification_cache import ClassificationCache, cache_key
+from queueing.near_duplicate import NearDuplicateIndex
+
+SUBJECT = "Contract note not received"
+FIRST = ("Dear team, I have not received my contract note for the trades done last week. "
+         "Kindly send the contract note to my registered email address at the earliest. Regards, Ramesh")
+SECOND = ("Dear team, I have not received my contract note for the trades done last week. "
+          "Kindly send the contract note and the ledger to my registered email address at the earliest. Regards, Sunita")
+
+
+def keys(index, interaction_id, content):
+    cluster = index.cluster_of(interaction_id)
+    return [cache_key(SUBJECT, content, "client"), f"cluster:{cluster}:client"]
+
+
+def test_near_duplicates_share_category_but_not_draft():
+    index = NearDuplicateIndex()
+    index.add(1, index.signature(SUBJECT, FIRST))
+    index.add(2, index.signature(SUBJECT, SECOND))
+    assert index.cluster_of(1) == index.cluster_of(2)
+    first_keys, second_keys = keys(index, 1, FIRST), keys(index, 2, SECOND)
+    assert first_keys[0] != second_keys[0]
+
+    cache = ClassificationCache()
+    category = {"status": "success", "classification": "dp", "is_spam": False, "escalation_required": False}
+    cache.put_category(first_keys, category, 1.0)
+    response = {"status": "success", "draft": "Dear Ramesh, please find your contract note attached.", "apis_called": []}
+    assert cache.put_draft(first_keys[0], "dp", response, "", SUBJECT + "\n" + FIRST, 2.0)
+
+    assert cache.get_category(second_keys)["classification"] == "dp"
+    assert cache.get_draft(second_keys[0], "dp", "") is None
+    assert cache.get_draft(first_keys[0], "dp", "")["draft"] == response["draft"]
+
+
+def test_templated_copies_share_a_key():
+    first = cache_key(SUBJECT, "Dear team, my client code AB1234 has no contract note for 12/03. Mail ramesh@x.com", "client")
+    second = cache_key(SUBJECT.upper(), "Dear team,  my client code AB98 has no contract note for 14/03! Mail sunita@y.in", "CLIENT")
+    assert first == second
+    assert cache_key(SUBJECT, FIRST, "client") != cache_key(SUBJECT, FIRST, "ba")
+
+
+def test_errors_and_sender_specific_drafts_are_not_cached():
+    cache = ClassificationCache()
+    key = cache_key(SUBJECT, FIRST, "client")
+    cache.put_category([key], {"status": "error"}, 1.0)
+    assert cache.get_category([key]) is None
+
+    with_api = {"status": "success", "draft": "Your holdings are attached.", "apis_called": [{"api_name": "get_holdings"}]}
+    assert not cache.put_draft(key, "dp", with_api, "", FIRST, 1.0)
+    echoes_code = {"status": "success", "draft": "We have checked code AB1234 for you.", "apis_called": []}
+    assert not cache.put_draft(key, "dp", echoes_code, "", "My client code is AB1234", 1.0)
+
+
+def test_client_id_is_filled_in_for_the_reusing_email():
+    cache = ClassificationCache()
+    key = cache_key(SUBJECT, FIRST, "client")
+    response = {"status": "success", "draft": "Dear client C100, the contract note is attached.", "apis_called": []}
+    assert cache.put_draft(key, "dp", response, "C100", FIRST, 2.0)
+    assert cache.get_draft(key, "dp", "C200")["draft"] == "Dear client C200, the contract note is attached."
+    assert cache.get_draft(key, "dp", "") is None
+    assert cache.get_draft(key, "kyc", "C200") is None
+
+
+def test_entries_expire_and_are_evicted():
+    cache = ClassificationCache(max_entries=1, ttl_seconds=0)
+    category = {"status": "success", "classification": "dp"}
+    cache.put_category(["a"], category, 1.0)
+    assert cache.get_category(["a"]) is None
+    cache = ClassificationCache(max_entries=1)
+    cache.put_category(["a"], category, 1.0)
+    cache.put_category(["b"], category, 1.0)
+    assert cache.get_category(["a"]) is None
+    assert cache.get_category(["b"])["cached"] is True
+    assert cache.get_stats()["evictions"] == 1
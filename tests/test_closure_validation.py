@@ -0,0 +1,74 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("langchain_core")
+pytest.importorskip("requests")
+
+from agent import classtool
+
+# Each call to the stub takes this long, like a slow closure validation API
+API_DELAY_SECONDS = 0.5
+
+
+class SlowClosureValidationAPI(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(API_DELAY_SECONDS)
+        if self.path.endswith("/generatetoken"):
+            body = "token"
+        else:
+            body = {"Table": [{"ReadyForClosure": "Y"}]}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slow_api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowClosureValidationAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(classtool, "bassurl", f"http://127.0.0.1:{server.server_port}")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_arun_does_not_block_event_loop(slow_api):
+    tool = classtool.Closure_validation_fetch_data_toolTool(metadata={"record_api_call": None})
+
+    async def scenario():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        # Unique client codes so the cache does not answer them
+        results = await asyncio.gather(*(tool._arun(f"LAG{time.time_ns()}{i}") for i in range(3)))
+        elapsed = time.perf_counter() - started
+        ticks.append(time.perf_counter())
+        ticking.cancel()
+        lag = max(later - earlier for earlier, later in zip(ticks, ticks[1:]))
+        return results, elapsed, lag
+
+    results, elapsed, lag = asyncio.run(scenario())
+    assert [result["status"] for result in results] == ["success"] * 3
+    # Token and fetchdata calls of the three lookups overlap instead of running one after another
+    assert elapsed < 3 * 2 * API_DELAY_SECONDS
+    assert lag < 0.2
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from agent.closure_validation import ClosureValidationCache
+
+FETCH_DELAY_SECONDS = 0.3
+
+
+def slow_fetch(calls, cacheable=True):
+    def fetch():
+        calls.append(threading.get_ident())
+        time.sleep(FETCH_DELAY_SECONDS)
+        return {"status": "success", "data": {"ReadyForClosure": "Y"}}, cacheable
+    return fetch
+
+
+def test_concurrent_lookups_of_one_client_share_a_fetch():
+    cache = ClosureValidationCache()
+    calls = []
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: cache.get_or_fetch("C1", slow_fetch(calls)), range(5)))
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    stats = cache.get_stats()
+    assert stats["fetches"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["inflight"] == 0
+
+
+def test_only_answered_lookups_are_cached_and_callers_get_copies():
+    cache = ClosureValidationCache()
+    calls = []
+    cache.get_or_fetch("FAILED", slow_fetch(calls, cacheable=False))
+    cache.get_or_fetch("FAILED", slow_fetch(calls, cacheable=False))
+    assert len(calls) == 2
+
+    first = cache.get_or_fetch("C1", slow_fetch(calls))
+    first["data"]["ReadyForClosure"] = "N"
+    assert cache.get_or_fetch("C1", slow_fetch(calls))["data"]["ReadyForClosure"] == "Y"
+    assert len(calls) == 3
+
+
+def test_entries_expire_and_are_evicted():
+    cache = ClosureValidationCache(ttl_seconds=0.05, max_entries=1)
+    calls = []
+    cache.get_or_fetch("C1", slow_fetch(calls))
+    time.sleep(0.1)
+    cache.get_or_fetch("C1", slow_fetch(calls))
+    cache.get_or_fetch("C2", slow_fetch(calls))
+    assert len(calls) == 3
+    stats = cache.get_stats()
+    assert stats["expirations"] == 1
+    assert stats["evictions"] == 1
+    assert stats["size"] == 1
+
+
+def test_lookups_in_an_executor_do_not_block_the_event_loop():
+    cache = ClosureValidationCache()
+    calls = []
+    executor = ThreadPoolExecutor(max_workers=3)
+
+    async def scenario():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        await asyncio.sleep(0.05)
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, cache.get_or_fetch, f"C{i}", slow_fetch(calls)) for i in range(3)
+        ))
+        elapsed = time.perf_counter() - started
+        ticks.append(time.perf_counter())
+        ticking.cancel()
+        lag = max(later - earlier for earlier, later in zip(ticks, ticks[1:]))
+        return elapsed, lag
+
+    try:
+        elapsed, lag = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    # The three fetches overlap instead of running one after another
+    assert elapsed < 3 * FETCH_DELAY_SECONDS
+    assert lag < 0.2
+    assert len(calls) == 3
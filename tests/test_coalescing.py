@@ -0,0 +1,22 @@
+from queueing.coalescing import coalesce, is_repull
+from queueing.record import EmailRecord
+
+
+def record(interaction_id, content, created_at):
+    return EmailRecord(interaction_id, "A\ra@x.com", subject="Contract note missing",
+                       content=content, created_at=created_at)
+
+
+def test_identical_repull_is_not_new():
+    queued = record(1, "first", 100)
+    assert is_repull(queued, record(1, "first", 100))
+    assert not is_repull(queued, record(1, "second", 200))
+    assert not is_repull(queued, record(2, "first", 100))
+
+
+def test_repull_of_superseded_message_is_not_new():
+    survivor, _ = coalesce(record(1, "first", 100), record(1, "second", 200))
+    assert survivor.content == "second"
+    assert is_repull(survivor, record(1, "first", 100))
+    assert is_repull(survivor, record(1, "second", 200))
+    assert not is_repull(survivor, record(1, "third", 300))
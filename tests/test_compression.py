@@ -0,0 +1,46 @@
+import pytest
+
+from storage import compression
+from storage.compression import Codec, train_dictionary
+
+SIGNATURE = (
+    "Dear Sir/Madam, thank you for writing to us. Regards, Customer Service Team. "
+    "This email and any attachments are confidential and intended solely for the addressee."
+)
+SAMPLES = [f"Hello, my client code is AB{i:04d} and my contract note is missing. {SIGNATURE}".encode() for i in range(40)]
+
+
+def test_round_trip_with_trained_dictionary():
+    dictionary = train_dictionary(SAMPLES)
+    trained = Codec(dictionary, prefer_zstd=False)
+    plain = Codec(None, prefer_zstd=False)
+    record = SAMPLES[0]
+    assert trained.decompress(trained.compress(record)) == record
+    assert trained.decompress_text(trained.compress_text("naïve text")) == "naïve text"
+    assert len(trained.compress(record)) < len(plain.compress(record))
+
+
+def test_blobs_from_another_dictionary_are_rejected():
+    blob = Codec(train_dictionary(SAMPLES), prefer_zstd=False).compress(SAMPLES[0])
+    with pytest.raises(ValueError):
+        Codec(b"some other dictionary", prefer_zstd=False).decompress(blob)
+
+
+def test_uncompressed_legacy_data_passes_through():
+    assert Codec().decompress(b'{"interaction_id": 1}') == b'{"interaction_id": 1}'
+
+
+def test_level_is_applied_to_zlib():
+    data = b"".join(SAMPLES)
+    stored = Codec(level=0, prefer_zstd=False).compress(data)
+    best = Codec(level=9, prefer_zstd=False).compress(data)
+    assert len(best) < len(data) < len(stored)
+
+
+@pytest.mark.skipif(compression.zstandard is None, reason="zstandard is not installed")
+def test_level_is_applied_to_zstd():
+    data = b"".join(SAMPLES)
+    fast = Codec(level=1).compress(data)
+    best = Codec(level=19).compress(data)
+    assert len(best) <= len(fast)
+    assert Codec(level=19).decompress(best) == data
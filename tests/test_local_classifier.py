@@ -0,0 +1,23 @@
+from agent.local_classifier import iter_examples
+from queueing.record import EmailRecord
+
+
+class ListStore:
+    def __init__(self, records):
+        self.records = records
+
+    def iter_records(self):
+        return iter(self.records)
+
+
+def test_examples_use_the_text_classified_at_runtime():
+    context = [{"interaction_id": 1, "created_at": 100, "subject": "Contract note", "content": "first"}]
+    email = EmailRecord(2, "a@x.com", subject="Contract note", content="second", context=context)
+    output = {
+        "interaction_id": 2,
+        "classified_by": "classifier_agent",
+        "body": {"subject": "Contract note", "body": "second", "user_type": "client", "classification": "cn"},
+        "thread": {"coalesced_interaction_ids": [1], "context": context}
+    }
+    examples = list(iter_examples(ListStore([output]), holdout_percent=0, holdout=False))
+    assert examples == [(("Contract note", email.content_with_context(), "client"), "cn")]
@@ -0,0 +1,89 @@
+import json
+import sqlite3
+
+from storage.compression import Codec
+from storage.output_store import OutputStore, migrate_directory
+
+
+def make_output(interaction_id, classification="dp", is_spam=False, user_type="client", apis=()):
+    return {
+        "interaction_id": interaction_id,
+        "body": {
+            "interaction_id": interaction_id,
+            "user_type": user_type,
+            "classification": classification,
+            "is_spam": is_spam,
+            "escalation": {"escalation_required": False, "escalation_reason": "na"},
+            "apis_called": [{"api_name": api_name} for api_name in apis],
+            "response_draft": f"Draft for {interaction_id}"
+        }
+    }
+
+
+def test_put_get_and_replace(tmp_path):
+    store = OutputStore(str(tmp_path / "outputs.db"), codec=Codec(prefer_zstd=False))
+    store.put(make_output(1))
+    store.put(make_output(1, classification="kyc"))
+    assert store.count() == 1
+    assert store.contains("1") and not store.contains(2)
+    assert store.get(1)["body"]["classification"] == "kyc"
+    assert store.get(2) is None
+    store.close()
+
+
+def test_migrate_directory_imports_files_and_can_be_rerun(tmp_path):
+    directory = tmp_path / "processed_output"
+    directory.mkdir()
+    for i in range(5):
+        (directory / f"{i}.json").write_text(json.dumps(make_output(i)))
+    # Older files may lack the id field; the file name is used instead
+    legacy = make_output(5)
+    del legacy["interaction_id"]
+    (directory / "5.json").write_text(json.dumps(legacy))
+    (directory / "broken.json").write_text("{not json")
+    (directory / "notes.txt").write_text("ignored")
+
+    store = OutputStore(str(tmp_path / "outputs.db"))
+    assert migrate_directory(store, str(directory), batch_size=2) == (6, 1)
+    assert migrate_directory(store, str(directory), batch_size=2) == (6, 1)
+    assert store.count() == 6
+    assert store.get(5)["body"]["response_draft"] == "Draft for 5"
+    assert sorted(str(output["interaction_id"]) for output in store.iter_records(batch_size=4)) == ["0", "1", "2", "3", "4", "5"]
+    store.close()
+
+
+def test_query_filters_and_paginates_newest_first(tmp_path):
+    store = OutputStore(str(tmp_path / "outputs.db"))
+    for i in range(7):
+        store.put(make_output(i, classification="dp" if i % 2 else "kyc", apis=["get_holdings"] if i < 3 else []),
+                  created_at=86400 * 365 * 50 + i)
+    store.put(make_output(7, classification="na", is_spam=True))
+
+    pages = []
+    items, cursor = store.query(classification="dp", limit=2)
+    pages.append(items)
+    while cursor is not None:
+        items, cursor = store.query(classification="dp", cursor=cursor, limit=2)
+        pages.append(items)
+    assert [[item["interaction_id"] for item in page] for page in pages] == [["5", "3"], ["1"]]
+
+    items, _ = store.query(api_name="get_holdings", is_spam=False)
+    assert [item["interaction_id"] for item in items] == ["2", "1", "0"]
+    assert store.query(is_spam=True)[0][0]["is_spam"] is True
+    assert store.query(date_to="1970-01-01")[0] == []
+    store.close()
+
+
+def test_store_from_before_the_indexes_is_reindexed(tmp_path):
+    path = str(tmp_path / "outputs.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE outputs (interaction_id TEXT PRIMARY KEY, created_at REAL NOT NULL, record TEXT NOT NULL)")
+    conn.execute("INSERT INTO outputs VALUES (?, ?, ?)", ("1", 0, json.dumps(make_output(1, apis=["get_ledger"]))))
+    conn.commit()
+    conn.close()
+
+    store = OutputStore(path)
+    items, _ = store.query(classification="dp", api_name="get_ledger")
+    assert [item["interaction_id"] for item in items] == ["1"]
+    assert items[0]["user_type"] == "client"
+    store.close()
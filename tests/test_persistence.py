@@ -0,0 +1,92 @@
+import threading
+
+from storage.persistence import GroupCommitWriter, atomic_write
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write(str(path), "old")
+    atomic_write(str(path), b"new")
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_submits_to_same_path_are_coalesced(tmp_path):
+    path = str(tmp_path / "queue.json")
+    writer = GroupCommitWriter(0.05)
+    try:
+        futures = [writer.submit(path, f"v{i}") for i in range(5)]
+        for future in futures:
+            future.result(timeout=2)
+    finally:
+        writer.close()
+    with open(path) as f:
+        assert f.read() == "v4"
+    stats = writer.get_stats()
+    assert stats["coalesced"] == 4
+    assert stats["files_written"] == 1
+    assert stats["pending"] == 0
+
+
+def test_barrier_waits_for_earlier_writes(tmp_path):
+    path = tmp_path / "processed.json"
+    release = threading.Event()
+
+    def payload():
+        release.wait(2)
+        return "done"
+
+    writer = GroupCommitWriter(0)
+    try:
+        writer.submit(str(path), payload)
+        barrier = writer.barrier()
+        assert not barrier.done()
+        release.set()
+        barrier.result(timeout=2)
+        assert path.read_text() == "done"
+    finally:
+        writer.close()
+
+
+def test_submit_after_close_writes_synchronously(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    writer = GroupCommitWriter(0.05)
+    writer.submit(str(path), "before close")
+    writer.close()
+
+    future = writer.submit(str(path), lambda: "after close")
+    assert future.done() and future.result() is True
+    assert path.read_text() == "after close"
+    assert writer.barrier().done()
+
+
+def test_failed_write_keeps_the_old_file_and_reaches_the_caller(tmp_path):
+    path = tmp_path / "queue.json"
+    path.write_text("old")
+
+    def payload():
+        raise ValueError("not serializable")
+
+    writer = GroupCommitWriter(0)
+    try:
+        future = writer.submit(str(path), payload)
+        assert isinstance(future.exception(timeout=2), ValueError)
+    finally:
+        writer.close()
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["queue.json"]
+    assert writer.get_stats()["errors"] == 1
+
+
+def test_writes_to_several_files_share_one_group_commit(tmp_path):
+    writer = GroupCommitWriter(0.05)
+    try:
+        futures = [writer.submit(str(tmp_path / name), name) for name in ("queue.json", "processed.json")]
+        for future in futures:
+            future.result(timeout=2)
+    finally:
+        writer.close()
+    stats = writer.get_stats()
+    assert stats["flushes"] == 1
+    assert stats["files_written"] == 2
+    assert (tmp_path / "processed.json").read_text() == "processed.json"
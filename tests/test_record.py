@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+from queueing.record import EmailRecord, parse_sender
+
+
+def test_sender_is_parsed_from_talisma_from_field():
+    assert parse_sender("Client Name\rclient@x.com ") == "client@x.com"
+    assert parse_sender(" client@x.com") == "client@x.com"
+    assert EmailRecord(1, "Client Name\rclient@x.com").sender == "client@x.com"
+
+
+def test_to_dict_from_dict_round_trip():
+    record = EmailRecord(
+        1, "Name\ra@x.com", "query@x.com", subject="Subject", content="Content", user_type="client",
+        created_at=100, attempts=2, last_error="boom", thread_key="a@x.com|subject", coalesced_ids=[0],
+        context=[{"interaction_id": 0, "subject": "Earlier", "content": "Before"}]
+    )
+    data = record.to_dict(include_body=True)
+    restored = EmailRecord.from_dict(data)
+    assert restored.to_dict(include_body=True) == data
+    assert restored.context == record.context
+    assert set(record.to_dict()) == set(EmailRecord.METADATA_FIELDS)
+
+
+def test_legacy_queue_entry_gets_defaults():
+    record = EmailRecord.from_dict({"interaction_id": 5, "from_email": "a@x.com", "subject": "S", "content": "C"})
+    assert (record.attempts, record.next_attempt_at, record.coalesced_ids, record.user_type) == (0, 0, [], "")
+    assert record.enqueued_at is not None
+
+
+def test_api_model_round_trip():
+    email_data = SimpleNamespace(interaction_id=9, from_email="a@x.com", to_email="q@x.com",
+                                 subject="S", content="C", user_type="ba")
+    record = EmailRecord.from_api(email_data)
+    assert record.to_api() == vars(email_data)
+
+
+def test_records_have_no_instance_dict():
+    record = EmailRecord(1, "a@x.com")
+    with pytest.raises(AttributeError):
+        record.unexpected = True
+
+
+def test_copy_shares_the_body_but_not_the_fields():
+    record = EmailRecord(1, "a@x.com", subject="S", content="C")
+    clone = record.copy()
+    clone.attempts = 3
+    assert record.attempts == 0
+    assert clone.content == "C"
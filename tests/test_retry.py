@@ -0,0 +1,47 @@
+import time
+
+from queueing.record import EmailRecord
+from queueing.scheduler import DeadlineScheduler, PriorityPolicy
+
+
+def test_retry_delay_doubles_up_to_the_cap():
+    record = EmailRecord(1, "a@x.com")
+    delays = [record.record_failure("boom", 1000, max_attempts=10, base_delay=60, max_delay=600) for _ in range(6)]
+    assert delays == [60, 120, 240, 480, 600, 600]
+    assert record.attempts == 6
+    assert record.last_error == "boom"
+    assert record.next_attempt_at == 1600
+
+
+def test_email_is_dead_lettered_after_max_attempts():
+    record = EmailRecord(1, "a@x.com")
+    assert record.record_failure(None, 1000, max_attempts=2, base_delay=60, max_delay=600) == 60
+    assert record.record_failure(None, 2000, max_attempts=2, base_delay=60, max_delay=600) is None
+    assert record.dead_lettered_at == 2000
+    assert record.next_attempt_at == 0
+    assert record.last_error == "Processing failed"
+
+
+def test_requeued_dead_letter_starts_a_fresh_budget_and_survives_a_restart():
+    record = EmailRecord(1, "a@x.com")
+    record.record_failure("boom", 1000, max_attempts=1, base_delay=60, max_delay=600)
+    restored = EmailRecord.from_dict(record.to_dict())
+    assert (restored.attempts, restored.dead_lettered_at, restored.last_error) == (1, 1000, "boom")
+
+    restored.reset_retries()
+    assert (restored.attempts, restored.next_attempt_at, restored.dead_lettered_at) == (0, 0, None)
+    # Last error is kept for the dead-letter history
+    assert restored.last_error == "boom"
+
+
+def test_backing_off_email_is_not_handed_out_until_due():
+    scheduler = DeadlineScheduler(PriorityPolicy({"default": 480}))
+    record = EmailRecord(1, "a@x.com", created_at=1000)
+    scheduler.push(record)
+    assert scheduler.pop_due(1) == [record]
+
+    now = time.time()
+    delay = record.record_failure("boom", now, max_attempts=3, base_delay=60, max_delay=600)
+    scheduler.push(record)
+    assert scheduler.pop_due(1, now=now + delay - 1) == []
+    assert scheduler.pop_due(1, now=now + delay) == [record]
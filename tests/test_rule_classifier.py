@@ -0,0 +1,21 @@
+from agent.rule_classifier import DEFAULT_RULES, RuleClassifier
+
+
+def classify(sender, subject, content):
+    category = RuleClassifier(DEFAULT_RULES).classify(sender, subject, content)
+    return category["rule"] if category else None
+
+
+def test_client_mentioning_absence_is_not_auto_reply():
+    content = "I am out of the office until Monday. Please share the contract note for 12th June."
+    assert classify("client@x.com", "Contract note required", content) is None
+
+
+def test_auto_reply_by_subject():
+    content = "I am currently out of the office with limited access to email."
+    assert classify("client@x.com", "Automatic reply: Contract note required", content) == "auto_reply"
+
+
+def test_selected_in_subject_is_not_spam():
+    assert classify("client@x.com", "You've been selected for KYC re-verification?", "Is this mail genuine?") is None
+    assert classify("promo@x.com", "Claim your prize today", "") == "prize_spam"
@@ -0,0 +1,59 @@
+from queueing.record import EmailRecord
+from queueing.scheduler import DeadlineScheduler, FairShareScheduler, PriorityPolicy
+
+
+def make_scheduler(**kwargs):
+    return FairShareScheduler(PriorityPolicy({"default": 480}), **kwargs)
+
+
+def push(scheduler, sender, count, start=0):
+    for i in range(start, start + count):
+        scheduler.push(EmailRecord(f"{sender}-{i}", f"{sender}@x.com", subject="s", content="c", created_at=1000 + i))
+
+
+def test_lone_sender_is_not_capped():
+    scheduler = make_scheduler(max_in_flight=2)
+    push(scheduler, "a", 6)
+    assert len(scheduler.pop_due(5)) == 5
+    assert len(scheduler.pop_due(5)) == 1
+
+
+def test_cap_applies_while_another_sender_waits():
+    scheduler = make_scheduler(max_in_flight=2)
+    push(scheduler, "a", 6)
+    assert len(scheduler.pop_due(2)) == 2
+    push(scheduler, "b", 3)
+    # a already has two emails in flight, so b gets the free slots
+    assert [record.sender for record in scheduler.pop_due(2)] == ["b@x.com", "b@x.com"]
+    # Both senders are at the cap now; neither holds the other back
+    assert len(scheduler.pop_due(2)) == 2
+
+
+def test_waiting_count_matches_senders_below_cap():
+    scheduler = make_scheduler(max_in_flight=1)
+    push(scheduler, "a", 3)
+    push(scheduler, "b", 2)
+    push(scheduler, "c", 1)
+
+    def recount():
+        return sum(1 for state in scheduler.senders.values()
+                   if state.active and state.in_flight < scheduler.max_in_flight)
+
+    leased = scheduler.pop_due(3)
+    assert scheduler.waiting == recount()
+    for record in leased:
+        scheduler.discard(record.interaction_id)
+        assert scheduler.waiting == recount()
+    scheduler.pop_due(10)
+    assert scheduler.waiting == recount()
+
+
+def test_user_type_known_later_moves_deadline_up():
+    scheduler = DeadlineScheduler(PriorityPolicy({"client": 60, "default": 480}))
+    early = EmailRecord("default-1", "a@x.com", created_at=1000)
+    late = EmailRecord("client-1", "b@x.com", created_at=2000)
+    scheduler.push(early)
+    scheduler.push(late)
+    late.user_type = "client"
+    scheduler.push(late)
+    assert [record.interaction_id for record in scheduler.pop_due(2)] == ["client-1", "default-1"]
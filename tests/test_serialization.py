@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from storage import serialization
+
+RECORD = {
+    "interaction_id": 1,
+    "body": {"subject": "Contract note – not received", "is_spam": False, "score": 0.5, "apis_called": []},
+    "checkpoints": {7: {"user_lookup": {"user_type": "client"}}}
+}
+
+
+def test_output_is_compact_utf8_json():
+    data = serialization.dumps(RECORD)
+    assert isinstance(data, bytes)
+    assert b": " not in data and b", " not in data
+    # Non-ASCII text is stored as UTF-8, not \u escapes
+    assert "–".encode("utf-8") in data
+    assert serialization.dumps_str(RECORD) == data.decode("utf-8")
+
+
+def test_round_trip_turns_int_keys_into_strings():
+    restored = serialization.loads(serialization.dumps(RECORD))
+    assert restored["body"] == RECORD["body"]
+    assert restored["checkpoints"] == {"7": {"user_lookup": {"user_type": "client"}}}
+    assert serialization.loads(serialization.dumps_str(RECORD)) == restored
+
+
+def test_load_file_reads_files_written_by_json_module(tmp_path):
+    path = tmp_path / "email_queue.json"
+    path.write_text(json.dumps([RECORD], indent=2))
+    assert serialization.load_file(str(path))[0]["body"] == RECORD["body"]
+
+
+@pytest.mark.skipif(serialization.orjson is None, reason="orjson is not installed")
+def test_backends_produce_the_same_document(monkeypatch):
+    with_orjson = serialization.dumps(RECORD)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(serialization.dumps(RECORD)) == json.loads(with_orjson)
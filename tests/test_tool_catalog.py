@@ -0,0 +1,55 @@
+from agent.tool_catalog import CATALOG, Api, ToolSpec, size_report
+
+SPEC = ToolSpec("Demat queries.", [
+    Api("get_holdings", "Holdings of a client.", client_code="str", segment="str?"),
+    Api("get_charges", "Charges for a quantity.", quantity="int"),
+    Api("faq", "General information.")
+])
+
+
+def test_signature_marks_types_and_optional_arguments():
+    assert SPEC.apis[0].signature() == "client_code, segment?"
+    assert SPEC.apis[1].signature() == "quantity:int"
+    assert SPEC.apis[2].signature() == ""
+
+
+def test_description_and_docstring_list_every_api():
+    description = SPEC.description()
+    assert description.splitlines()[1:] == [
+        "- get_holdings(client_code, segment?): Holdings of a client.",
+        "- get_charges(quantity:int): Charges for a quantity.",
+        "- faq(): General information."
+    ]
+    docstring = SPEC.docstring()
+    assert all(f"    {name}\n" in docstring for name in SPEC.api_names())
+    assert "api_args: quantity:int" in docstring
+
+
+def test_schema_limits_api_name_to_the_catalogue():
+    schema = SPEC.json_schema()
+    assert schema["properties"]["api_name"]["enum"] == ["get_holdings", "get_charges", "faq"]
+    assert schema["required"] == ["api_name"]
+
+
+def test_tools_with_their_own_arguments():
+    spec = ToolSpec("Closure validation.", args={"client_code": "str", "limit": "int?"})
+    assert spec.description() == "Closure validation."
+    assert spec.json_schema() == {
+        "type": "object",
+        "properties": {"client_code": {"type": "string"}, "limit": {"type": "integer"}},
+        "required": ["client_code"]
+    }
+    assert "limit (int, optional)" in spec.docstring()
+
+
+def test_catalog_has_unique_api_names_per_tool():
+    for name, spec in CATALOG.items():
+        assert len(spec.api_names()) == len(set(spec.api_names())), name
+
+
+def test_size_report_compares_with_older_descriptions():
+    name = next(iter(CATALOG))
+    rows = {row["tool"]: row for row in size_report({name: "x" * 100000})}
+    assert rows.keys() == CATALOG.keys()
+    assert rows[name]["old_description_chars"] == 100000
+    assert 0 < rows[name]["reduction"] < 1